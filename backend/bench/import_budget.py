@@ -0,0 +1,75 @@
+"""
+Lambda cold start import 예산 점검 — `python -X importtime` 출력 파싱.
+
+    python -m backend.bench.import_budget                  # 기본 예산 900ms, 3회 중 최솟값 기준
+    python -m backend.bench.import_budget --budget-ms 700 --top 15
+
+검사 항목 (위반 시 종료 코드 1):
+  1. `import backend.main` 누적 import 시간 ≤ 예산
+  2. 지연 로드 대상 패키지(LAZY_MODULES)가 import 시점에 로드되지 않을 것
+     — 첫 사용 시 로드하도록 만든 모듈이 실수로 최상위 import로 되돌아가는 회귀 방지
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 첫 사용 시점에 로드되어야 하는 무거운 패키지 (ai_service / news_service / sentiment_service / market_service)
+LAZY_MODULES = ("openai", "tavily", "vaderSentiment", "yfinance", "tiktoken")
+
+_line_re = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(target: str = "backend.main") -> list[tuple[str, int, int]]:
+    """(모듈명, self μs, 누적 μs, 깊이) 목록. 서브프로세스라 이미 로드된 모듈 영향 없음."""
+    env = {**os.environ, "AWS_LAMBDA_FUNCTION_NAME": os.getenv("AWS_LAMBDA_FUNCTION_NAME", "import-budget")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _line_re.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="backend.main import 시간 예산 점검")
+    parser.add_argument("--budget-ms", type=float, default=900.0)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 (최솟값 사용 — 디스크 캐시 노이즈 제거)")
+    parser.add_argument("--top", type=int, default=10, help="누적 시간 상위 모듈 출력 수")
+    parser.add_argument("--target", default="backend.main")
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.target) for _ in range(args.repeat)]
+    best = min(runs, key=lambda rows: next((c for n, _, c, _ in rows if n == args.target), float("inf")))
+    total_ms = next(c for n, _, c, _ in best if n == args.target) / 1000
+
+    print(f"[IMPORT] {args.target}: {total_ms:.0f}ms (예산 {args.budget_ms:.0f}ms, {args.repeat}회 중 최솟값)")
+    print(f"  누적 상위 {args.top}개 (1단계 하위 모듈):")
+    for name, _, cumulative, depth in sorted(best, key=lambda r: -r[2])[:args.top]:
+        print(f"    {cumulative / 1000:8.1f}ms  {'  ' * depth}{name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import 시간 {total_ms:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+    loaded = {name.split(".")[0] for name, _, _, _ in best}
+    eager = [m for m in LAZY_MODULES if m in loaded]
+    if eager:
+        failures.append(f"지연 로드 대상이 import 시점에 로드됨: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if not failures:
+        print("[OK] import 예산 통과")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+오프라인 성능 벤치마크 — 네트워크 없이 재현 가능한 측정.
+
+    python -m backend.bench.run_bench                       # 기본: 10/100/1000 심볼, 3회 반복
+    python -m backend.bench.run_bench --sizes 10 100 --repeat 5 --llm-latency 1.0
+    python -m backend.bench.run_bench --json bench.json     # 결과 JSON 저장 (회귀 비교용)
+
+측정 항목 (watchlist 크기별):
+  - e2e      : run_sync_engine_once() 전체 + 단계별(tracing step span) 소요 시간
+  - sharded  : run_sync_engine_sharded() — --shards 개 워커 프로세스 (워커 프로세스 기동 시간 포함)
+  - snapshot : get_market_snapshot (지수 + 후보 + watchlist)
+  - news     : fetch_news_batch (watchlist 심볼당 1건)
+  - trend    : get_history_panel + compute_trend_stats
+  - summary  : generate_ai_summaries (news 단계 컨텍스트)
+  - compact  : summary와 같은 컨텍스트를 압축(compaction_service) 후 요약 — 프롬프트 토큰·지연을 summary와 비교
+               (LLM 스텁 지연 = --llm-latency + 입력 1k 토큰당 --llm-per-1k-tokens)
+p50/p95 지연, 처리량(심볼/초, p50 기준), tracemalloc peak 메모리(별도 1회 실행)를 보고합니다.
+"""
+import os
+import sys
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+import tracemalloc
+import time
+
+# 서비스 모듈은 import 시점에 환경 변수를 읽으므로 import 전에 벤치마크 환경 고정
+# (sharded 단계의 spawn 워커는 이 모듈을 다시 import — 부모가 고정한 환경을 그대로 물려받으므로 건너뜀)
+_BENCH_TMP = os.environ.get("SYNC_BENCH_TMP")
+if not _BENCH_TMP:
+    _BENCH_TMP = tempfile.mkdtemp(prefix="sync-bench-")
+    os.environ.update({
+        "SYNC_BENCH_TMP": _BENCH_TMP,
+        "SYNC_CACHE_DIR": _BENCH_TMP,
+        "NEWS_CACHE_BACKEND": "memory",
+        "SUMMARY_CACHE_BACKEND": "memory",
+        "SUMMARY_CACHE_MODE": "off",
+        "HISTORY_CACHE_ENABLED": "0",
+        "SUPABASE_SERVICE_ROLE_KEY": "bench",
+        "NAVER_CLIENT_ID": "bench",
+        "NAVER_CLIENT_SECRET": "bench",
+    })
+
+import numpy as np
+
+from backend.bench.stubs import (
+    LatencyProfile, SUPABASE_STUB_URL, installed, install_in_worker, reset_state, synthetic_watchlist,
+)
+
+os.environ["SUPABASE_URL"] = SUPABASE_STUB_URL
+
+from backend import main as engine
+from backend.config.tickers import US_CANDIDATES, KR_CANDIDATES
+from backend.services import tracing
+from backend.services.market_service import get_market_snapshot, get_history_panel, compute_trend_stats
+from backend.services.news_service import fetch_news_batch
+from backend.services.ai_service import generate_ai_summaries, context_token_budget
+from backend.services.compaction_service import compact_context
+from backend.services.token_counter import count_tokens
+
+
+def _percentiles(samples: list[float]) -> dict:
+    arr = np.asarray(samples)
+    return {"p50": round(float(np.percentile(arr, 50)), 4), "p95": round(float(np.percentile(arr, 95)), 4)}
+
+
+def _measure(func, repeat: int, size: int, run_no: list) -> dict:
+    """func를 repeat회 cold 상태로 실행해 지연 분포 측정 + tracemalloc 1회로 peak 메모리 측정."""
+    durations = []
+    for _ in range(repeat):
+        run_no[0] += 1
+        reset_state(os.path.join(_BENCH_TMP, f"run{run_no[0]}"))
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+
+    run_no[0] += 1
+    reset_state(os.path.join(_BENCH_TMP, f"run{run_no[0]}"))
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = _percentiles(durations)
+    stats["throughput_sym_per_s"] = round(size / stats["p50"], 1) if stats["p50"] > 0 else None
+    stats["peak_mb"] = round(peak / 2**20, 1)
+    return stats
+
+
+def bench_size(size: int, repeat: int, latency: LatencyProfile, real_rate_limits: bool, stages: list[str],
+               shards: int = 4) -> dict:
+    watchlist = synthetic_watchlist(size, US_CANDIDATES + KR_CANDIDATES)
+    symbols = list(watchlist)
+    results: dict[str, dict] = {}
+    run_no = [0]
+
+    with installed(latency, watchlist, real_rate_limits=real_rate_limits):
+        def with_steps(name: str, run) -> None:
+            step_samples: dict[str, list[float]] = {}
+
+            def measured():
+                run()
+                for step, seconds in tracing.build_report()["steps"].items():
+                    step_samples.setdefault(step, []).append(seconds)
+
+            results[name] = _measure(measured, repeat, size, run_no)
+            results[name]["steps_p50"] = {k: _percentiles(v)["p50"] for k, v in step_samples.items()}
+
+        if "e2e" in stages:
+            with_steps("e2e", engine.run_sync_engine_once)
+
+        if "sharded" in stages:
+            with_steps("sharded", lambda: engine.run_sync_engine_sharded(
+                shard_count=shards, dispatch="process", initializer=install_in_worker,
+                initargs=(latency, watchlist, real_rate_limits, logging.getLogger().level),
+            ))
+
+        if "snapshot" in stages:
+            snapshot_symbols = engine._snapshot_symbols() + symbols
+            results["snapshot"] = _measure(lambda: get_market_snapshot(snapshot_symbols), repeat, size, run_no)
+
+        jobs = [{"lang": "foreign", "query": watchlist[s]["name"], "symbol": s} for s in symbols]
+        if "news" in stages:
+            results["news"] = _measure(lambda: fetch_news_batch(jobs), repeat, size, run_no)
+
+        if "trend" in stages:
+            results["trend"] = _measure(lambda: compute_trend_stats(get_history_panel(symbols)), repeat, size, run_no)
+
+        if "summary" in stages:
+            contexts = "\n".join(ctx for ctx, _ in fetch_news_batch(jobs))
+            summary_jobs = {
+                cat: {"stock_name": cat, "context": contexts, "article_urls": None}
+                for cat in ("macro", "portfolio", "watchlist")
+            }
+            results["summary"] = _measure(lambda: generate_ai_summaries(summary_jobs), repeat, size, run_no)
+
+        if "compact" in stages:
+            contexts = "\n".join(ctx for ctx, _ in fetch_news_batch(jobs))
+            started = time.perf_counter()
+            compacted = {cat: compact_context(contexts, context_token_budget(cat), symbols, label=cat)
+                         for cat in ("macro", "portfolio", "watchlist")}
+            compact_seconds = time.perf_counter() - started
+            raw_jobs = {cat: {"stock_name": cat, "context": contexts, "article_urls": None} for cat in compacted}
+            compact_jobs = {cat: {"stock_name": cat, "context": ctx, "article_urls": None} for cat, ctx in compacted.items()}
+            raw = _measure(lambda: generate_ai_summaries(raw_jobs), repeat, size, run_no)
+            results["compact"] = _measure(lambda: generate_ai_summaries(compact_jobs), repeat, size, run_no)
+            results["compact"].update({
+                "raw_p50": raw["p50"],
+                "compact_seconds": round(compact_seconds, 3),
+                "prompt_tokens": {"raw": count_tokens(contexts) * len(compacted),
+                                  "compacted": sum(count_tokens(ctx) for ctx in compacted.values())},
+            })
+    return results
+
+
+def _print_table(report: dict) -> None:
+    print(f"\n{'size':>6} {'stage':<9} {'p50(s)':>9} {'p95(s)':>9} {'sym/s':>10} {'peak MB':>8}")
+    for size, stages in report["results"].items():
+        for stage, s in stages.items():
+            print(f"{size:>6} {stage:<9} {s['p50']:>9.3f} {s['p95']:>9.3f} "
+                  f"{(s['throughput_sym_per_s'] or 0):>10.1f} {s['peak_mb']:>8.1f}")
+            if "steps_p50" in s:
+                print(f"{'':>16} steps p50: {s['steps_p50']}")
+            if "prompt_tokens" in s:
+                print(f"{'':>16} 압축 전 p50: {s['raw_p50']:.3f}s, 압축 {s['compact_seconds']:.3f}s, "
+                      f"컨텍스트 토큰: {s['prompt_tokens']}")
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="stock-news-sync 오프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", default=["e2e", "snapshot", "news", "trend", "summary"])
+    parser.add_argument("--http-latency", type=float, default=0.05, help="뉴스·Supabase HTTP 호출당 지연(초)")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="LLM 호출당 지연(초)")
+    parser.add_argument("--llm-per-1k-tokens", type=float, default=0.1, help="LLM 입력 1k 토큰당 추가 지연(초, prefill)")
+    parser.add_argument("--yf-latency", type=float, default=0.3, help="yf.download 호출당 지연(초)")
+    parser.add_argument("--shards", type=int, default=4, help="sharded 단계 워커 프로세스 수")
+    parser.add_argument("--real-rate-limits", action="store_true", help="config/limits.py 토큰 버킷 그대로 적용")
+    parser.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+    parser.add_argument("--verbose", action="store_true", help="서비스 INFO 로그 출력")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.ERROR)
+    latency = LatencyProfile(http=args.http_latency, llm=args.llm_latency, yfinance=args.yf_latency,
+                             llm_per_1k_tokens=args.llm_per_1k_tokens)
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k not in ("json_path", "verbose")},
+        "results": {},
+    }
+    try:
+        for size in args.sizes:
+            print(f"[BENCH] watchlist {size} 심볼 측정 중...", file=sys.stderr)
+            report["results"][size] = bench_size(size, args.repeat, latency, args.real_rate_limits, args.stages,
+                                                 shards=args.shards)
+    finally:
+        shutil.rmtree(_BENCH_TMP, ignore_errors=True)
+
+    _print_table(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
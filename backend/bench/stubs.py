@@ -0,0 +1,262 @@
+"""
+오프라인 벤치마크용 외부 의존성 스텁.
+
+yfinance / Tavily / Naver / Yahoo RSS / Google RSS / GDELT / Groq·Gemini / Supabase 응답을
+fixtures/ 의 응답 형식 샘플로 재생하고, 호출마다 설정한 지연(latency)을 주입합니다.
+네트워크 없이 실행되며 실제 서비스 코드(파싱·재랭킹·캐시·병합)는 그대로 통과합니다.
+"""
+import os
+import re
+import gzip
+import json
+import time
+import random
+import hashlib
+import logging
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from email.utils import format_datetime
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+import numpy as np
+import pandas as pd
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SUPABASE_STUB_URL = "https://stub.supabase.local"
+
+
+@dataclass
+class LatencyProfile:
+    """호출 종류별 주입 지연(초). jitter는 ±비율 (0.2 → ±20%). llm_per_1k_tokens는 LLM 입력 토큰 비례 지연."""
+    http: float = 0.05
+    llm: float = 0.5
+    yfinance: float = 0.3
+    jitter: float = 0.2
+    llm_per_1k_tokens: float = 0.0
+
+    def sleep(self, kind: str) -> None:
+        base = getattr(self, kind)
+        if base > 0:
+            time.sleep(base * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+_templates: dict[str, str] = {}
+
+
+def render(name: str, query: str) -> str:
+    """fixture 템플릿의 {query}/{slug}/{pubdate} 치환 — 쿼리마다 다른 기사로 보이도록 (중복 제거 왜곡 방지)."""
+    if name not in _templates:
+        with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+            _templates[name] = f.read()
+    slug = hashlib.md5(query.encode("utf-8")).hexdigest()[:10]
+    return (_templates[name]
+            .replace("{query}", query)
+            .replace("{slug}", slug)
+            .replace("{pubdate}", format_datetime(datetime.now(timezone.utc))))
+
+
+class StubResponse:
+    def __init__(self, body: bytes | str, status_code: int = 200):
+        self.content = body.encode("utf-8") if isinstance(body, str) else body
+        self.status_code = status_code
+        self.headers = {"Content-Length": str(len(self.content))}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"stub HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 8192):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StubSession:
+    """http_client.get_session() 대체 — 호스트별 fixture 응답."""
+
+    def __init__(self, latency: LatencyProfile, watchlist: dict[str, dict]):
+        self.latency = latency
+        self.watchlist = watchlist
+        self.bytes_written = 0
+        self.rows_inserted: dict[str, int] = {}
+        self.feed_digests: dict | None = None    # feed 행 section_digests (save_final_feed delta 비교용)
+
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        self.latency.sleep("http")
+        parsed = urlparse(url)
+        qs = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        host = parsed.hostname
+        if host == "openapi.naver.com":
+            return StubResponse(render("naver_news.json", (params or {}).get("query", "")))
+        if host == "feeds.finance.yahoo.com":
+            return StubResponse(render("yahoo_rss.xml", qs.get("s", "")))
+        if host == "news.google.com":
+            return StubResponse(render("google_rss.xml", qs.get("q", "")))
+        if host == "api.gdeltproject.org":
+            return StubResponse(render("gdelt_artlist.json", qs.get("query", "")))
+        if host == urlparse(SUPABASE_STUB_URL).hostname and parsed.path.endswith("/watchlist"):
+            # 유저별 등록 행 — 심볼당 watchers개 (get_all_watchlist_symbols가 등록 수로 집계)
+            rows = [{"symbol": s, "name": v["name"], "sector": v.get("sector")}
+                    for s, v in self.watchlist.items() for _ in range(v.get("watchers", 1))]
+            return StubResponse(json.dumps(rows))
+        if host == urlparse(SUPABASE_STUB_URL).hostname and parsed.path.endswith("/news_scheduler_state"):
+            return StubResponse("[]")   # 스케줄러 상태 없음 — 파일·메모리 상태만 사용
+        if host == urlparse(SUPABASE_STUB_URL).hostname and parsed.path.endswith("/feed"):
+            return StubResponse(json.dumps([{"section_digests": self.feed_digests}] if self.feed_digests else []))
+        return StubResponse("", status_code=404)
+
+    def request(self, method, url, data=None, json=None, headers=None, timeout=None, **kwargs):
+        if method == "GET":
+            return self.get(url, params=kwargs.get("params"), headers=headers, timeout=timeout)
+        self.latency.sleep("http")
+        body = data if data is not None else __import__("json").dumps(json, ensure_ascii=False, default=str)
+        self.bytes_written += len(body if isinstance(body, bytes) else body.encode("utf-8"))
+        table = urlparse(url).path.rsplit("/", 1)[-1]
+        if table == "feed":
+            raw = gzip.decompress(body) if (headers or {}).get("Content-Encoding") == "gzip" else body
+            payload = __import__("json").loads(raw)
+            self.feed_digests = payload.get("section_digests", self.feed_digests)
+        if method == "PATCH":
+            return StubResponse('[{"id": 1}]')
+        self.rows_inserted[table] = self.rows_inserted.get(table, 0) + (
+            len(__import__("json").loads(body)) if table != "feed" else 0)
+        return StubResponse("", status_code=201)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+class StubTavily:
+    def __init__(self, latency: LatencyProfile):
+        self.latency = latency
+
+    def search(self, query: str, **kwargs):
+        self.latency.sleep("http")
+        return json.loads(render("tavily_search.json", query.replace(" 주가 전망 및 최신 뉴스", "")))
+
+
+class StubLLMClient:
+    """OpenAI 호환 chat.completions.create 스텁 (Groq/Gemini 공통)."""
+
+    def __init__(self, latency: LatencyProfile):
+        self.latency = latency
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, max_tokens=None, temperature=None, **kwargs):
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        self.latency.sleep("llm")
+        if self.latency.llm_per_1k_tokens > 0:
+            time.sleep(self.latency.llm_per_1k_tokens * prompt_chars / 3 / 1000)
+        content = render("llm_summary.json", model)
+        # 종목별 배치 프롬프트 → {종목 ID: 요약} 형식으로 응답
+        symbols = re.findall(r"^\s*\[종목 ID: ([^\]]+)\]", messages[-1]["content"], flags=re.MULTILINE)
+        if symbols:
+            summary = json.loads(content)
+            content = json.dumps({symbol: summary for symbol in symbols}, ensure_ascii=False)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(finish_reason="stop", message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(total_tokens=prompt_chars // 3 + len(content) // 3),
+        )
+
+
+def stub_download(latency: LatencyProfile):
+    """yf.download 대체 — 심볼별 고정 시드 랜덤워크 OHLCV (group_by="column" 형식)."""
+    def download(tickers, period=None, start=None, interval="1d", **kwargs):
+        latency.sleep("yfinance")
+        symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+        days = int(str(period).rstrip("d")) if period else 60
+        end = pd.Timestamp.now().normalize()
+        index = pd.bdate_range(end=end, periods=days)
+        if start is not None:
+            index = index[index >= pd.Timestamp(start)]
+        frames = {}
+        for symbol in symbols:
+            rng = np.random.default_rng(int(hashlib.md5(symbol.encode()).hexdigest()[:8], 16))
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index))))
+            frames[symbol] = pd.DataFrame({
+                "Open": close * 0.995, "High": close * 1.01, "Low": close * 0.99,
+                "Close": close, "Adj Close": close,
+                "Volume": rng.integers(1e5, 1e7, len(index)).astype(float),
+            }, index=index)
+        panel = pd.concat(frames, axis=1)          # (symbol, field)
+        return panel.swaplevel(axis=1).sort_index(axis=1, level=0)   # (field, symbol)
+    return download
+
+
+def synthetic_watchlist(size: int, seed_symbols: list[str]) -> dict[str, dict]:
+    """seed_symbols(실제 후보 종목) 우선 + 가상 심볼로 size개 채운 watchlist. 등록 유저 수는 앞쪽 심볼에 몰린 분포."""
+    watchlist = {s: {"name": s, "sector": "기타"} for s in seed_symbols[:size]}
+    i = 0
+    while len(watchlist) < size:
+        watchlist[f"BENCH{i:04d}"] = {"name": f"Bench Corp {i}", "sector": "기타"}
+        i += 1
+    for rank, info in enumerate(watchlist.values()):
+        info["watchers"] = max(1, 50 // (rank + 1))
+    return watchlist
+
+
+@contextmanager
+def installed(latency: LatencyProfile, watchlist: dict[str, dict], real_rate_limits: bool = False):
+    """스텁 설치 컨텍스트. real_rate_limits=False면 토큰 버킷을 사실상 해제 (스텁 지연만 측정)."""
+    from backend.services import http_client, news_service, market_service, ai_service, rate_limiter
+    from backend.config.limits import PROVIDER_RATE_LIMITS
+
+    llm = StubLLMClient(latency)
+    session = StubSession(latency, watchlist)
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(http_client, "_session", session))
+        tavily = StubTavily(latency)
+        yfinance = SimpleNamespace(download=stub_download(latency))
+        stack.enter_context(mock.patch.object(news_service, "_get_tavily", lambda: tavily))
+        stack.enter_context(mock.patch.object(market_service, "_yf", lambda: yfinance))
+        stack.enter_context(mock.patch.object(
+            ai_service, "_get_client_and_model", lambda model: (llm, model.split("/", 1)[1])
+        ))
+        if not real_rate_limits:
+            for provider in PROVIDER_RATE_LIMITS:
+                rate_limiter.configure(provider, rate=1e6, burst=1e6)
+        try:
+            yield session
+        finally:
+            if not real_rate_limits:
+                for provider, conf in PROVIDER_RATE_LIMITS.items():
+                    rate_limiter.configure(provider, **conf)
+
+
+_worker_stack = ExitStack()
+
+
+def install_in_worker(latency: LatencyProfile, watchlist: dict[str, dict], real_rate_limits: bool = False,
+                      log_level: int = logging.ERROR) -> None:
+    """샤드 워커 프로세스 initializer — 프로세스 수명 동안 스텁 유지 (spawn 워커는 부모의 패치·로그 레벨을 물려받지 않음)."""
+    logging.getLogger().setLevel(log_level)
+    _worker_stack.enter_context(installed(latency, watchlist, real_rate_limits=real_rate_limits))
+
+
+def reset_state(cache_dir: str) -> None:
+    """warm 상태(캐시·인덱스·쿼터 이력) 초기화 — 반복 측정을 cold run으로 맞춤. cache_dir는 매번 새 디렉터리."""
+    from backend.services import cache_service, dedup_service, rerank_service, sentiment_service, ai_service, scheduler_service
+    os.environ["SYNC_CACHE_DIR"] = cache_dir
+    cache_service._news_cache = None
+    cache_service._summary_cache = None
+    dedup_service._recent_index = None
+    rerank_service._index = None
+    scheduler_service._scheduler = None
+    rerank_service.tokenize.cache_clear()
+    with sentiment_service._cache_lock:
+        sentiment_service._cache.clear()
+    with ai_service._quota_lock:
+        ai_service._quota_exceeded_models.clear()
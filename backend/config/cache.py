@@ -0,0 +1,77 @@
+# =============================================================================
+# 로컬 캐시 설정
+# 캐시 위치·보존 기간 조정은 이 파일(또는 환경변수)만 수정하면 됩니다.
+#
+# 캐시 디렉터리 우선순위:
+#   1) SYNC_CACHE_DIR 환경변수
+#   2) AWS Lambda → /tmp/stock-news-sync (warm start 간 유지, cold start 시 초기화)
+#   3) 로컬 실행 → backend/.cache
+# =============================================================================
+import os
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_cache_dir() -> str:
+    """현재 실행 환경에 맞는 캐시 디렉터리 경로를 반환합니다 (생성은 호출자 책임)."""
+    override = os.getenv("SYNC_CACHE_DIR")
+    if override:
+        return override
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        return "/tmp/stock-news-sync"
+    return os.path.join(_BACKEND_DIR, ".cache")
+
+
+# OHLCV 히스토리 캐시 (services/history_store.py)
+HISTORY_CACHE_ENABLED: bool = os.getenv("HISTORY_CACHE_ENABLED", "1") != "0"
+HISTORY_CACHE_REFRESH_SECONDS: int = 15 * 60      # 이 시간 내 갱신된 종목은 네트워크 조회 생략
+HISTORY_CACHE_TTL_SECONDS: int = 7 * 24 * 3600    # 7일간 조회되지 않은 종목은 삭제
+HISTORY_CACHE_MAX_SYMBOLS: int = 2000             # 초과 시 가장 오래 조회되지 않은 종목부터 삭제
+HISTORY_CACHE_RETENTION_DAYS: int = 120           # 이보다 오래된 봉은 삭제 (60일 추세 + 여유)
+
+# 뉴스 응답 캐시 (services/cache_service.py)
+#   backend: "memory"(warm Lambda 재사용) | "sqlite"(로컬 실행 간 유지)
+NEWS_CACHE_BACKEND: str = os.getenv(
+    "NEWS_CACHE_BACKEND", "memory" if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else "sqlite"
+)
+NEWS_CACHE_MAX_ENTRIES: int = 512                 # LRU 최대 항목 수
+NEWS_CACHE_STALE_SECONDS: int = 24 * 3600         # TTL 만료 후에도 ETag/Last-Modified 재검증용으로 보관
+# 프로바이더별 신선도(TTL, 초) — 스케줄 주기보다 짧으면 매 실행 재조회
+NEWS_CACHE_TTL_SECONDS: dict[str, int] = {
+    "tavily":     30 * 60,    # 유료 쿼터 — 가장 길게
+    "naver":      15 * 60,
+    "yahoo_rss":  10 * 60,    # 304 재검증으로 만료 후에도 저렴
+    "google_rss": 10 * 60,
+    "gdelt":      30 * 60,    # 5초 1회 제한 — 재조회 비용 큼
+}
+
+# AI 요약 메모이제이션 (ai_service.generate_ai_summary)
+#   mode: "exact" — (카테고리, 종목명, 정규화 컨텍스트, 모델 목록, 프롬프트 버전) 해시가 같을 때만 재사용
+#         "urls"  — exact + 기사 URL 집합이 같으면 본문이 조금 달라도 재사용 (near-duplicate)
+#         "off"   — 비활성화
+SUMMARY_CACHE_MODE: str = os.getenv("SUMMARY_CACHE_MODE", "exact")
+SUMMARY_CACHE_BACKEND: str = os.getenv("SUMMARY_CACHE_BACKEND", NEWS_CACHE_BACKEND)
+SUMMARY_CACHE_TTL_SECONDS: int = 6 * 3600
+
+# 뉴스 중복 제거 지문 인덱스 (services/dedup_service.py)
+DEDUP_INDEX_MAX_ENTRIES: int = 5000               # 최근 기사 지문 최대 보관 수 (초과 시 오래된 순 삭제)
+DEDUP_INDEX_MAX_AGE_SECONDS: int = 3 * 24 * 3600  # 3일 지난 지문은 삭제
+
+# BM25 재랭킹 인덱스 (services/rerank_service.py)
+BM25_INDEX_MAX_DOCS: int = 3000                   # IDF 통계에 반영할 최근 기사 수 (초과 시 오래된 순 제외)
+BM25_TOKEN_CACHE_SIZE: int = 4096                 # 토크나이저 LRU 캐시 항목 수 (메모리 상한)
+
+# 뉴스 제목 감성 점수 메모이제이션 (services/sentiment_service.py)
+SENTIMENT_CACHE_MAX_ENTRIES: int = 8192           # 제목 해시 LRU 최대 항목 수 (warm Lambda 간 유지)
+
+# 피드 저장 방식 (services/db_service.DBService.save_final_feed)
+#   "delta" — feed 행의 section_digests 컬럼(섹션별 해시)과 비교해 바뀐 최상위 섹션(컬럼)만 PATCH
+#   "full"  — 매 실행 전체 행 UPSERT (기존 방식)
+FEED_WRITE_MODE: str = os.getenv("FEED_WRITE_MODE", "delta")
+FEED_WRITE_GZIP: bool = os.getenv("FEED_WRITE_GZIP", "0") == "1"   # 요청 본문 gzip (게이트웨이 지원 시에만 활성화)
+
+# 정규화 아카이브 테이블 적재 (services/db_service.DBService.archive_run)
+#   news_articles / article_sentiment / ai_summary_history — append-only, 충돌 무시
+#   stock_history — (symbol, date) UPSERT (당일 미완성 봉 갱신)
+ARCHIVE_ENABLED: bool = os.getenv("ARCHIVE_ENABLED", "1") != "0"
+BULK_INSERT_BATCH_SIZE: int = 500                 # PostgREST 다중 행 INSERT 1회당 최대 행 수
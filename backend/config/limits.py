@@ -0,0 +1,90 @@
+import os
+
+# =============================================================================
+# 외부 API 호출 동시성 설정
+# 프로바이더별 동시 호출 수 조정은 이 파일만 수정하면 됩니다.
+#
+# 프로바이더 키 (news_service.py 데코레이터와 일치해야 함):
+#   tavily / naver / yahoo_rss / google_rss / gdelt
+# =============================================================================
+
+# 프로바이더별 최대 동시 호출 수 (스레드 풀 안에서 세마포어로 강제)
+PROVIDER_CONCURRENCY: dict[str, int] = {
+    "tavily": 3,        # 유료 플랜 동시 요청 여유 적음
+    "naver": 4,         # 검색 API 초당 10회 제한 내
+    "yahoo_rss": 4,
+    "google_rss": 4,
+    "gdelt": 1,         # 5초에 1회 정책 — 병렬 호출 금지
+}
+
+# Step B 뉴스 수집 스레드 풀 크기 (Lambda 256MB 기준 I/O 바운드 작업)
+NEWS_FETCH_WORKERS: int = 8
+
+# =============================================================================
+# 프로바이더별 토큰 버킷 속도 제한 (services/rate_limiter.py)
+#   rate  : 초당 토큰 보충량 (= 지속 허용 호출 수/초)
+#   burst : 버킷 최대 용량 (= 유휴 후 즉시 허용되는 연속 호출 수)
+# 호출자는 버킷 잔량이 부족할 때 필요한 시간만큼만 대기합니다.
+# =============================================================================
+PROVIDER_RATE_LIMITS: dict[str, dict[str, float]] = {
+    "tavily":     {"rate": 2.0,      "burst": 3},
+    "naver":      {"rate": 8.0,      "burst": 8},    # 공식 한도 초당 10회
+    "yahoo_rss":  {"rate": 2.0,      "burst": 4},
+    "google_rss": {"rate": 2.0,      "burst": 4},
+    "gdelt":      {"rate": 1 / 5.5,  "burst": 1},    # 5초에 1회 정책 + 여유 0.5초
+    "groq":       {"rate": 0.5,      "burst": 3},    # 30 RPM
+    "gemini":     {"rate": 1 / 6,    "burst": 2},    # Flash 10 RPM 기준
+}
+
+# =============================================================================
+# RSS 스트리밍 파싱 상한 (news_service._stream_rss_items)
+# 응답을 청크 단위로 파싱하다가 상한에 도달하면 나머지 다운로드를 중단합니다.
+# =============================================================================
+RSS_FRESH_HOURS: int = 48          # pubDate 기준 이 시간 이내 기사만 "신선"으로 간주
+RSS_MAX_FRESH_ITEMS: int = 10      # 신선한 기사가 이만큼 모이면 조기 종료 (BM25 top-3 후보로 충분)
+RSS_MAX_ITEMS: int = 50            # 신선도와 무관하게 읽을 최대 <item> 수 (메모리 상한)
+RSS_CHUNK_BYTES: int = 8192
+
+# =============================================================================
+# 뉴스 Fallback 체인 전략 (news_service.get_foreign_news / get_korean_news)
+#   "sequential" : 1순위 실패(빈 결과) 후에만 다음 프로바이더 호출 — 쿼터 최소
+#   "race"       : 우선순위별로 시차를 두고 동시 호출, 우선순위가 가장 높은 비어있지 않은 결과 채택
+#                  → 체인 전체 지연이 타임아웃 합이 아니라 최댓값 수준으로 감소
+# =============================================================================
+NEWS_FALLBACK_STRATEGY: str = os.getenv("NEWS_FALLBACK_STRATEGY", "sequential")
+NEWS_RACE_STAGGER_SECONDS: float = 1.5   # 순위당 시작 지연 — 1순위가 이 안에 성공하면 하위 프로바이더는 호출되지 않음
+NEWS_RACE_WORKERS: int = NEWS_FETCH_WORKERS * 3  # 레이스 전용 풀 크기 — 동시 레이스 상한(NEWS_FETCH_WORKERS) × 최대 체인 길이
+
+# =============================================================================
+# 공유 HTTP 세션 커넥션 풀 (services/http_client.py)
+# 호스트별 keep-alive 풀 크기·재시도 횟수. 미등록 호스트는 "default" 설정 사용.
+#   pool    : 호스트당 유지할 최대 연결 수 (PROVIDER_CONCURRENCY 이상 권장)
+#   retries : 연결 오류·429/5xx 재시도 횟수 (GET/HEAD만, Retry-After 존중)
+# =============================================================================
+HTTP_POOL_CONFIG: dict[str, dict[str, int]] = {
+    "default":                 {"pool": 4, "retries": 1},
+    "openapi.naver.com":       {"pool": 4, "retries": 2},
+    "feeds.finance.yahoo.com": {"pool": 4, "retries": 2},
+    "news.google.com":         {"pool": 4, "retries": 2},
+    "api.gdeltproject.org":    {"pool": 1, "retries": 0},   # 5초 1회 정책 — 재시도는 토큰 버킷을 우회하므로 금지
+    "supabase":                {"pool": 2, "retries": 2},   # SUPABASE_URL 호스트에 적용
+}
+HTTP_RETRY_BACKOFF: float = 0.5                  # 재시도 간격 = backoff × 2^(n-1) 초
+HTTP_RETRY_STATUS: tuple[int, ...] = (429, 500, 502, 503, 504)
+HTTP_DEFAULT_TIMEOUT: tuple[float, float] = (3.05, 10)   # (connect, read) — 호출부에서 timeout 미지정 시
+
+# =============================================================================
+# 샤딩 실행 (engine="sharded", services/shard_service.py)
+# 코디네이터가 종목 뉴스·추세 작업을 심볼 기준 consistent-hash 샤드로 나눠 워커에 분배하고,
+# 워커 부분 결과를 모아 Step C/D를 수행합니다.
+#   dispatch : "process" — 로컬 프로세스 풀 (별도 Lambda 호출 대역)
+#              "lambda"  — 같은 Lambda 함수를 engine="shard_worker"로 동기 호출 (boto3)
+#   store    : "local"    — 캐시 디렉터리 파일 (process 전용 — Lambda 간 /tmp는 공유되지 않음)
+#              "supabase" — sync_shard_results 테이블 (supabase_schema.sql 6번)
+# =============================================================================
+SHARD_COUNT: int = int(os.getenv("SHARD_COUNT", "4"))
+SHARD_VNODES: int = 64                     # 샤드당 해시 링 가상 노드 수 (많을수록 균등 분배)
+SHARD_DISPATCH: str = os.getenv("SHARD_DISPATCH", "process")
+# 미설정 시 dispatch에 맞춰 선택 — lambda 워커는 코디네이터의 /tmp에 쓸 수 없으므로 supabase
+SHARD_RESULT_STORE: str = os.getenv("SHARD_RESULT_STORE") or ("supabase" if SHARD_DISPATCH == "lambda" else "local")
+SHARD_WORKER_TIMEOUT_SECONDS: int = 240    # 워커 1개 대기 상한 (Lambda 300초 제한 내 병합·저장 여유)
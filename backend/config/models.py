@@ -6,6 +6,7 @@
 #   Gemini  → "gemini/<model-id>"   → Google Gemini API
 #   Groq    → "groq/<model-id>"    → Groq API
 # =============================================================================
+import os
 
 MODEL_CONFIG: dict[str, list[str]] = {
 
@@ -43,3 +44,69 @@ MAX_TOKENS: int = 3000
 
 # 창의성 억제 (팩트 기반 분석을 위해 낮게 설정)
 TEMPERATURE: float = 0.2
+
+# Step C 전체 마감 시간(초) — 세 카테고리를 병렬 생성하되 이 시간이 지나면
+# 완료된 요약만으로 피드를 저장 (Lambda 300초 제한 내 Step D 저장 시간 확보)
+SUMMARY_DEADLINE_SECONDS: float = 120.0
+
+# =============================================================================
+# 헤지(hedged) 요청 — 선택 기능 (AI_HEDGE_ENABLED=1)
+# 현재 모델이 "최근 응답 지연의 HEDGE_PERCENTILE 분위수" 안에 응답하지 않으면
+# 다음 순위 모델을 병렬로 호출하고, 먼저 도착한 유효 JSON 응답을 채택합니다.
+# 패배한 요청도 할당량을 소모하므로 헤지는 대상 프로바이더 버킷에 즉시 쓸 수 있는 토큰이 남아 있을 때만,
+# 실행당 HEDGE_MAX_PER_RUN회까지 발사합니다 (그 외에는 현재 요청을 계속 기다림).
+# =============================================================================
+HEDGE_ENABLED: bool = os.getenv("AI_HEDGE_ENABLED", "0") == "1"
+HEDGE_PERCENTILE: float = 0.95            # 모델별 지연 분포에서 헤지 발사 기준 분위수
+HEDGE_MAX_PER_RUN: int = int(os.getenv("AI_HEDGE_MAX_PER_RUN", "4"))  # 동기화 실행당 헤지 호출 상한 (전 카테고리 합산)
+HEDGE_MIN_SAMPLES: int = 5                # 표본이 이보다 적으면 기본 지연 사용
+HEDGE_DEFAULT_DELAY_SECONDS: float = 15.0
+HEDGE_MIN_DELAY_SECONDS: float = 2.0      # 분위수가 너무 짧아 불필요한 중복 호출이 생기는 것 방지
+HEDGE_MAX_DELAY_SECONDS: float = 45.0
+
+# =============================================================================
+# 종목별 AI 요약 (AI_SYMBOL_SUMMARY_ENABLED=1, 기본)
+# 포트폴리오·관심종목 요약을 카테고리 전체 컨텍스트 1건 대신 종목 단위로 생성합니다.
+#   - 캐시 miss 종목만 여러 종목을 묶은 배치 프롬프트로 생성 (입력 토큰 예산 내 first-fit 패킹)
+#   - 종목별 요약은 해당 종목 뉴스 기준으로 따로 캐시 → 뉴스가 바뀐 종목만 재생성
+#   - 카테고리 요약은 종목별 요약을 조립 (응답 형식은 기존 AISummaryStructured 유지)
+# 0이면 기존 방식 (카테고리별 컨텍스트 1건 → 요약 1건)
+# =============================================================================
+SYMBOL_SUMMARY_ENABLED: bool = os.getenv("AI_SYMBOL_SUMMARY_ENABLED", "1") == "1"
+SYMBOL_BATCH_INPUT_TOKENS: int = 4000        # 배치 1건의 종목 블록 입력 토큰 합 상한 (시스템 프롬프트 제외)
+SYMBOL_SUMMARY_OUTPUT_TOKENS: int = 600      # 종목 1개 JSON 출력 추정치 → 배치당 최대 MAX_TOKENS // 600 = 5종목
+SYMBOL_BULLETS_PER_SYMBOL: int = 2           # 카테고리 조립 시 종목당 bullets 수
+SYMBOL_MAX_SHARED_ITEMS: int = 5             # 카테고리 조립 시 reference_indicators·glossary_terms 최대 개수
+
+# 토큰 계산 (services/token_counter.py) — Groq·Gemini 전용 토크나이저 대신 cl100k_base로 근사
+#   BPE 파일은 배포 시 backend/data/tiktoken/에 미리 받아 패키지에 포함 (.github/workflows/sync.yml)
+#   → 런타임 다운로드 없음. 파일이 없으면 tiktoken을 쓰지 않고 바이트 길이 추정으로 계산합니다.
+TOKENIZER_ENCODING: str = "cl100k_base"
+TOKENIZER_BPE_URL: str = "https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken"
+TOKENIZER_CACHE_DIR: str = os.getenv("TIKTOKEN_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tiktoken")
+# 바이트 추정치 — 한글 1자 ≈ 3바이트 ≈ 1토큰으로 거의 일치, 영문은 실제(≈4자/토큰)보다 약 1.3배 크게 계산
+# → 배치·컨텍스트 예산이 보수적으로 채워질 뿐 모델 입력 한도를 넘지는 않음
+TOKENIZER_FALLBACK_BYTES_PER_TOKEN: int = 3
+
+# =============================================================================
+# 컨텍스트 압축 (services/compaction_service.py, CONTEXT_COMPACTION_ENABLED=1 기본)
+# Step B/B.5에서 모은 뉴스·추세 컨텍스트를 요약 요청 전에 줄입니다.
+#   1) 기사 간 유사 문장 제거 (문자 3-gram MinHash, dedup_service와 같은 기준)
+#   2) 숫자·고유명사(영문 대문자 단어)·종목명/심볼이 없는 문장 제거 (기사당 첫 문장은 유지)
+#   3) 카테고리 입력 토큰 예산 초과 시 기사 뒤쪽 문장부터 제거
+# 카테고리 예산 = MODEL_CONFIG 폴백 체인 첫 모델(주 모델)의 MODEL_INPUT_TOKENS − 프롬프트 고정 부분 토큰
+#   → 입력 한도가 더 작은 모델로 폴백될 때만 그 모델 예산으로 다시 압축 (ai_service, 예산별 1회)
+# =============================================================================
+CONTEXT_COMPACTION_ENABLED: bool = os.getenv("CONTEXT_COMPACTION_ENABLED", "1") == "1"
+
+# 모델별 요청당 입력 토큰 상한 (컨텍스트 윈도가 아니라 분당 토큰(TPM) 한도 − 출력 MAX_TOKENS 기준)
+MODEL_INPUT_TOKENS: dict[str, int] = {
+    "gemini/gemini-2.5-pro":        12000,
+    "gemini/gemini-2.5-flash":      12000,
+    "gemini/gemini-2.5-flash-lite": 12000,
+    "groq/openai/gpt-oss-20b":      5000,    # Groq TPM 8000 − 출력 3000
+    "groq/llama-3.1-8b-instant":    3000,    # Groq TPM 6000 − 출력 3000
+}
+MODEL_INPUT_TOKENS_DEFAULT: int = 3000       # 목록에 없는 모델
+COMPACTION_MIN_CONTEXT_TOKENS: int = 500     # 예산 하한 (프롬프트 고정 부분이 커도 컨텍스트는 이만큼 보장)
@@ -0,0 +1,43 @@
+# =============================================================================
+# 종목 뉴스 우선순위 스케줄러 (services/scheduler_service.py)
+# 실행마다 모든 종목을 갱신하는 대신, 우선순위가 높은 종목부터 실행 예산만큼만 뉴스를 새로 수집합니다.
+# 이번 실행에서 선택되지 않은 종목은 직전 수집 결과를 피드·AI 컨텍스트에 그대로 사용합니다.
+#
+# 우선순위 점수 (클수록 먼저 갱신):
+#   watchers  × log(1 + 관심 등록 유저 수)            — Supabase watchlist 집계
+#   move      × min(|등락률|, MOVE_CAP) / MOVE_UNIT   — 스냅샷 전일 대비 등락률(%)
+#   volume    × 거래량 백분위 (0~1, 후보 종목 내 순위)
+#   staleness × 마지막 갱신 후 경과 시간 / TARGET_INTERVAL
+#   portfolio — 내 포트폴리오 종목 고정 가산점
+# MAX_STALENESS 이상 갱신되지 않은(또는 한 번도 수집되지 않은) 종목은 점수와 무관하게 먼저 선택 → 기아 방지
+# =============================================================================
+import os
+
+SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "0") == "1"
+
+# 실행당 예산 — 둘 중 먼저 소진되는 쪽에서 선택 중단
+SCHEDULER_MAX_JOBS: int = int(os.getenv("SCHEDULER_MAX_JOBS", "20"))                         # 뉴스 API 호출(작업) 수
+SCHEDULER_TIME_BUDGET_SECONDS: float = float(os.getenv("SCHEDULER_TIME_BUDGET_SECONDS", "60"))  # 예상 수집 시간
+
+SCHEDULER_WEIGHTS: dict[str, float] = {
+    "watchers": 1.0,
+    "move": 1.0,
+    "volume": 0.5,
+    "staleness": 1.0,
+    "portfolio": 2.0,
+}
+SCHEDULER_MOVE_UNIT: float = 2.0                         # 등락률 2%당 1점
+SCHEDULER_MOVE_CAP: float = 10.0                         # 등락률 상한 (이상치 한 종목이 예산 독점 방지)
+SCHEDULER_TARGET_INTERVAL_SECONDS: int = 3600            # 경과 1시간당 1점
+SCHEDULER_MAX_STALENESS_SECONDS: int = 6 * 3600          # 이보다 오래된 종목은 우선 선택
+
+SCHEDULER_DEFAULT_JOB_SECONDS: float = 3.0               # 작업당 소요 시간 초기 추정치 (측정 전)
+SCHEDULER_COST_EWMA_ALPHA: float = 0.3                   # 작업당 소요 시간 지수이동평균 가중치
+SCHEDULER_STATE_MAX_SYMBOLS: int = 2000                  # 상태 파일에 보관할 최대 종목 수 (오래 갱신 안 된 순 삭제)
+
+# 종목별 마지막 갱신 시각·결과 저장소
+#   "supabase" — news_scheduler_state 테이블 (supabase_schema.sql 7번) + 캐시 디렉터리 파일
+#                (Lambda /tmp는 cold start마다 비워지므로 갱신 이력을 DB에 보관)
+#   "local"    — 캐시 디렉터리 파일만 (로컬 실행·벤치마크)
+# 어느 저장소에도 기록이 없는 종목은 기한 초과(한 번도 수집되지 않음)로 취급 — 방금 갱신된 것으로 보지 않음
+SCHEDULER_STATE_STORE: str = os.getenv("SCHEDULER_STATE_STORE", "supabase")
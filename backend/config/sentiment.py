@@ -0,0 +1,59 @@
+# =============================================================================
+# 한국어 뉴스 제목 감성 사전 (services/sentiment_service.KoreanLexiconScorer)
+# VADER는 영어 전용이라 한글 제목을 ~0점으로 처리하므로 금융 뉴스 빈출 어휘로 보완합니다.
+#
+# 값 범위: -4.0 ~ +4.0 (VADER 사전과 동일 스케일, 합산 후 -1.0~+1.0로 정규화)
+# 매칭 방식: 제목 내 부분 문자열 — 조사·어미가 붙어도 매칭되도록 어간 위주로 등록
+# =============================================================================
+
+KO_SENTIMENT_LEXICON: dict[str, float] = {
+    # 긍정
+    "급등": 3.0,
+    "상한가": 3.0,
+    "신고가": 2.5,
+    "최고치": 2.0,
+    "호실적": 2.5,
+    "흑자전환": 2.5,
+    "어닝서프라이즈": 3.0,
+    "사상 최대": 2.0,
+    "수혜": 1.5,
+    "강세": 1.5,
+    "반등": 1.5,
+    "상승": 1.2,
+    "호재": 2.0,
+    "순매수": 1.0,
+    "상향": 1.2,
+    "돌파": 1.2,
+    "성장": 1.0,
+    "개선": 1.0,
+    "회복": 1.2,
+    "증가": 0.8,
+    "수주": 1.2,
+    "기대감": 1.0,
+    # 부정
+    "급락": -3.0,
+    "하한가": -3.0,
+    "폭락": -3.5,
+    "신저가": -2.5,
+    "어닝쇼크": -3.0,
+    "적자전환": -2.5,
+    "적자": -1.5,
+    "약세": -1.5,
+    "하락": -1.2,
+    "악재": -2.0,
+    "순매도": -1.0,
+    "하향": -1.2,
+    "부진": -1.5,
+    "둔화": -1.0,
+    "감소": -0.8,
+    "우려": -1.2,
+    "리스크": -1.0,
+    "경고": -1.5,
+    "소송": -1.2,
+    "제재": -1.5,
+    "파산": -3.5,
+    "리콜": -2.0,
+}
+
+# 뒤따르는 부정 표현 — 매칭 어휘 점수의 부호를 반전 ("상승 못해", "하락 멈춰")
+KO_NEGATION_SUFFIXES: tuple[str, ...] = ("못", "않", "없", "멈춰", "멈춘", "제동")
@@ -88,3 +88,84 @@ CREATE OR REPLACE FUNCTION remove_from_watchlist(p_user_id TEXT, p_symbol TEXT)
 RETURNS void LANGUAGE SQL SECURITY DEFINER AS $$
     DELETE FROM watchlist WHERE user_id = p_user_id AND symbol = p_symbol;
 $$;
+
+-- ──────────────────────────────────────────
+-- 4. feed — 실행별 성능 요약 컬럼 (Lambda save_final_feed가 id=1 행에 UPSERT)
+-- 단계별 소요 시간·프로바이더/모델 호출 집계 (backend/services/tracing.py summarize())
+-- ──────────────────────────────────────────
+ALTER TABLE feed ADD COLUMN IF NOT EXISTS perf_summary JSONB;
+-- 섹션(컬럼)별 해시 — save_final_feed(delta 모드)가 바뀐 컬럼만 PATCH할 때 비교 기준 (행과 함께 갱신)
+ALTER TABLE feed ADD COLUMN IF NOT EXISTS section_digests JSONB;
+
+-- ──────────────────────────────────────────
+-- 5. 정규화 아카이브 테이블 (append-only)
+-- Lambda DBService.archive_run()이 실행마다 다중 행 INSERT
+-- (Prefer: resolution=ignore-duplicates → 이미 있는 행은 무시, 기존 데이터 불변)
+-- stock_history(1번)는 예외 — resolution=merge-duplicates로 UPSERT (당일 장중 봉을 이후 실행 값으로 갱신)
+-- ──────────────────────────────────────────
+
+-- 5-1. news_articles — 정규화 URL 해시 기준 기사 1건 1행
+CREATE TABLE IF NOT EXISTS news_articles (
+    url_hash        TEXT        PRIMARY KEY,        -- canonicalize_url() 후 blake2b 64비트 hex
+    url             TEXT        NOT NULL,
+    title           TEXT,
+    category        TEXT,                           -- macro | portfolio | watchlist
+    symbol          TEXT,                           -- 종목 뉴스일 때 티커
+    source_name     TEXT,                           -- 피드 표시명 (예: Macro, NVIDIA)
+    published       TEXT,                           -- 프로바이더 원문 날짜 문자열
+    first_seen_at   TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_symbol_seen
+    ON news_articles(symbol, first_seen_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_articles_category_seen
+    ON news_articles(category, first_seen_at DESC);   -- 피드 페이지네이션
+
+-- 5-2. article_sentiment — 기사별 감성 점수 (점수기 버전별 1행)
+CREATE TABLE IF NOT EXISTS article_sentiment (
+    url_hash    TEXT        NOT NULL REFERENCES news_articles(url_hash),
+    scorer      TEXT        NOT NULL,               -- 예: vader+ko-lexicon.v1
+    score       NUMERIC(5, 3),                      -- -1.000 ~ +1.000
+    scored_at   TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (url_hash, scorer)
+);
+
+-- 5-3. ai_summary_history — 카테고리별 AI 요약 이력 (내용 해시 기준 중복 제거)
+CREATE TABLE IF NOT EXISTS ai_summary_history (
+    id              BIGSERIAL   PRIMARY KEY,
+    category        TEXT        NOT NULL,           -- macro | portfolio | watchlist
+    content_hash    TEXT        NOT NULL,           -- 요약 JSON sha256
+    summary         JSONB       NOT NULL,
+    created_at      TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE (category, content_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ai_summary_history_category_created
+    ON ai_summary_history(category, created_at DESC);
+
+-- ──────────────────────────────────────────
+-- 6. sync_shard_results — 샤딩 실행 부분 결과 (SHARD_RESULT_STORE=supabase)
+-- 워커 Lambda가 샤드별 뉴스·추세 결과를 저장 → 코디네이터가 병합 후 run_id 단위로 삭제
+-- 코디네이터 실패로 남은 행은 created_at 기준으로 주기 정리
+-- ──────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS sync_shard_results (
+    run_id      TEXT        NOT NULL,
+    shard_id    INTEGER     NOT NULL,
+    payload     JSONB       NOT NULL,
+    created_at  TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (run_id, shard_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_shard_results_created
+    ON sync_shard_results(created_at);
+
+-- ──────────────────────────────────────────
+-- 7. news_scheduler_state — 종목 뉴스 스케줄러 상태 (SCHEDULER_ENABLED=1, SCHEDULER_STATE_STORE=supabase)
+-- 종목별 마지막 뉴스 갱신 시각·결과. Lambda /tmp 상태 파일은 cold start마다 사라지므로 DB에 보관
+-- (행이 없는 종목은 기한 초과로 우선 수집)
+-- ──────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS news_scheduler_state (
+    symbol          TEXT                PRIMARY KEY,
+    refreshed_at    DOUBLE PRECISION    NOT NULL,   -- epoch 초 (time.time())
+    result          JSONB               NOT NULL    -- [context, links] — 선택되지 않은 실행에서 재사용
+);
@@ -2,8 +2,11 @@ import sys
 import os
 import re
 import time
+import uuid
+import asyncio
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -14,64 +17,69 @@ root_dir = os.path.dirname(current_dir)
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
-from dotenv import load_dotenv
-load_dotenv()
+# Lambda는 환경 변수로 직접 주입 — .env 탐색·dotenv import 생략 (cold start 단축)
+if not os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 from backend.config.tickers import (
     NAME_MAP, US_CANDIDATES, KR_CANDIDATES,
     MY_PORTFOLIO, WATCHLIST, MACRO_KEYWORDS, KR_MACRO_KEYWORDS
 )
+from backend.config.limits import SHARD_COUNT, SHARD_DISPATCH
+from backend.config.scheduler import SCHEDULER_ENABLED
+from backend.config.models import SYMBOL_SUMMARY_ENABLED, CONTEXT_COMPACTION_ENABLED
 from backend.services.db_service import DBService
-from backend.services.market_service import get_market_indices, get_top_volume_stocks, get_stock_history  # get_stock_history: AI 추세 컨텍스트용
-from backend.services.news_service import get_tavily_news, get_naver_news, get_foreign_news, get_korean_news
-from backend.services.ai_service import generate_ai_summary
+from backend.services.market_service import get_market_snapshot, get_market_indices, get_top_volume_stocks, get_history_panel, compute_trend_stats, panel_to_records, snapshot_metrics  # 히스토리 패널: AI 추세 컨텍스트용
+from backend.services.news_service import fetch_news_batch
+from backend.services.ai_service import (
+    generate_ai_summaries, get_summary_cache_stats, get_latency_stats, context_token_budget,
+    reset_hedge_count, get_hedge_count,
+)
+from backend.services.compaction_service import compact_context, get_compaction_stats, reset_compaction_stats
+from backend.services import rate_limiter, tracing, shard_service
+from backend.services.cache_service import get_news_cache
+from backend.services.dedup_service import FeedDeduper, get_recent_index
+from backend.services.rerank_service import get_bm25_index
+from backend.services.sentiment_service import get_sentiment_stats
+from backend.services.scheduler_service import SchedulePlan, get_scheduler
+from backend.services.http_client import get_connection_stats, reset_connection_stats
 
-def _build_trend_context(symbol: str, name: str, records: list) -> str:
-    """60일 주가 히스토리에서 AI 프롬프트용 추세 컨텍스트 문자열 생성."""
-    if not records:
-        return ""
-    closes = [r["close"] for r in records if r.get("close") is not None]
-    if len(closes) < 10:
+def _build_trend_context(symbol: str, name: str, stats) -> str:
+    """compute_trend_stats() 결과 1행에서 AI 프롬프트용 추세 컨텍스트 문자열 생성."""
+    if stats is None:
         return ""
-    latest = closes[-1]
-    prev_5 = closes[-5] if len(closes) >= 5 else closes[0]
-    prev_30 = closes[-30] if len(closes) >= 30 else closes[0]
-    ret_5d = (latest - prev_5) / prev_5 * 100
-    ret_30d = (latest - prev_30) / prev_30 * 100
-    high_60d = max(closes)
-    low_60d = min(closes)
     return (
         f"[{name} 주가 추세 (60일 히스토리 기반)]\n"
-        f"- 현재가: {latest:.2f}, 5일 수익률: {ret_5d:+.2f}%, 30일 수익률: {ret_30d:+.2f}%\n"
-        f"- 60일 고가: {high_60d:.2f}, 저가: {low_60d:.2f}\n"
+        f"- 현재가: {stats['latest']:.2f}, 5일 수익률: {stats['ret_5d']:+.2f}%, 30일 수익률: {stats['ret_30d']:+.2f}%\n"
+        f"- 60일 고가: {stats['high_60d']:.2f}, 저가: {stats['low_60d']:.2f}\n"
     )
 
 
-def run_sync_engine_once():
-    logger.info("[Start] Data Sync at %s", datetime.now())
+INDICES_CONFIG = {
+    "market_indices/domestic": { "KOSPI": "^KS11", "KOSDAQ": "^KQ11" },
+    "market_indices/global": { "S&P500": "^GSPC", "NASDAQ": "^IXIC" },
+    "key_indicators": {
+        "USD_KRW": "USDKRW=X", "US_10Y": "^TNX", "BTC": "BTC-USD", "Gold": "GC=F"
+    }
+}
 
-    db_svc = DBService()
-    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    # 동적 Watchlist 로드 (Supabase DB)
-    # Supabase 미설정이거나 DB가 비어있으면 tickers.py 폴백 사용
-    dynamic_watchlist = db_svc.get_all_watchlist_symbols()
-    active_watchlist = dynamic_watchlist if dynamic_watchlist else WATCHLIST
-    # NAME_MAP 업데이트: 동적 watchlist 심볼 포함
-    active_name_map = {**NAME_MAP, **active_watchlist}
+def _snapshot_symbols(active_watchlist: dict | None = None) -> list[str]:
+    """
+    지수·지표·종목 후보 전체 — yf.download 1회로 일괄 수집 (심볼 수와 무관한 왕복 횟수).
+    스케줄러 사용 시 동적 watchlist 심볼도 포함 (우선순위 점수의 등락률·거래량 입력).
+    """
+    index_tickers = [t for items in INDICES_CONFIG.values() for t in items.values()]
+    extra = _trend_symbols(active_watchlist) if SCHEDULER_ENABLED and active_watchlist else []
+    return index_tickers + US_CANDIDATES + KR_CANDIDATES + extra
 
-    # [A] 지수 및 주요 지표 업데이트
-    logger.info("[Step A] 지수 및 주요 지표 수집 시작")
-    indices_config = {
-        "market_indices/domestic": { "KOSPI": "^KS11", "KOSDAQ": "^KQ11" },
-        "market_indices/global": { "S&P500": "^GSPC", "NASDAQ": "^IXIC" },
-        "key_indicators": {
-            "USD_KRW": "USDKRW=X", "US_10Y": "^TNX", "BTC": "BTC-USD", "Gold": "GC=F"
-        }
-    }
+
+def _collect_indices(db_svc, market_snapshot, now_str: str) -> dict:
+    """[Step A] 스냅샷에서 지수·주요 지표 추출."""
     collected_indices = {"market_indices": {"domestic": {}, "global": {}}, "key_indicators": {}}
-    for path, items in indices_config.items():
-        updates = get_market_indices(items)
+    for path, items in INDICES_CONFIG.items():
+        updates = get_market_indices(items, snapshot=market_snapshot)
         for key in updates:
             updates[key]["updated_at"] = now_str
         db_svc.update_market_indices(path, updates)
@@ -82,55 +90,55 @@ def run_sync_engine_once():
             collected_indices["market_indices"]["global"] = updates
         elif path == "key_indicators":
             collected_indices["key_indicators"] = updates
+    return collected_indices
 
-    # [B] 뉴스 데이터 수집 및 구조화
-    logger.info("[Step B] 뉴스 데이터 수집 시작")
-    frontend_feed = { "portfolio": [], "watchlist": [], "macro": [] }
-    ai_contexts = { "macro": "", "portfolio": "", "watchlist": "" }
 
-    # 1. 거시경제 뉴스 (영문 — Tavily)
+def _macro_news_jobs() -> list[dict]:
+    """거시경제 뉴스 수집 작업 (영문 매크로 → 한국 거시 순서 = 병합 순서)."""
+    news_jobs = []
+    # 1) 거시경제 뉴스 (영문 — Tavily)
     for keyword in MACRO_KEYWORDS:
-        try:  # [P4 Fix] 개별 키워드 뉴스 수집 실패 시 전체 중단 방지 (종목 뉴스와 동일 패턴)
-            context, links = get_foreign_news(keyword)
-            if context:
-                ai_contexts["macro"] += f"\n[Keyword: {keyword}]\n{context}\n"
-                for item in links:
-                    news_item = {
-                        "title": item.get("title"),
-                        "link": item.get("url"),
-                        "name": "Macro",
-                        "pubDate": item.get("date"),  # [P1 Fix] news_service.py 반환 key는 "date"
-                    }
-                    frontend_feed["macro"].append(news_item)
-            time.sleep(1)
-        except Exception as e:
-            logger.warning("매크로 뉴스 수집 실패 (%s): %s", keyword, e)
-            continue
-
-    # 1-2. 한국 거시경제 뉴스 (한국어 — Naver)
+        news_jobs.append({
+            "lang": "foreign", "query": keyword, "symbol": None,
+            "category": "macro", "header": f"[Keyword: {keyword}]", "name": "Macro",
+        })
+    # 2) 한국 거시경제 뉴스 (한국어 — Naver)
     for keyword in KR_MACRO_KEYWORDS:
-        try:
-            context, links = get_korean_news(keyword)
-            if context:
-                ai_contexts["macro"] += f"\n[한국 거시: {keyword}]\n{context}\n"
-                for item in links:
-                    news_item = {
-                        "title": item.get("title"),
-                        "link": item.get("url"),
-                        "name": "한국 거시경제",
-                        "pubDate": item.get("date"),
-                    }
-                    frontend_feed["macro"].append(news_item)
-            time.sleep(1)
-        except Exception as e:
-            logger.warning("한국 거시뉴스 수집 실패 (%s): %s", keyword, e)
-            continue
+        news_jobs.append({
+            "lang": "korean", "query": keyword, "symbol": None,
+            "category": "macro", "header": f"[한국 거시: {keyword}]", "name": "한국 거시경제",
+        })
+    return news_jobs
+
+
+def _stock_news_job(symbol: str, info: dict, active_watchlist: dict) -> dict | None:
+    """종목 뉴스 수집 작업 1건 (포트폴리오·관심 종목이 아니면 None)."""
+    category = None
+    if symbol in MY_PORTFOLIO: category = "portfolio"
+    elif symbol in active_watchlist: category = "watchlist"
+    if not category:
+        return None
+    # KS 종목은 Naver News API로 한국어 뉴스 수집, 그 외는 Tavily 사용
+    kr_name = info.get("kr_name")
+    if symbol.endswith(".KS") and kr_name:
+        job = {"lang": "korean", "query": kr_name, "symbol": None}
+    else:
+        job = {"lang": "foreign", "query": info['name'], "symbol": symbol}
+    job.update({
+        "category": category, "header": f"[{info['name']}]",
+        "name": info['name'], "kr_name": kr_name, "feed_symbol": symbol,
+    })
+    return job
 
-    # 2. 종목 데이터 및 뉴스 수집
-    us_stocks = get_top_volume_stocks(US_CANDIDATES, 15)
-    kr_stocks = get_top_volume_stocks(KR_CANDIDATES, 15)
-    stock_data_map = {}
 
+def _stock_news_jobs(market_snapshot, active_name_map: dict, active_watchlist: dict) -> tuple[list[dict], dict]:
+    """
+    거래량 상위 종목 → (종목 뉴스 수집 작업, stock_data_map).
+    스케줄러 사용 시 뉴스 작업 후보는 포트폴리오·관심 종목 전체 (실제 수집 대상은 _plan_stock_news가 예산 내 선택).
+    """
+    us_stocks = get_top_volume_stocks(US_CANDIDATES, 15, snapshot=market_snapshot)
+    kr_stocks = get_top_volume_stocks(KR_CANDIDATES, 15, snapshot=market_snapshot)
+    stock_data_map = {}
     for item in (us_stocks + kr_stocks):
         symbol = item['symbol']
         info = active_name_map.get(symbol, {"name": symbol, "sector": "기타"})
@@ -143,55 +151,187 @@ def run_sync_engine_once():
             "sector": info.get('sector', '미분류')
         }
 
-        category = None
-        if symbol in MY_PORTFOLIO: category = "portfolio"
-        elif symbol in active_watchlist: category = "watchlist"
-
-        if category:
-            try:  # [P4 Fix] 개별 종목 뉴스 수집 실패 시 전체 중단 방지
-                # KS 종목은 Naver News API로 한국어 뉴스 수집, 그 외는 Tavily 사용
-                kr_name = info.get("kr_name")
-                if symbol.endswith(".KS") and kr_name:
-                    context, links = get_korean_news(kr_name)
-                else:
-                    context, links = get_foreign_news(info['name'], symbol=symbol)
-                if context:
-                    ai_contexts[category] += f"\n[{info['name']}]\n{context}\n"
-                    for link_data in links:
-                        news_item = {
-                            "title": link_data.get("title"),
-                            "link": link_data.get("url"),
-                            "name": info['name'],
-                            "pubDate": link_data.get("date"),  # [P1 Fix] news_service.py 반환 key는 "date"
-                            "symbol": symbol
-                        }
-                        frontend_feed[category].append(news_item)
-                time.sleep(1)
-            except Exception as e:
-                logger.warning("종목 뉴스 수집 실패 (%s): %s", symbol, e)
+    news_symbols = (dict.fromkeys(_trend_symbols(active_watchlist)) if SCHEDULER_ENABLED
+                    else [item['symbol'] for item in (us_stocks + kr_stocks)])
+    news_jobs = []
+    for symbol in news_symbols:
+        job = _stock_news_job(symbol, active_name_map.get(symbol, {"name": symbol, "sector": "기타"}), active_watchlist)
+        if job:
+            news_jobs.append(job)
+    return news_jobs, stock_data_map
+
+
+def _plan_stock_news(stock_jobs: list[dict], market_snapshot, active_watchlist: dict) -> SchedulePlan:
+    """종목 뉴스 중 이번 실행에 새로 수집할 작업 선택 (SCHEDULER_ENABLED=0이면 전체)."""
+    if not SCHEDULER_ENABLED:
+        return SchedulePlan.all(stock_jobs)
+    symbols = [job["feed_symbol"] for job in stock_jobs]
+    watchers = {s: active_watchlist.get(s, {}).get("watchers", 0) for s in symbols}
+    return get_scheduler().plan(stock_jobs, snapshot_metrics(market_snapshot, symbols), watchers, set(MY_PORTFOLIO))
+
+
+def _finish_stock_news(plan: SchedulePlan, fetched: list, seconds: float) -> list:
+    """수집 결과 + 미선택 종목의 직전 결과 → stock_jobs 순서 결과. 스케줄러 상태 저장."""
+    results = plan.assemble(fetched, seconds)
+    if plan.scheduler is not None:
+        plan.scheduler.save()
+    return results
+
+
+def _new_ai_contexts() -> dict:
+    """카테고리별 AI 컨텍스트 문자열 + "symbols": {심볼: {category, name, kr_name, news, trend, article_urls}} (종목별 요약용)."""
+    return {"macro": "", "portfolio": "", "watchlist": "", "symbols": {}}
+
+
+def _symbol_context(ai_contexts: dict, symbol: str, category: str, name: str, kr_name: str | None = None) -> dict:
+    piece = ai_contexts["symbols"].setdefault(symbol, {
+        "category": category, "name": name, "kr_name": None, "news": "", "trend": "", "article_urls": [],
+    })
+    piece["kr_name"] = piece["kr_name"] or kr_name   # .KS 뉴스는 한글 종목명으로 수집 — 압축 keep_terms에 필요
+    return piece
+
+
+def _keep_terms(symbol: str, piece: dict) -> tuple:
+    """컨텍스트 압축 시 문장을 남길 종목 식별어 — 심볼·영문명·한글명."""
+    return (symbol, piece["name"], piece.get("kr_name"))
+
+
+# news_service 컨텍스트 형식: "[n. 제목]\n본문" 블록을 빈 줄로 연결
+_article_block_re = re.compile(r"\n\n(?=\[\d+\. )")
+_article_title_re = re.compile(r"^\[\d+\. (.*)\]$")
+
+
+def _drop_context_articles(context: str, titles: set[str]) -> str:
+    """컨텍스트에서 제목이 titles인 기사 블록 제거 (중복 제거로 피드에서 빠진 기사)."""
+    kept = []
+    for block in _article_block_re.split(context):
+        match = _article_title_re.match(block.split("\n", 1)[0])
+        if match is None or match.group(1) not in titles:
+            kept.append(block)
+    return "\n\n".join(kept)
+
+
+def _merge_news(news_jobs: list[dict], news_results: list, frontend_feed: dict, ai_contexts: dict,
+                articles: list[dict] | None = None, deduper: FeedDeduper | None = None) -> None:
+    """
+    수집 결과를 작업 순서대로 피드·AI 컨텍스트에 결정적으로 병합. articles를 주면 아카이브용 기사 행(감성 포함)도 누적.
+    deduper를 주면 병합 전에 작업 결과별로 중복 기사를 걸러 피드·AI 컨텍스트·아카이브 모두에서 제외합니다.
+    """
+    for job, (context, links) in zip(news_jobs, news_results):
+        try:  # [P4 Fix] 개별 키워드/종목 병합 실패 시 전체 중단 방지
+            if deduper is not None and links:
+                kept = deduper.filter(links)
+                if len(kept) < len(links):
+                    kept_ids = {id(link) for link in kept}
+                    context = _drop_context_articles(
+                        context, {link.get("title") for link in links if id(link) not in kept_ids})
+                links = kept
+            if not context or not context.strip():
                 continue
+            category = job["category"]
+            ai_contexts[category] += f"\n{job['header']}\n{context}\n"
+            if job.get("feed_symbol"):
+                piece = _symbol_context(ai_contexts, job["feed_symbol"], category, job["name"], job.get("kr_name"))
+                piece["news"] += f"{context}\n"
+                piece["article_urls"] += [link_data.get("url") for link_data in links if link_data.get("url")]
+            for link_data in links:
+                news_item = {
+                    "title": link_data.get("title"),
+                    "link": link_data.get("url"),
+                    "name": job["name"],
+                    "pubDate": link_data.get("date"),  # [P1 Fix] news_service.py 반환 key는 "date"
+                }
+                if job.get("feed_symbol"):
+                    news_item["symbol"] = job["feed_symbol"]
+                frontend_feed[category].append(news_item)
+                if articles is not None:
+                    articles.append({
+                        "url": news_item["link"], "title": news_item["title"], "date": news_item["pubDate"],
+                        "category": category, "symbol": job.get("feed_symbol"), "name": job["name"],
+                        "sentiment": link_data.get("sentiment"),
+                    })
+        except Exception as e:
+            logger.warning("뉴스 병합 실패 (%s): %s", job["query"], e)
+            continue
 
-    # [B.5] 60일 주가 히스토리 수집 → AI 추세 컨텍스트 주입
-    logger.info("[Step B.5] 주가 추세 컨텍스트 수집 시작")
-    all_symbols = list(MY_PORTFOLIO.keys()) + list(active_watchlist.keys())
+
+def _persist_caches() -> None:
+    """[Step D 후] 다음 실행이 이어받을 로컬 캐시 저장."""
+    get_bm25_index().save()  # 이번 실행 기사까지 반영된 IDF 통계를 다음 실행에 재사용
+    get_recent_index().save()  # 최근 실행 기사 지문 (이전 실행에서 본 기사 집계용)
+
+
+def _trend_symbols(active_watchlist: dict) -> list[str]:
+    return list(MY_PORTFOLIO.keys()) + list(active_watchlist.keys())
+
+
+def _add_trend_contexts(history_panel, all_symbols: list[str], active_name_map: dict, ai_contexts: dict) -> None:
+    """[Step B.5] 히스토리 패널 → 추세 지표 벡터 연산 → 카테고리별 AI 컨텍스트에 추가."""
+    trend_stats = compute_trend_stats(history_panel).to_dict(orient="index")
+    _append_trend_texts(trend_stats, all_symbols, active_name_map, ai_contexts)
+
+
+def _append_trend_texts(trend_stats: dict, all_symbols: list[str], active_name_map: dict, ai_contexts: dict) -> None:
+    """{심볼: 추세 지표} → all_symbols 순서대로 카테고리별 AI 컨텍스트에 추가 (샤드 병합 결과도 같은 경로)."""
     for symbol in all_symbols:
         cat = "portfolio" if symbol in MY_PORTFOLIO else "watchlist"
         info = active_name_map.get(symbol, {"name": symbol})
-        records = get_stock_history(symbol)
-        trend_text = _build_trend_context(symbol, info['name'], records)
+        trend_text = _build_trend_context(symbol, info['name'], trend_stats.get(symbol))
         if trend_text:
             ai_contexts[cat] += trend_text
+            _symbol_context(ai_contexts, symbol, cat, info['name'], info.get('kr_name'))["trend"] = trend_text
 
-    # [C] AI 요약 생성
-    logger.info("[Step C] AI 요약 생성 시작")
-    ai_summaries = {
-        "macro":     generate_ai_summary("글로벌 경제",   ai_contexts["macro"],     category="macro"),
-        "portfolio": generate_ai_summary("내 포트폴리오", ai_contexts["portfolio"], category="portfolio"),
-        "watchlist": generate_ai_summary("관심 종목",    ai_contexts["watchlist"], category="watchlist"),
-    }
 
-    # [D] 최종 데이터 저장
-    logger.info("[Step D] Firebase 저장 시작")
+_SUMMARY_NAMES = {"macro": "글로벌 경제", "portfolio": "내 포트폴리오", "watchlist": "관심 종목"}
+
+
+def _compact_contexts(categories: list[str], ai_contexts: dict) -> None:
+    """
+    [Step C 전] 요약에 쓰일 컨텍스트만 압축 — 종목별 요약 카테고리는 종목별 뉴스, 그 외는 카테고리 컨텍스트.
+    예산은 카테고리 주 모델(폴백 체인 첫 모델)의 입력 토큰 예산 (context_token_budget).
+    입력 한도가 더 작은 모델로 폴백되면 ai_service가 그 모델 예산으로 다시 압축.
+    """
+    if not CONTEXT_COMPACTION_ENABLED:
+        return
+    for cat in categories:
+        budget = context_token_budget(cat)
+        if SYMBOL_SUMMARY_ENABLED and cat != "macro":
+            for symbol, piece in ai_contexts["symbols"].items():
+                if piece["category"] == cat and piece["news"]:
+                    piece["news"] = compact_context(piece["news"], budget, _keep_terms(symbol, piece), label=f"{cat}.symbols")
+            continue
+        ai_contexts[cat] = compact_context(ai_contexts[cat], budget, _category_keep_terms(cat, ai_contexts), label=cat)
+
+
+def _category_keep_terms(cat: str, ai_contexts: dict) -> list[str]:
+    """카테고리 컨텍스트 압축 시 문장을 남길 식별어 — 매크로는 매크로 키워드 단어, 그 외는 카테고리 종목 식별어."""
+    if cat == "macro":
+        return [w for kw in MACRO_KEYWORDS + KR_MACRO_KEYWORDS for w in kw.split() if len(w) >= 2]
+    return [t for symbol, p in ai_contexts["symbols"].items() if p["category"] == cat
+            for t in _keep_terms(symbol, p)]
+
+
+def _summary_jobs(categories: list[str], ai_contexts: dict, frontend_feed: dict) -> dict:
+    """
+    generate_ai_summaries 작업 구성. 기사 URL 집합 → SUMMARY_CACHE_MODE="urls"일 때 near-duplicate 요약 재사용 키.
+    SYMBOL_SUMMARY_ENABLED면 포트폴리오·관심종목은 종목별 컨텍스트("symbols")로 요약 → 카테고리 요약 조립.
+    요약 전에 컨텍스트 압축 (_compact_contexts). keep_terms → 작은 폴백 모델용 재압축 기준.
+    """
+    _compact_contexts(categories, ai_contexts)
+    jobs = {}
+    for cat in categories:
+        jobs[cat] = {
+            "stock_name": _SUMMARY_NAMES[cat], "context": ai_contexts[cat],
+            "article_urls": [n["link"] for n in frontend_feed[cat] if n.get("link")],
+            "keep_terms": _category_keep_terms(cat, ai_contexts),
+        }
+        if SYMBOL_SUMMARY_ENABLED and cat != "macro":
+            jobs[cat]["symbols"] = {s: p for s, p in ai_contexts["symbols"].items() if p["category"] == cat}
+    return jobs
+
+
+def _build_final_data(now_str: str, collected_indices: dict, ai_summaries: dict, frontend_feed: dict,
+                      stock_data_map: dict, active_watchlist: dict) -> dict:
     final_data = {
         "updated_at": now_str,
         "market_indices": collected_indices["market_indices"],
@@ -206,17 +346,387 @@ def run_sync_engine_once():
         final_data["stock_data"] = stock_data_map
     else:
         logger.warning("[Step D] stock_data 비어있음 — 기존 Firebase 데이터 보존")
+    return final_data
 
-    db_svc.save_final_feed(final_data)
 
+def _price_records(history_panel, all_symbols: list[str]) -> list[dict]:
+    # 포트폴리오·관심 종목에 같은 심볼이 있으면 한 번만
+    return [r for symbol in dict.fromkeys(all_symbols) for r in panel_to_records(history_panel, symbol)]
+
+
+def _archive_run(db_svc, articles: list[dict], price_records: list[dict], ai_summaries: dict) -> None:
+    """[Step D] 정규화 아카이브 테이블 적재 — 실패해도 피드 저장 결과에 영향 없음."""
+    try:
+        db_svc.archive_run(articles, price_records, ai_summaries)
+    except Exception as e:
+        logger.warning("아카이브 적재 실패: %s", e)
+
+
+def _log_run_stats(frontend_feed: dict) -> None:
     p_count = len(frontend_feed['portfolio'])
     w_count = len(frontend_feed['watchlist'])
     logger.info("[Success] Sync Complete. News: Port(%d), Watch(%d)", p_count, w_count)
+    logger.info("Rate limit 대기 집계: %s", rate_limiter.get_wait_stats())
+    logger.info("뉴스 캐시 집계: %s", get_news_cache().get_stats())
+    logger.info("감성 점수 캐시 집계: %s", get_sentiment_stats())
+    logger.info("HTTP 연결 집계 (opened/reused): %s", get_connection_stats())
+    logger.info("AI 요약 캐시 집계: %s", get_summary_cache_stats())
+    logger.info("컨텍스트 압축 집계: %s", get_compaction_stats())
+    logger.info("AI 모델 응답 지연: %s (헤지 %d회)", get_latency_stats(), get_hedge_count())
+    if SCHEDULER_ENABLED:
+        logger.info("종목 뉴스 스케줄 집계: %s", get_scheduler().get_stats())
+
+
+def _load_watchlist(db_svc) -> tuple[dict, dict]:
+    """동적 Watchlist 로드 (Supabase DB). 미설정이거나 비어있으면 tickers.py 폴백 → (watchlist, name_map)."""
+    dynamic_watchlist = db_svc.get_all_watchlist_symbols()
+    active_watchlist = dynamic_watchlist if dynamic_watchlist else WATCHLIST
+    # NAME_MAP 업데이트: 동적 watchlist 심볼 포함
+    return active_watchlist, {**NAME_MAP, **active_watchlist}
+
+
+def _finish_run_report(final_data: dict) -> dict:
+    """실행 타이밍 요약을 final_data["perf_summary"]에 담고 반환 (저장 전 호출 — Step D 자체는 제외)."""
+    report = tracing.build_report()
+    final_data["perf_summary"] = tracing.summarize(report)
+    return report
+
+
+def _write_run_report() -> None:
+    """Step D까지 포함한 전체 span 리포트를 JSON으로 저장하고 단계별 소요 시간을 로그로 남김."""
+    report = tracing.build_report()
+    path = tracing.write_report(report)
+    logger.info("단계별 소요 시간(s): %s — 전체 %.1fs, 리포트: %s", report["steps"], report["total_seconds"], path)
+
+
+def run_sync_engine_once():
+    logger.info("[Start] Data Sync at %s", datetime.now())
+
+    tracing.start_run()
+    rate_limiter.reset_wait_stats()
+    reset_connection_stats()
+    reset_compaction_stats()
+    reset_hedge_count()
+    db_svc = DBService()
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with tracing.span("watchlist"):
+        active_watchlist, active_name_map = _load_watchlist(db_svc)
+
+    # [A] 지수 및 주요 지표 업데이트
+    logger.info("[Step A] 지수 및 주요 지표 수집 시작")
+    with tracing.span("A"):
+        market_snapshot = get_market_snapshot(_snapshot_symbols(active_watchlist))
+        collected_indices = _collect_indices(db_svc, market_snapshot, now_str)
+
+    # [B] 뉴스 데이터 수집 및 구조화
+    logger.info("[Step B] 뉴스 데이터 수집 시작")
+    frontend_feed = { "portfolio": [], "watchlist": [], "macro": [] }
+    ai_contexts = _new_ai_contexts()
+    articles: list[dict] = []
+    with tracing.span("B"):
+        # 작업 목록 순서가 곧 병합 순서 (매크로 → 한국 거시 → 종목)
+        stock_jobs, stock_data_map = _stock_news_jobs(market_snapshot, active_name_map, active_watchlist)
+        plan = _plan_stock_news(stock_jobs, market_snapshot, active_watchlist)
+        macro_jobs = _macro_news_jobs()
+        # 병렬 수집 (프로바이더별 동시성 제한) → 작업 순서대로 결정적 병합
+        started = time.perf_counter()
+        fetched = fetch_news_batch(macro_jobs + plan.fetch_jobs)
+        stock_results = _finish_stock_news(plan, fetched[len(macro_jobs):], time.perf_counter() - started)
+        deduper = FeedDeduper(get_recent_index())
+        _merge_news(macro_jobs + stock_jobs, fetched[:len(macro_jobs)] + stock_results, frontend_feed, ai_contexts,
+                    articles, deduper)
+        logger.info("피드 중복 제거: %s", deduper.stats)
+
+    # [B.5] 60일 주가 히스토리 수집 → AI 추세 컨텍스트 주입
+    logger.info("[Step B.5] 주가 추세 컨텍스트 수집 시작")
+    with tracing.span("B.5"):
+        all_symbols = _trend_symbols(active_watchlist)
+        # 전 종목 60일 OHLCV 1회 일괄 수집 → 추세 지표 벡터 연산
+        history_panel = get_history_panel(all_symbols)
+        _add_trend_contexts(history_panel, all_symbols, active_name_map, ai_contexts)
+
+    # [C] AI 요약 생성
+    logger.info("[Step C] AI 요약 생성 시작")
+    with tracing.span("C"):
+        ai_summaries = generate_ai_summaries(_summary_jobs(["macro", "portfolio", "watchlist"], ai_contexts, frontend_feed))
+
+    # [D] 최종 데이터 저장
+    logger.info("[Step D] Firebase 저장 시작")
+    with tracing.span("D"):
+        final_data = _build_final_data(now_str, collected_indices, ai_summaries, frontend_feed,
+                                       stock_data_map, active_watchlist)
+        _finish_run_report(final_data)
+        db_svc.save_final_feed(final_data)
+    with tracing.span("D.archive"):
+        _archive_run(db_svc, articles, _price_records(history_panel, all_symbols), ai_summaries)
+    _persist_caches()
+    _log_run_stats(frontend_feed)
+    _write_run_report()
+
+
+async def run_sync_engine_once_async():
+    """
+    run_sync_engine_once()의 asyncio DAG 버전 — 데이터 의존성이 허용하는 범위에서 단계를 겹쳐 실행합니다.
+    블로킹 서비스 호출은 asyncio.to_thread로 실행하며 결과 구조·병합 순서는 동기 버전과 동일합니다.
+
+    의존 관계:
+      watchlist ─┬─────────────────────────────→ 히스토리 패널 ─┐
+      스냅샷 ────┴→ 지수(A) / 종목 뉴스 작업 → 종목 뉴스 ───────┴→ 포트폴리오·관심 종목 요약 ─┐
+      매크로 뉴스 (즉시 시작) → 병합·중복 제거 → 매크로 요약 (종목 뉴스 수집 중에 시작) ───────┴→ 저장(D)
+    중복 제거는 병합 순서(매크로 → 종목)로 진행되어 매크로 기사 집합은 매크로 결과만으로 확정 —
+    매크로 요약 작업(컨텍스트·기사 URL 캐시 키)이 동기 버전과 같습니다.
+    단계 span은 겹쳐 기록되므로 리포트의 start 오프셋으로 병행 구간을 확인할 수 있습니다.
+    """
+    logger.info("[Start] Data Sync (async) at %s", datetime.now())
+
+    tracing.start_run()
+    rate_limiter.reset_wait_stats()
+    reset_connection_stats()
+    reset_compaction_stats()
+    reset_hedge_count()
+    db_svc = DBService()
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    frontend_feed = { "portfolio": [], "watchlist": [], "macro": [] }
+    ai_contexts = _new_ai_contexts()
+    articles: list[dict] = []
+
+    async def traced(name: str, func, *args):
+        with tracing.span(name):
+            return await asyncio.to_thread(func, *args)
+
+    # 의존성 없는 루트 노드 동시 시작
+    watchlist_task = asyncio.create_task(traced("watchlist", _load_watchlist, db_svc))
+    # 스케줄러는 동적 watchlist 심볼 시세가 필요 — 이 경우에만 스냅샷을 watchlist 로드 뒤에 시작
+    snapshot_task = (None if SCHEDULER_ENABLED else
+                     asyncio.create_task(traced("A.snapshot", get_market_snapshot, _snapshot_symbols())))
+    macro_jobs = _macro_news_jobs()
+    macro_news_task = asyncio.create_task(traced("B.macro", fetch_news_batch, macro_jobs))
+    deduper = FeedDeduper(get_recent_index())
+    macro_merged = asyncio.Event()
+
+    async def macro_summary():
+        # 매크로 작업은 병합 순서상 맨 앞 — 종목 뉴스를 기다리지 않고 병합·중복 제거 후 바로 요약 시작
+        try:
+            _merge_news(macro_jobs, await macro_news_task, frontend_feed, ai_contexts, articles, deduper)
+        finally:
+            macro_merged.set()
+        logger.info("[Step C] 매크로 AI 요약 생성 시작 (종목 단계와 병행)")
+        return await traced("C.macro", generate_ai_summaries, _summary_jobs(["macro"], ai_contexts, frontend_feed))
+
+    macro_summary_task = asyncio.create_task(macro_summary())
+
+    active_watchlist, active_name_map = await watchlist_task
+    if snapshot_task is None:
+        snapshot_task = asyncio.create_task(
+            traced("A.snapshot", get_market_snapshot, _snapshot_symbols(active_watchlist))
+        )
+    all_symbols = _trend_symbols(active_watchlist)
+    history_task = asyncio.create_task(traced("B.5.history", get_history_panel, all_symbols))
+
+    logger.info("[Step A] 지수 및 주요 지표 수집")
+    market_snapshot = await snapshot_task
+    collected_indices = _collect_indices(db_svc, market_snapshot, now_str)
+
+    logger.info("[Step B] 종목 뉴스 데이터 수집 시작")
+    stock_jobs, stock_data_map = _stock_news_jobs(market_snapshot, active_name_map, active_watchlist)
+    plan = _plan_stock_news(stock_jobs, market_snapshot, active_watchlist)
+    started = time.perf_counter()
+    fetched = await traced("B.stocks", fetch_news_batch, plan.fetch_jobs)
+    stock_results = _finish_stock_news(plan, fetched, time.perf_counter() - started)
+    # 동기 버전과 같은 병합 순서 (매크로 → 종목) — 종목 기사는 매크로 기사와 겹치면 제거
+    await macro_merged.wait()
+    _merge_news(stock_jobs, stock_results, frontend_feed, ai_contexts, articles, deduper)
+    logger.info("피드 중복 제거: %s", deduper.stats)
+
+    logger.info("[Step B.5] 주가 추세 컨텍스트 주입")
+    history_panel = await history_task
+    _add_trend_contexts(history_panel, all_symbols, active_name_map, ai_contexts)
+
+    logger.info("[Step C] 포트폴리오·관심 종목 AI 요약 생성 시작")
+    stock_summaries = await traced(
+        "C.stocks", generate_ai_summaries, _summary_jobs(["portfolio", "watchlist"], ai_contexts, frontend_feed)
+    )
+    ai_summaries = {**(await macro_summary_task), **stock_summaries}
+
+    logger.info("[Step D] Firebase 저장 시작")
+    final_data = _build_final_data(now_str, collected_indices, ai_summaries, frontend_feed,
+                                   stock_data_map, active_watchlist)
+    _finish_run_report(final_data)
+    await traced("D", db_svc.save_final_feed, final_data)
+    await traced("D.archive", _archive_run, db_svc, articles, _price_records(history_panel, all_symbols), ai_summaries)
+    _persist_caches()
+    _log_run_stats(frontend_feed)
+    _write_run_report()
+
+
+def run_shard_worker(task: dict) -> dict:
+    """
+    [샤드 워커] 코디네이터가 배정한 종목 뉴스 작업·추세 심볼만 처리하고 부분 결과를 저장소에 기록합니다.
+    Step C/D는 코디네이터가 병합 후 수행 — 반환값은 로그용 요약입니다.
+    """
+    logger.info("[Shard %d/%d] 뉴스 %d건, 추세 %d종목", task["shard_id"], task["shard_count"],
+                len(task["jobs"]), len(task["symbols"]))
+    tracing.start_run()
+    rate_limiter.reset_wait_stats()
+    reset_connection_stats()
+    # 워커들이 같은 API 키로 동시에 호출 — 합산 호출률이 config/limits.py 설정을 넘지 않도록 버킷 축소
+    rate_limiter.set_scale(1 / task["workers"])
+    try:
+        with tracing.span("B"):
+            news_results = fetch_news_batch(task["jobs"])
+        with tracing.span("B.5"):
+            history_panel = get_history_panel(task["symbols"])
+            trend_stats = compute_trend_stats(history_panel).to_dict(orient="index")
+            price_records = _price_records(history_panel, task["symbols"])
+    finally:
+        rate_limiter.set_scale(1.0)  # warm 컨테이너가 다음에 코디네이터로 호출될 수 있음
+
+    perf_summary = tracing.summarize(tracing.build_report())
+    shard_service.put_result(task["store"], task["run_id"], task["shard_id"], {
+        "news": [[job["index"], context, links] for job, (context, links) in zip(task["jobs"], news_results)],
+        "trend_stats": trend_stats,
+        "price_records": price_records,
+        "perf_summary": perf_summary,
+    })
+    return {"jobs": len(task["jobs"]), "symbols": len(task["symbols"]), "steps": perf_summary.get("steps")}
+
+
+def _merge_shard_results(stock_jobs: list[dict], all_symbols: list[str], partials: dict[int, dict]) -> tuple:
+    """
+    샤드 부분 결과 → (작업 순서대로 복원한 종목 뉴스 결과, {심볼: 추세 지표}, 심볼 순서 일봉 레코드).
+    결과가 없는 샤드의 작업은 빈 결과로 채워 병합 단계가 그대로 건너뜁니다.
+    """
+    news_results: list[tuple[str, list[dict]]] = [("", [])] * len(stock_jobs)
+    trend_stats: dict[str, dict] = {}
+    records_by_symbol: dict[str, list[dict]] = {}
+    for shard_id, payload in sorted(partials.items()):
+        try:  # 샤드 하나의 손상된 결과가 전체 병합을 중단하지 않도록
+            for index, context, links in payload.get("news", []):
+                news_results[index] = (context, links)
+            trend_stats.update(payload.get("trend_stats", {}))
+            for record in payload.get("price_records", []):
+                records_by_symbol.setdefault(record["symbol"], []).append(record)
+        except Exception as e:
+            logger.warning("샤드 %d 결과 병합 실패: %s", shard_id, e)
+            continue
+    price_records = [r for symbol in dict.fromkeys(all_symbols) for r in records_by_symbol.get(symbol, [])]
+    return news_results, trend_stats, price_records
+
+
+def run_sync_engine_sharded(shard_count: int | None = None, dispatch: str | None = None,
+                            initializer=None, initargs: tuple = ()):
+    """
+    run_sync_engine_once()의 샤딩 버전 — watchlist 규모에 비례하는 종목 뉴스(Step B)·주가 추세(Step B.5)를
+    심볼 consistent-hash 샤드로 나눠 워커(프로세스 또는 Lambda 호출)에서 병렬 처리합니다.
+    지수·매크로 뉴스·요약·저장은 코디네이터가 수행하고, 병합 결과의 구조·순서는 단일 실행과 동일합니다.
+
+    initializer/initargs: dispatch="process"일 때 워커 프로세스 초기화 (벤치마크 스텁 설치 등)
+    """
+    shard_count = shard_count or SHARD_COUNT
+    dispatch = dispatch or SHARD_DISPATCH
+    logger.info("[Start] Data Sync (sharded x%d, %s) at %s", shard_count, dispatch, datetime.now())
+
+    tracing.start_run()
+    rate_limiter.reset_wait_stats()
+    reset_connection_stats()
+    reset_compaction_stats()
+    reset_hedge_count()
+    db_svc = DBService()
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    run_id = f"{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+    with tracing.span("watchlist"):
+        active_watchlist, active_name_map = _load_watchlist(db_svc)
+
+    logger.info("[Step A] 지수 및 주요 지표 수집 시작")
+    with tracing.span("A"):
+        market_snapshot = get_market_snapshot(_snapshot_symbols(active_watchlist))
+        collected_indices = _collect_indices(db_svc, market_snapshot, now_str)
+
+    logger.info("[Step B] 뉴스·추세 샤드 분배 시작")
+    frontend_feed = { "portfolio": [], "watchlist": [], "macro": [] }
+    ai_contexts = _new_ai_contexts()
+    articles: list[dict] = []
+    with tracing.span("B"):
+        stock_jobs, stock_data_map = _stock_news_jobs(market_snapshot, active_name_map, active_watchlist)
+        all_symbols = _trend_symbols(active_watchlist)
+        plan = _plan_stock_news(stock_jobs, market_snapshot, active_watchlist)
+        store = shard_service.store_config(run_id)
+        tasks = shard_service.plan_shards(run_id, plan.fetch_jobs, all_symbols, shard_count, store)
+        logger.info("샤드 배정 (뉴스, 추세): %s", {t["shard_id"]: (len(t["jobs"]), len(t["symbols"])) for t in tasks})
+
+        # 매크로 뉴스는 심볼과 무관 — 워커가 도는 동안 코디네이터에서 수집.
+        # 코디네이터도 같은 API 키로 동시에 호출하므로 워커와 같은 배율(1/참여자 수)로 버킷 축소
+        macro_jobs = _macro_news_jobs()
+        rate_limiter.set_scale(1 / tasks[0]["workers"] if tasks else 1.0)
+        try:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="macro") as pool:
+                macro_future = pool.submit(fetch_news_batch, macro_jobs)
+                with tracing.span("B.shards"):
+                    statuses = shard_service.dispatch_shards(run_shard_worker, tasks, dispatch, initializer, initargs)
+                macro_results = macro_future.result()
+        finally:
+            rate_limiter.set_scale(1.0)   # Step C 요약 호출은 코디네이터 단독 — 원래 한도
+
+        partials = shard_service.load_results(store, run_id)
+        shard_service.clear_results(store, run_id)
+        for shard_id, status in statuses.items():
+            logger.info("샤드 %d: %s", shard_id, status)
+        missing = sorted(set(statuses) - set(partials))
+        if missing:
+            logger.warning("샤드 결과 누락 %s — 해당 종목 뉴스·추세 없이 병합", missing)
+
+        fetched, trend_stats, price_records = _merge_shard_results(plan.fetch_jobs, all_symbols, partials)
+        # 작업당 소요 시간 추정용 — 샤드들이 동시에 수집하므로 가장 늦은 샤드의 뉴스 단계 시간
+        news_seconds = max((st["result"]["steps"].get("B", 0.0) for st in statuses.values()
+                            if st["ok"] and st["result"].get("steps")), default=0.0)
+        stock_results = _finish_stock_news(plan, fetched, news_seconds)
+        # 단일 실행과 같은 병합 순서 (매크로 → 한국 거시 → 종목)
+        deduper = FeedDeduper(get_recent_index())
+        _merge_news(macro_jobs + stock_jobs, macro_results + stock_results, frontend_feed, ai_contexts,
+                    articles, deduper)
+        logger.info("피드 중복 제거: %s", deduper.stats)
+
+    logger.info("[Step B.5] 주가 추세 컨텍스트 병합")
+    with tracing.span("B.5"):
+        _append_trend_texts(trend_stats, all_symbols, active_name_map, ai_contexts)
+
+    logger.info("[Step C] AI 요약 생성 시작")
+    with tracing.span("C"):
+        ai_summaries = generate_ai_summaries(_summary_jobs(["macro", "portfolio", "watchlist"], ai_contexts, frontend_feed))
+
+    logger.info("[Step D] Firebase 저장 시작")
+    with tracing.span("D"):
+        final_data = _build_final_data(now_str, collected_indices, ai_summaries, frontend_feed,
+                                       stock_data_map, active_watchlist)
+        _finish_run_report(final_data)
+        db_svc.save_final_feed(final_data)
+    with tracing.span("D.archive"):
+        _archive_run(db_svc, articles, price_records, ai_summaries)
+    _persist_caches()
+    _log_run_stats(frontend_feed)
+    _write_run_report()
+
+
+def _run_engine(engine: str) -> None:
+    if engine == "async":
+        asyncio.run(run_sync_engine_once_async())
+    elif engine == "sharded":
+        run_sync_engine_sharded()
+    else:
+        run_sync_engine_once()
+
 
 def lambda_handler(event, context):
     logger.info("AWS Lambda 환경에서 동기화 엔진을 시작합니다.")  # [P6 Fix] print → logging
+    # 실행 경로 선택: event["engine"] > SYNC_ENGINE 환경 변수 > "sync"
+    engine = ((event or {}).get("engine") if isinstance(event, dict) else None) or os.getenv("SYNC_ENGINE", "sync")
     try:
-        run_sync_engine_once()
+        # 샤드 워커 호출 (engine="sharded" + SHARD_DISPATCH="lambda"의 코디네이터가 호출)
+        if engine == "shard_worker":
+            return {'statusCode': 200, 'body': run_shard_worker(event["task"])}
+        # SYNC_PROFILE=1 이면 실행 전체 cProfile 덤프
+        with tracing.maybe_profile():
+            _run_engine(engine)
         return {
             'statusCode': 200,
             'body': '데이터 동기화 완료'
@@ -227,4 +737,6 @@ def lambda_handler(event, context):
 
 
 if __name__ == "__main__":
-    run_sync_engine_once()
+    # 로컬 실행: SYNC_ENGINE=sharded 이면 프로세스 풀이 샤드 워커 Lambda 호출을 대신함
+    with tracing.maybe_profile():
+        _run_engine(os.getenv("SYNC_ENGINE", "sync"))
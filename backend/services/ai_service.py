@@ -1,14 +1,42 @@
 import os
 import re
 import json
+import time
+import bisect
+import hashlib
 import logging
-from openai import OpenAI, RateLimitError  # [P5 Fix] RateLimitError 타입 임포트
+import threading
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 
 try:
-    from backend.config.models import MODEL_CONFIG, MAX_TOKENS, TEMPERATURE
+    from backend.config.models import (
+        MODEL_CONFIG, MAX_TOKENS, TEMPERATURE, SUMMARY_DEADLINE_SECONDS,
+        HEDGE_ENABLED, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_DEFAULT_DELAY_SECONDS,
+        HEDGE_MIN_DELAY_SECONDS, HEDGE_MAX_DELAY_SECONDS, HEDGE_MAX_PER_RUN,
+        SYMBOL_BATCH_INPUT_TOKENS, SYMBOL_SUMMARY_OUTPUT_TOKENS, SYMBOL_BULLETS_PER_SYMBOL, SYMBOL_MAX_SHARED_ITEMS,
+        MODEL_INPUT_TOKENS, MODEL_INPUT_TOKENS_DEFAULT, COMPACTION_MIN_CONTEXT_TOKENS, CONTEXT_COMPACTION_ENABLED,
+    )
+    from backend.config.cache import SUMMARY_CACHE_MODE
+    from backend.services import rate_limiter, tracing
+    from backend.services.cache_service import get_summary_cache
+    from backend.services.compaction_service import compact_context
+    from backend.services.token_counter import count_tokens, truncate_tokens
 except ModuleNotFoundError:
-    from config.models import MODEL_CONFIG, MAX_TOKENS, TEMPERATURE
+    from config.models import (
+        MODEL_CONFIG, MAX_TOKENS, TEMPERATURE, SUMMARY_DEADLINE_SECONDS,
+        HEDGE_ENABLED, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_DEFAULT_DELAY_SECONDS,
+        HEDGE_MIN_DELAY_SECONDS, HEDGE_MAX_DELAY_SECONDS, HEDGE_MAX_PER_RUN,
+        SYMBOL_BATCH_INPUT_TOKENS, SYMBOL_SUMMARY_OUTPUT_TOKENS, SYMBOL_BULLETS_PER_SYMBOL, SYMBOL_MAX_SHARED_ITEMS,
+        MODEL_INPUT_TOKENS, MODEL_INPUT_TOKENS_DEFAULT, COMPACTION_MIN_CONTEXT_TOKENS, CONTEXT_COMPACTION_ENABLED,
+    )
+    from config.cache import SUMMARY_CACHE_MODE
+    from services import rate_limiter, tracing
+    from services.cache_service import get_summary_cache
+    from services.compaction_service import compact_context
+    from services.token_counter import count_tokens, truncate_tokens
 
 load_dotenv()
 
@@ -17,43 +45,65 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # =============================================================================
-# OpenAI 호환 클라이언트 초기화
+# OpenAI 호환 클라이언트 설정
 # Groq와 Gemini 모두 OpenAI API 형식을 지원하므로 base_url만 달리해 통합합니다.
+# 클라이언트는 첫 모델 호출 시 생성 (_get_client) — openai 패키지 import(~0.7s)를
+# cold start 초기화에서 제외하고, 요약 캐시 hit 실행에서는 아예 로드하지 않음. warm start 시 재사용.
 # =============================================================================
-_GROQ_CLIENT = OpenAI(
-    api_key=os.getenv("GROQ_API_KEY", ""),
-    base_url="https://api.groq.com/openai/v1",
-) if os.getenv("GROQ_API_KEY") else None
+_CLIENT_CONFIG: dict[str, tuple[str, str]] = {
+    "groq":   ("GROQ_API_KEY", "https://api.groq.com/openai/v1"),
+    "gemini": ("GEMINI_API_KEY", "https://generativelanguage.googleapis.com/v1beta/openai/"),
+}
+_clients: dict = {}
+_clients_lock = threading.Lock()
 
-_GEMINI_CLIENT = OpenAI(
-    api_key=os.getenv("GEMINI_API_KEY", ""),
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-) if os.getenv("GEMINI_API_KEY") else None
+for _env_key, _ in _CLIENT_CONFIG.values():
+    if not os.getenv(_env_key):
+        logger.error(f"❌ {_env_key}가 설정되지 않았습니다.")
 
-if not _GROQ_CLIENT:
-    logger.error("❌ GROQ_API_KEY가 설정되지 않았습니다.")
-if not _GEMINI_CLIENT:
-    logger.error("❌ GEMINI_API_KEY가 설정되지 않았습니다.")
+
+def _get_client(provider: str):
+    """프로바이더(groq/gemini) OpenAI 호환 클라이언트 — 최초 1회 생성 후 재사용. 키 미설정 시 예외."""
+    with _clients_lock:
+        if provider not in _clients:
+            env_key, base_url = _CLIENT_CONFIG[provider]
+            api_key = os.getenv(env_key)
+            if not api_key:
+                raise Exception(f"{env_key}가 없습니다.")
+            from openai import OpenAI
+            _clients[provider] = OpenAI(api_key=api_key, base_url=base_url)
+        return _clients[provider]
 
 # Lambda 실행 내 429 초과 모델을 기억 → 같은 세션에서 재시도 방지
+# 카테고리 병렬 생성 시 여러 스레드가 공유하므로 반드시 _quota_lock 아래에서 접근
 _quota_exceeded_models: set = set()
+_quota_lock = threading.Lock()
+
+
+def _is_quota_exceeded(model_name: str) -> bool:
+    with _quota_lock:
+        return model_name in _quota_exceeded_models
+
+
+def _mark_quota_exceeded(model_name: str) -> None:
+    with _quota_lock:
+        _quota_exceeded_models.add(model_name)
+
+# 프롬프트(_build_prompts) 변경 시 올릴 것 — AI 요약 캐시 키에 포함되어 이전 결과를 무효화
+PROMPT_VERSION: str = "2026-03-23.v3"
+# 종목별 배치 프롬프트(_build_batch_prompts) 버전 — 종목별 요약 캐시 키에 포함
+SYMBOL_PROMPT_VERSION: str = "2026-10-18.v1"
 
 
 def _get_client_and_model(model_name: str):
     """
     모델 이름의 prefix로 클라이언트와 실제 API 모델명을 분리합니다.
-      "groq/<model>"   → _GROQ_CLIENT   + "<model>"
-      "gemini/<model>" → _GEMINI_CLIENT + "<model>"
+      "groq/<model>"   → groq 클라이언트   + "<model>"
+      "gemini/<model>" → gemini 클라이언트 + "<model>"
     """
-    if model_name.startswith("groq/"):
-        if not _GROQ_CLIENT:
-            raise Exception("GROQ_API_KEY가 없습니다.")
-        return _GROQ_CLIENT, model_name[len("groq/"):]
-
-    if model_name.startswith("gemini/"):
-        if not _GEMINI_CLIENT:
-            raise Exception("GEMINI_API_KEY가 없습니다.")
-        return _GEMINI_CLIENT, model_name[len("gemini/"):]
+    provider, _, api_model = model_name.partition("/")
+    if provider in _CLIENT_CONFIG and api_model:
+        return _get_client(provider), api_model
 
     raise ValueError(f"알 수 없는 모델 prefix: {model_name}")
 
@@ -64,32 +114,37 @@ def _parse_json_response(raw: str) -> dict | None:
     - 코드블록(```json ... ```) 제거 후 json.loads() 시도
     - 실패 시 None 반환 (호출자가 문자열 폴백 처리)
     """
+    parsed = _load_json(raw)
+    return parsed if _is_summary(parsed) else None
+
+
+def _parse_batch_response(raw: str) -> dict | None:
+    """배치 응답 {종목 ID: 요약} 중 형식이 올바른 종목만 추출 (하나도 없으면 None → 다음 모델로)."""
+    parsed = _load_json(raw)
+    if not isinstance(parsed, dict):
+        return None
+    summaries = {str(symbol): value for symbol, value in parsed.items() if _is_summary(value)}
+    return summaries or None
+
+
+def _load_json(raw: str):
     # 코드블록 제거: ```json ... ``` 또는 ``` ... ```
     cleaned = re.sub(r"```(?:json)?\s*", "", raw).replace("```", "").strip()
     try:
-        parsed = json.loads(cleaned)
-        # 필수 키 검증 (신규 3단 구조 또는 구버전 형식 모두 허용)
-        if isinstance(parsed, dict) and "market_reaction" in parsed and (
-            "bullets" in parsed or "key_event" in parsed
-        ):
-            return parsed
-        return None
+        return json.loads(cleaned)
     except (json.JSONDecodeError, ValueError):
         return None
 
 
-def generate_ai_summary(stock_name: str, context: str, category: str = "watchlist") -> dict | str:
-    """
-    카테고리별 최적 모델로 AI 브리핑을 생성합니다.
-    - 모델 우선순위: backend/config/models.py 에서 설정
-    - category: "macro" | "portfolio" | "watchlist"
-    - 반환값: JSON 파싱 성공 시 dict, 실패 시 원본 문자열 (하위 호환 폴백)
-    """
-    if not context:
-        return "최근 24시간 내 관련된 중요 뉴스 데이터가 없습니다."
+def _is_summary(parsed) -> bool:
+    # 필수 키 검증 (신규 3단 구조 또는 구버전 형식 모두 허용)
+    return isinstance(parsed, dict) and "market_reaction" in parsed and (
+        "bullets" in parsed or "key_event" in parsed
+    )
+
 
-    # 환각 방지 + JSON 전용 출력 시스템 프롬프트
-    system_prompt = """당신은 월스트리트의 시니어 주식 애널리스트입니다.
+# 환각 방지 + JSON 전용 출력 시스템 프롬프트 (단일·배치 프롬프트 공통)
+_SYSTEM_PROMPT = """당신은 월스트리트의 시니어 주식 애널리스트입니다.
 당신의 유일한 목표는 제공된 [뉴스 원문]에서 '팩트'와 '수치'만을 추출하여 투자자에게 객관적인 브리핑을 제공하는 것입니다.
 [절대 규칙 - 위반 시 페널티]
 1. 환각 금지: 제공된 [뉴스 원문]에 없는 정보나 과거 지식은 절대 지어내지 마십시오.
@@ -103,91 +158,630 @@ def generate_ai_summary(stock_name: str, context: str, category: str = "watchlis
 - bullets: key_event/expected_impact에서 다루지 않은 세부 수치·보조 정보만 (부연 설명 위주, 최대 3개)
   ※ key_event/expected_impact와 내용이 겹치는 bullets는 작성하지 말 것"""
 
-    user_prompt = f"""
-    [분석 대상 종목]: {stock_name}
-
-    [뉴스 데이터]
-    {context}
-    [임무]
-    위 뉴스들을 분석하여 '{stock_name}'에 대한 투자자용 브리핑을 다음 JSON 형식으로 작성하세요.
-
-    [출력 형식 - 순수 JSON만, 코드블록 없이]
-    {{
+# 요약 1건의 JSON 형식 + 필드 작성 규칙 (_parse_json_response 필수 키와 일치)
+_SUMMARY_SCHEMA = """{
       "key_event": "핵심 사건 1-2문장 (수치/날짜 포함). 없으면 빈 문자열.",
       "expected_impact": "주가·시장 예상 영향 1-2문장. 없으면 빈 문자열.",
       "reference_indicators": ["투자자가 확인해야 할 지표1", "지표2", "지표3"],
       "bullets": ["key_event/expected_impact와 겹치지 않는 보조 수치·세부정보 1", "보조정보 2"],
-      "market_reaction": {{
+      "market_reaction": {
         "verdict": "호재 또는 악재 또는 중립",
         "reason": "단기 주가 영향 이유 한 문장"
-      }},
+      },
       "trend_insight": "주가 추세 데이터 기반 1-2문장 또는 추세 데이터 없음",
       "glossary_terms": [
-        {{"term": "용어명", "definition": "한 줄 정의"}}
+        {"term": "용어명", "definition": "한 줄 정의"}
       ],
       "flow_explanation": "원인 → 결과 → 영향 흐름 1-2문장"
-    }}
+    }"""
 
-    - key_event/expected_impact: 제공된 뉴스에서 팩트만. 없으면 "" 반환.
+_SCHEMA_RULES = """    - key_event/expected_impact: 제공된 뉴스에서 팩트만. 없으면 "" 반환.
     - reference_indicators: 투자자가 추가로 확인해야 할 경제·기업 지표 2-4개. 없으면 [] 반환.
     - bullets: key_event/expected_impact에서 이미 언급한 내용 제외, 보조 수치·세부 정보만. 없으면 [] 반환.
     - glossary_terms: 투자자가 모를 수 있는 금융·경제 용어 2-3개, 한 줄 정의. 없으면 [] 반환.
     - flow_explanation: 인과관계 흐름 1-2문장. 없으면 "" 반환.
     """
 
+
+def _build_prompts(stock_name: str, context: str) -> tuple[str, str]:
+    """(system_prompt, user_prompt) 생성. 내용 변경 시 PROMPT_VERSION을 올려 요약 캐시를 무효화하세요."""
+    user_prompt = f"""
+    [분석 대상 종목]: {stock_name}
+
+    [뉴스 데이터]
+    {context}
+    [임무]
+    위 뉴스들을 분석하여 '{stock_name}'에 대한 투자자용 브리핑을 다음 JSON 형식으로 작성하세요.
+
+    [출력 형식 - 순수 JSON만, 코드블록 없이]
+    {_SUMMARY_SCHEMA}
+
+{_SCHEMA_RULES}"""
+    return _SYSTEM_PROMPT, user_prompt
+
+
+_prompt_overhead: dict[bool, int] = {}
+
+
+def model_token_budget(model_name: str, batch: bool = False) -> int:
+    """
+    모델 1개의 컨텍스트 입력 토큰 예산 — MODEL_INPUT_TOKENS에서 프롬프트 고정 부분(시스템 프롬프트·JSON 형식 안내)
+    토큰을 뺀 값. batch=True면 종목 배치 프롬프트 기준.
+    """
+    if batch not in _prompt_overhead:
+        prompts = _build_batch_prompts([], []) if batch else _build_prompts("", "")
+        _prompt_overhead[batch] = sum(count_tokens(p) for p in prompts)
+    limit = MODEL_INPUT_TOKENS.get(model_name, MODEL_INPUT_TOKENS_DEFAULT)
+    return max(COMPACTION_MIN_CONTEXT_TOKENS, limit - _prompt_overhead[batch])
+
+
+def context_token_budget(category: str, batch: bool = False) -> int:
+    """
+    카테고리 컨텍스트 입력 토큰 예산 — 폴백 체인(MODEL_CONFIG) 첫 모델(주 모델)의 model_token_budget.
+    입력 한도가 더 작은 폴백 모델은 호출 직전에 그 모델 예산으로 다시 압축 (_prompts_per_model).
+    """
     models = MODEL_CONFIG.get(category, MODEL_CONFIG["watchlist"])
+    return model_token_budget(models[0], batch)
 
-    for model_name in models:
-        # 이번 Lambda 실행에서 이미 429가 발생한 모델은 즉시 건너뜀
-        if model_name in _quota_exceeded_models:
-            logger.info(f"⏭️ {model_name} 할당량 초과 이력 - 건너뜁니다.")
-            continue
 
-        try:
-            client, api_model = _get_client_and_model(model_name)
-            logger.info(f"🤖 [{category.upper()}] AI 분석 시도 중... (모델: {model_name})")
-
-            response = client.chat.completions.create(
-                model=api_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE,
-            )
-
-            # 토큰 제한으로 출력이 잘린 경우 → 다음 모델로 폴백
-            if response.choices[0].finish_reason == "length":
-                raise Exception("출력이 토큰 제한으로 잘림 - 다음 모델로 전환")
-
-            raw = response.choices[0].message.content or ""
-
-            # JSON 파싱 시도 → 성공 시 dict 반환, 실패 시 원본 문자열 폴백
-            parsed = _parse_json_response(raw)
-            if parsed is not None:
-                logger.info(f"✅ AI 분석 완료 (모델: {model_name}, 형식: JSON)")
-                return parsed
-            else:
-                logger.warning(f"⚠️ {model_name} JSON 파싱 실패 - 문자열 폴백 반환")
-                logger.info(f"✅ AI 분석 완료 (모델: {model_name}, 형식: 문자열 폴백)")
-                return raw
-
-        except RateLimitError:
-            # [P5 Fix] openai SDK의 RateLimitError(HTTP 429)를 타입으로 정확히 감지
-            _quota_exceeded_models.add(model_name)
+def _prompts_per_model(build, prepared_budget: int, batch: bool = False):
+    """
+    폴백 체인용 모델별 프롬프트 함수 model_name → (system_prompt, user_prompt).
+    build(budget): budget=None이면 준비된 컨텍스트(prepared_budget 이내로 압축) 그대로, 정수면 그 예산으로 다시 압축한 프롬프트.
+    예산이 prepared_budget보다 작은 모델에서만 다시 압축하며, 같은 예산은 1회만 생성
+    (CONTEXT_COMPACTION_ENABLED=0이면 항상 그대로).
+    """
+    built: dict = {}
+
+    def prompts(model_name: str) -> tuple[str, str]:
+        budget = model_token_budget(model_name, batch)
+        key = budget if CONTEXT_COMPACTION_ENABLED and budget < prepared_budget else None
+        if key not in built:
+            built[key] = build(key)
+        return built[key]
+
+    return prompts
+
+
+def _symbol_block(symbol: str, item: dict) -> str:
+    """배치 프롬프트의 종목 1개 입력 블록 — 종목 ID는 응답 JSON의 키."""
+    return f"[종목 ID: {symbol}] {item['name']}\n{item['news']}{item.get('trend', '')}\n"
+
+
+def _build_batch_prompts(blocks: list[str], symbols: list[str]) -> tuple[str, str]:
+    """여러 종목을 한 번에 요약하는 배치 프롬프트. 내용 변경 시 SYMBOL_PROMPT_VERSION을 올리세요."""
+    ids = ", ".join(f'"{s}"' for s in symbols)
+    news = "\n".join(blocks)
+    user_prompt = f"""
+    [분석 대상 종목 ID]: {ids}
+
+    [종목별 뉴스 데이터] — 각 블록은 "[종목 ID: ...]" 줄로 시작합니다.
+    {news}
+    [임무]
+    종목마다 해당 블록의 뉴스만 근거로 투자자용 브리핑을 작성하세요. 다른 종목 블록의 내용을 섞지 마십시오.
+
+    [출력 형식 - 순수 JSON만, 코드블록 없이]
+    종목 ID를 키로, 값은 아래 형식의 객체. 위 종목 ID를 빠짐없이 모두 포함하세요.
+    {{"<종목 ID>": {_SUMMARY_SCHEMA}}}
+
+{_SCHEMA_RULES}"""
+    return _SYSTEM_PROMPT, user_prompt
+
+
+class _LatencyHistogram:
+    """모델별 응답 지연 기록 — 최근 표본(분위수 계산용) + 고정 구간 히스토그램(리포트용)."""
+
+    BUCKETS = (1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+    def __init__(self, max_samples: int = 200):
+        self._samples: dict[str, deque] = {}
+        self._counts: dict[str, list[int]] = {}
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+
+    def record(self, model_name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(model_name, deque(maxlen=self._max_samples)).append(seconds)
+            counts = self._counts.setdefault(model_name, [0] * (len(self.BUCKETS) + 1))
+            counts[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+
+    def percentile(self, model_name: str, q: float) -> float | None:
+        """최근 표본의 q 분위수 (표본 부족 시 None)."""
+        with self._lock:
+            samples = sorted(self._samples.get(model_name, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def snapshot(self) -> dict[str, dict]:
+        labels = [f"<={b:g}s" for b in self.BUCKETS] + [f">{self.BUCKETS[-1]:g}s"]
+        with self._lock:
+            models = list(self._samples)
+            counts = {m: list(self._counts[m]) for m in models}
+        return {
+            m: {"count": sum(counts[m]), "p50": self.percentile(m, 0.5),
+                "p90": self.percentile(m, 0.9), "buckets": dict(zip(labels, counts[m]))}
+            for m in models
+        }
+
+
+# warm start 간 유지 — 호출이 쌓일수록 헤지 기준이 실제 지연에 맞춰짐
+_latency = _LatencyHistogram()
+
+
+def get_latency_stats() -> dict[str, dict]:
+    """모델별 {count, p50, p90, buckets} 응답 지연 통계."""
+    return _latency.snapshot()
+
+
+def _hedge_delay(model_name: str) -> float:
+    """model_name 응답을 기다릴 시간 — 지연 분위수를 [MIN, MAX]로 제한, 표본 부족 시 기본값."""
+    observed = _latency.percentile(model_name, HEDGE_PERCENTILE)
+    if observed is None:
+        return HEDGE_DEFAULT_DELAY_SECONDS
+    return min(HEDGE_MAX_DELAY_SECONDS, max(HEDGE_MIN_DELAY_SECONDS, observed))
+
+
+# 실행당 헤지 호출 수 — 엔진 실행 시작 시 reset_hedge_count()로 초기화 (한 실행의 모든 요약 호출이 공유)
+_hedges_used = 0
+_hedge_lock = threading.Lock()
+
+
+def reset_hedge_count() -> None:
+    """실행 단위 헤지 상한 초기화 (엔진 실행 시작마다 호출)."""
+    global _hedges_used
+    with _hedge_lock:
+        _hedges_used = 0
+
+
+def get_hedge_count() -> int:
+    with _hedge_lock:
+        return _hedges_used
+
+
+def _may_hedge(model_name: str) -> bool:
+    """
+    헤지 발사 허용 여부 — 대상 프로바이더 버킷에 대기 없이 쓸 토큰이 있고 실행당 상한이 남았을 때만.
+    (버킷이 비었는데 헤지를 보내면 rate limit 대기로 늦어질 뿐 아니라 1순위 모델의 후속 호출 몫을 빼앗음)
+    """
+    global _hedges_used
+    if rate_limiter.available(model_name.split("/", 1)[0]) < 1:
+        return False
+    with _hedge_lock:
+        if _hedges_used >= HEDGE_MAX_PER_RUN:
+            return False
+        _hedges_used += 1
+        return True
+
+
+def _call_model(model_name: str, system_prompt: str, user_prompt: str, category: str,
+                parse=_parse_json_response) -> tuple[str, str | dict | None]:
+    """모델 1회 호출 — 시도 1건을 tracing span(kind="model")으로 기록. 반환값은 _attempt_model과 동일."""
+    with tracing.span(model_name, kind="model", category=category) as sp:
+        status, value = _attempt_model(model_name, system_prompt, user_prompt, category, parse)
+        sp["outcome"] = status
+        return status, value
+
+
+def _attempt_model(model_name: str, system_prompt: str, user_prompt: str, category: str,
+                   parse=_parse_json_response) -> tuple[str, str | dict | None]:
+    """
+    모델 1회 호출.
+    parse: 응답 문자열 → dict | None (단일 요약: _parse_json_response, 배치: _parse_batch_response)
+    반환: ("json", dict) | ("raw", str) | ("failed", None) — 429는 세션 비활성화 처리
+    """
+    # 이번 Lambda 실행에서 이미 429가 발생한 모델은 즉시 건너뜀
+    if _is_quota_exceeded(model_name):
+        logger.info(f"⏭️ {model_name} 할당량 초과 이력 - 건너뜁니다.")
+        return "failed", None
+
+    from openai import RateLimitError  # [P5 Fix] RateLimitError 타입 — 지연 import (첫 호출 시 1회 로드)
+
+    try:
+        client, api_model = _get_client_and_model(model_name)
+        logger.info(f"🤖 [{category.upper()}] AI 분석 시도 중... (모델: {model_name})")
+        # 프로바이더(groq/gemini) 단위 토큰 버킷 — 분당 요청 한도 보호
+        rate_limiter.acquire(model_name.split("/", 1)[0])
+
+        started = time.monotonic()
+        response = client.chat.completions.create(
+            model=api_model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            max_tokens=MAX_TOKENS,
+            temperature=TEMPERATURE,
+        )
+        _latency.record(model_name, time.monotonic() - started)
+        if getattr(response, "usage", None) is not None:
+            tracing.annotate("tokens", response.usage.total_tokens)
+
+        # 토큰 제한으로 출력이 잘린 경우 → 다음 모델로 폴백
+        if response.choices[0].finish_reason == "length":
+            raise Exception("출력이 토큰 제한으로 잘림 - 다음 모델로 전환")
+
+        raw = response.choices[0].message.content or ""
+
+        # JSON 파싱 시도 → 성공 시 dict 반환, 실패 시 원본 문자열 폴백
+        parsed = parse(raw)
+        if parsed is not None:
+            logger.info(f"✅ AI 분석 완료 (모델: {model_name}, 형식: JSON)")
+            return "json", parsed
+        logger.warning(f"⚠️ {model_name} JSON 파싱 실패 - 문자열 폴백 반환")
+        logger.info(f"✅ AI 분석 완료 (모델: {model_name}, 형식: 문자열 폴백)")
+        return "raw", raw
+
+    except RateLimitError:
+        # [P5 Fix] openai SDK의 RateLimitError(HTTP 429)를 타입으로 정확히 감지
+        _mark_quota_exceeded(model_name)
+        logger.warning(f"⚠️ {model_name} 할당량 초과(429) - 세션 비활성화 및 다음 모델로 전환합니다.")
+        return "failed", None
+
+    except Exception as e:
+        error_str = str(e)
+        # [P5 Fix] Gemini의 RESOURCE_EXHAUSTED는 openai RateLimitError가 아닌
+        # 일반 Exception으로 래핑될 수 있어 문자열 체크를 폴백으로 유지
+        if "RESOURCE_EXHAUSTED" in error_str or "429" in error_str:
+            _mark_quota_exceeded(model_name)
             logger.warning(f"⚠️ {model_name} 할당량 초과(429) - 세션 비활성화 및 다음 모델로 전환합니다.")
-            continue
+        else:
+            logger.warning(f"⚠️ {model_name} 실패 ({error_str}) -> 다음 모델로 전환합니다.")
+        return "failed", None
 
-        except Exception as e:
-            error_str = str(e)
-            # [P5 Fix] Gemini의 RESOURCE_EXHAUSTED는 openai RateLimitError가 아닌
-            # 일반 Exception으로 래핑될 수 있어 문자열 체크를 폴백으로 유지
-            if "RESOURCE_EXHAUSTED" in error_str or "429" in error_str:
-                _quota_exceeded_models.add(model_name)
-                logger.warning(f"⚠️ {model_name} 할당량 초과(429) - 세션 비활성화 및 다음 모델로 전환합니다.")
-            else:
-                logger.warning(f"⚠️ {model_name} 실패 ({error_str}) -> 다음 모델로 전환합니다.")
+
+_ALL_MODELS_FAILED_MESSAGE = "현재 모든 AI 모델의 한도가 초과되었거나 응답할 수 없는 상태입니다."
+
+
+def _summarize_with_fallback(stock_name: str, context: str, category: str, models: list[str],
+                             keep_terms=()) -> dict | str:
+    """
+    models 순서대로 호출해 첫 성공 응답 반환 (429 모델은 세션 동안 건너뜀).
+    입력 예산이 더 작은 폴백 모델에는 keep_terms 기준으로 다시 압축한 컨텍스트 전달.
+    """
+    def build(budget: int | None) -> tuple[str, str]:
+        if budget is None:
+            return _build_prompts(stock_name, context)
+        return _build_prompts(stock_name, compact_context(context, budget, keep_terms, label=f"{category}.fallback"))
+
+    return _run_model_chain(_prompts_per_model(build, context_token_budget(category)), category, models)
+
+
+def _run_model_chain(prompts, category: str, models: list[str], parse=_parse_json_response) -> dict | str:
+    """폴백 체인 실행 — HEDGE_ENABLED면 헤지 모드, 아니면 순차. prompts: model_name → (system_prompt, user_prompt)."""
+    if HEDGE_ENABLED:
+        return _summarize_hedged(prompts, category, models, parse)
+
+    for model_name in models:
+        status, value = _call_model(model_name, *prompts(model_name), category, parse)
+        if status != "failed":
+            return value
+
+    return _ALL_MODELS_FAILED_MESSAGE
+
+
+def _summarize_hedged(prompts, category: str, models: list[str], parse=_parse_json_response) -> dict | str:
+    """
+    헤지 모드 폴백 체인.
+    - 가장 최근에 발사한 모델이 _hedge_delay() 안에 응답하지 않으면 다음 모델을 병렬 발사
+      (_may_hedge()가 거부하면 발사하지 않고 진행 중 요청이 끝날 때까지 대기)
+    - 실패 응답은 즉시 다음 모델 발사 (순차 모드와 동일)
+    - 첫 유효 JSON 응답 채택 → 나머지 요청은 결과를 버림 (동기 SDK 호출은 중단 불가)
+    - JSON이 하나도 없으면 첫 문자열 폴백, 그것도 없으면 실패 메시지
+    """
+    candidates = [m for m in models if not _is_quota_exceeded(m)]
+    if not candidates:
+        return _ALL_MODELS_FAILED_MESSAGE
+
+    executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="hedge")
+    in_flight: dict = {}
+    next_index = 0
+    raw_fallback = None
+
+    def _launch() -> str:
+        nonlocal next_index
+        model_name = candidates[next_index]
+        next_index += 1
+        in_flight[executor.submit(_call_model, model_name, *prompts(model_name), category, parse)] = model_name
+        return model_name
+
+    last_launched = _launch()
+    hedge_denied = False
+    try:
+        while in_flight:
+            hedgeable = next_index < len(candidates) and not hedge_denied
+            timeout = _hedge_delay(last_launched) if hedgeable else None
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if not _may_hedge(candidates[next_index]):
+                    logger.info("⏳ [%s] %s 응답 지연(%.1fs) - 헤지 한도·버킷 부족으로 계속 대기",
+                                category.upper(), last_launched, timeout)
+                    hedge_denied = True
+                    continue
+                logger.info("🪁 [%s] %s 응답 지연(%.1fs) - %s 헤지 발사",
+                            category.upper(), last_launched, timeout, candidates[next_index])
+                last_launched = _launch()
+                continue
+            hedge_denied = False
+            for future in done:
+                model_name = in_flight.pop(future)
+                status, value = future.result()
+                if status == "json":
+                    if in_flight:
+                        logger.info("🏁 [%s] %s 채택 - 진행 중 %d건 폐기", category.upper(), model_name, len(in_flight))
+                    return value
+                if status == "raw" and raw_fallback is None:
+                    raw_fallback = value
+            if not in_flight:
+                # 진행 중 요청 없음: 문자열 폴백이 있으면 순차 모드처럼 반환, 없으면 다음 모델
+                if raw_fallback is not None:
+                    return raw_fallback
+                if next_index < len(candidates):
+                    last_launched = _launch()
+        return _ALL_MODELS_FAILED_MESSAGE
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _summary_cache_keys(stock_name: str, context: str, category: str, models: list[str],
+                       article_urls: list[str] | None,
+                       prompt_version: str = PROMPT_VERSION) -> list[tuple[str, str]]:
+    """
+    요약 캐시 조회 키 목록 [(provider, key), ...] — SUMMARY_CACHE_MODE에 따라 결정.
+      exact: 정규화 컨텍스트(공백·유니코드 표기 통일) 해시
+      urls : exact + 정렬된 기사 URL 집합 해시 (본문 미세 변경·추세 수치 변동 무시)
+    """
+    if SUMMARY_CACHE_MODE == "off":
+        return []
+    base = [category, stock_name, list(models), prompt_version]
+    normalized = " ".join(unicodedata.normalize("NFKC", context).split())
+    keys = [("summary_exact", _digest(base + [normalized]))]
+    if SUMMARY_CACHE_MODE == "urls" and article_urls:
+        keys.append(("summary_urls", _digest(base + [sorted(set(article_urls))])))
+    return keys
+
+
+def _digest(parts: list) -> str:
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def get_summary_cache_stats() -> dict[str, dict[str, int]]:
+    """요약 캐시 {summary_exact|summary_urls: {hits, misses}} — hit 1회 = 모델 호출 체인 1회 절약."""
+    return get_summary_cache().get_stats()
+
+
+def generate_ai_summary(stock_name: str, context: str, category: str = "watchlist",
+                        article_urls: list[str] | None = None, keep_terms=()) -> dict | str:
+    """
+    카테고리별 최적 모델로 AI 브리핑을 생성합니다.
+    - 모델 우선순위: backend/config/models.py 에서 설정
+    - category: "macro" | "portfolio" | "watchlist"
+    - article_urls: 컨텍스트에 포함된 기사 URL (SUMMARY_CACHE_MODE="urls"일 때 near-duplicate 키)
+    - keep_terms: 입력 예산이 작은 폴백 모델용 재압축 시 남길 식별어 (compact_context)
+    - 동일 입력의 이전 JSON 결과가 캐시에 있으면 모델을 호출하지 않고 반환
+    - 반환값: JSON 파싱 성공 시 dict, 실패 시 원본 문자열 (하위 호환 폴백)
+    """
+    if not context:
+        return _NO_NEWS_MESSAGE
+
+    models = MODEL_CONFIG.get(category, MODEL_CONFIG["watchlist"])
+
+    cache = get_summary_cache()
+    cache_keys = _summary_cache_keys(stock_name, context, category, models, article_urls)
+    for provider, key in cache_keys:
+        cached = cache.get(provider, key)
+        if cached is not None:
+            logger.info("♻️ [%s] AI 요약 캐시 hit (%s) — 모델 호출 생략", category.upper(), provider)
+            return cached
+
+    result = _summarize_with_fallback(stock_name, context, category, models, keep_terms)
+
+    # JSON 구조화 결과만 캐시 (문자열 폴백·한도 초과 메시지는 다음 실행에 재시도)
+    if isinstance(result, dict):
+        for provider, key in cache_keys:
+            cache.set(provider, key, result)
+    return result
+
+
+_NO_NEWS_MESSAGE = "최근 24시간 내 관련된 중요 뉴스 데이터가 없습니다."
+
+
+def generate_symbol_summaries(category: str, symbols: dict[str, dict]) -> dict[str, dict]:
+    """
+    종목별 AI 요약 생성 — 캐시 miss 종목만 배치 프롬프트로 묶어 생성합니다.
+
+    symbols: {심볼: {"name", "news", "trend", "article_urls"}} (뉴스 없는 종목은 건너뜀)
+    캐시 키는 종목 뉴스(urls 모드는 기사 URL 집합 포함) 기준 — 추세 수치만 바뀐 종목은 재생성하지 않음
+    반환값: {심볼: 요약 dict} — symbols 순서, 생성 실패 종목 제외 (다음 실행에 재시도)
+    """
+    models = MODEL_CONFIG.get(category, MODEL_CONFIG["watchlist"])
+    cache = get_summary_cache()
+    summaries: dict[str, dict] = {}
+    pending: list[tuple[str, dict, list]] = []
+    for symbol, item in symbols.items():
+        if not item.get("news"):
             continue
+        cache_keys = _summary_cache_keys(f"{symbol}|{item['name']}", item["news"], category, models,
+                                         item.get("article_urls"), SYMBOL_PROMPT_VERSION)
+        cached = next((v for v in (cache.get(p, k) for p, k in cache_keys) if v is not None), None)
+        if cached is not None:
+            summaries[symbol] = cached
+        else:
+            pending.append((symbol, item, cache_keys))
+
+    batches = _pack_symbol_batches(pending, _batch_token_budget(category))
+    logger.info("♻️ [%s] 종목별 요약: 캐시 hit %d, 생성 %d종목 → 배치 %d건",
+                category.upper(), len(summaries), len(pending), len(batches))
+    for batch in batches:
+        result = _summarize_batch(category, models, batch)
+        for symbol, _, _, cache_keys in batch:
+            summary = result.get(symbol)
+            if summary is None:
+                logger.warning("⚠️ [%s] %s 종목 요약 누락 - 다음 실행에 재시도합니다.", category.upper(), symbol)
+                continue
+            summaries[symbol] = summary
+            for provider, key in cache_keys:
+                cache.set(provider, key, summary)
+    return {symbol: summaries[symbol] for symbol in symbols if symbol in summaries}
+
+
+def _batch_token_budget(category: str) -> int:
+    """종목 배치 1건의 블록 토큰 예산 — SYMBOL_BATCH_INPUT_TOKENS와 주 모델 배치 입력 예산 중 작은 값."""
+    return min(SYMBOL_BATCH_INPUT_TOKENS, context_token_budget(category, batch=True))
+
+
+def _pack_symbol_batches(pending: list[tuple[str, dict, list]], budget: int) -> list[list[tuple[str, dict, str, list]]]:
+    """
+    종목 블록을 입력 토큰 예산(budget — SYMBOL_BATCH_INPUT_TOKENS와 모델 입력 예산 중 작은 값) 내 배치로
+    first-fit decreasing 패킹.
+    배치당 종목 수는 출력 한도(MAX_TOKENS // SYMBOL_SUMMARY_OUTPUT_TOKENS) 이내 — 응답 잘림 방지.
+    예산보다 큰 단일 종목 블록은 예산 길이로 잘라 단독 배치.
+    반환: [[(심볼, item, 블록, 캐시 키), ...], ...]
+    """
+    max_symbols = max(1, MAX_TOKENS // SYMBOL_SUMMARY_OUTPUT_TOKENS)
+    sized = []
+    for symbol, item, cache_keys in pending:
+        block = _symbol_block(symbol, item)
+        tokens = count_tokens(block)
+        if tokens > budget:
+            block = truncate_tokens(block, budget)
+            tokens = budget
+        sized.append((tokens, symbol, item, block, cache_keys))
+    sized.sort(key=lambda x: -x[0])
+
+    batches: list[dict] = []
+    for tokens, symbol, item, block, cache_keys in sized:
+        target = next((b for b in batches
+                       if b["tokens"] + tokens <= budget and len(b["items"]) < max_symbols), None)
+        if target is None:
+            target = {"tokens": 0, "items": []}
+            batches.append(target)
+        target["tokens"] += tokens
+        target["items"].append((symbol, item, block, cache_keys))
+    return [b["items"] for b in batches]
+
+
+def _summarize_batch(category: str, models: list[str], batch: list[tuple[str, dict, str, list]]) -> dict[str, dict]:
+    """
+    배치 1건 생성 → {심볼: 요약}. 모든 모델 실패·파싱 실패 시 빈 dict.
+    입력 예산이 더 작은 폴백 모델에는 종목 블록을 블록 토큰 비율대로 예산을 나눠 다시 압축해 전달.
+    """
+    symbols = [symbol for symbol, _, _, _ in batch]
+    blocks = [block for _, _, block, _ in batch]
+
+    def build(budget: int | None) -> tuple[str, str]:
+        if budget is None:
+            return _build_batch_prompts(blocks, symbols)
+        sizes = [count_tokens(block) for block in blocks]
+        total = sum(sizes) or 1
+        fitted = [compact_context(block, max(1, budget * size // total),
+                                  (symbol, item["name"], item.get("kr_name")), label=f"{category}.fallback")
+                  for (symbol, item, _, _), block, size in zip(batch, blocks, sizes)]
+        return _build_batch_prompts(fitted, symbols)
 
-    return "현재 모든 AI 모델의 한도가 초과되었거나 응답할 수 없는 상태입니다."
+    logger.info(f"📦 [{category.upper()}] 종목 배치 요약 요청: {', '.join(symbols)}")
+    result = _run_model_chain(_prompts_per_model(build, _batch_token_budget(category), batch=True), category, models,
+                              parse=_parse_batch_response)
+    return result if isinstance(result, dict) else {}
+
+
+def assemble_category_summary(symbols: dict[str, dict], summaries: dict[str, dict]) -> dict | str:
+    """
+    종목별 요약 → 카테고리 요약 (AISummaryStructured 형식).
+    문장 필드는 "[종목명] 내용"으로 이어 붙이고, verdict는 종목 verdict 다수결(동률이면 중립),
+    reference_indicators·glossary_terms는 중복 제거 후 SYMBOL_MAX_SHARED_ITEMS개까지.
+    종목별 원본은 "symbols" 필드에 보존.
+    """
+    if not summaries:
+        has_news = any(item.get("news") for item in symbols.values())
+        return _ALL_MODELS_FAILED_MESSAGE if has_news else _NO_NEWS_MESSAGE
+
+    def tagged(field: str, summary: dict, name: str) -> str:
+        value = summary.get(field)
+        return f"[{name}] {value}" if isinstance(value, str) and value.strip() else ""
+
+    def joined(field: str) -> str:
+        return " ".join(filter(None, (tagged(field, s, symbols[sym]["name"]) for sym, s in summaries.items())))
+
+    verdicts = Counter((s.get("market_reaction") or {}).get("verdict") for s in summaries.values())
+    ranked = [(v, n) for v, n in verdicts.most_common() if v in ("호재", "악재", "중립")]
+    verdict = ranked[0][0] if ranked and (len(ranked) == 1 or ranked[0][1] > ranked[1][1]) else "중립"
+
+    bullets, indicators, glossary = [], {}, {}
+    for symbol, summary in summaries.items():
+        name = symbols[symbol]["name"]
+        bullets += [f"[{name}] {b}" for b in (summary.get("bullets") or [])[:SYMBOL_BULLETS_PER_SYMBOL]]
+        for indicator in summary.get("reference_indicators") or []:
+            indicators.setdefault(indicator, None)
+        for term in summary.get("glossary_terms") or []:
+            if isinstance(term, dict) and term.get("term"):
+                glossary.setdefault(term["term"], term)
+
+    return {
+        "key_event": joined("key_event"),
+        "expected_impact": joined("expected_impact"),
+        "reference_indicators": list(indicators)[:SYMBOL_MAX_SHARED_ITEMS],
+        "bullets": bullets,
+        "market_reaction": {
+            "verdict": verdict,
+            "reason": " ".join(filter(None, (
+                f"[{symbols[sym]['name']}] {(s.get('market_reaction') or {}).get('reason')}"
+                for sym, s in summaries.items() if (s.get("market_reaction") or {}).get("reason")
+            ))),
+        },
+        "trend_insight": joined("trend_insight"),
+        "glossary_terms": list(glossary.values())[:SYMBOL_MAX_SHARED_ITEMS],
+        "flow_explanation": joined("flow_explanation"),
+        "symbols": {sym: {"name": symbols[sym]["name"], **s} for sym, s in summaries.items()},
+    }
+
+
+def generate_category_summary(category: str, symbols: dict[str, dict]) -> dict | str:
+    """종목별 요약(캐시 재사용 + 배치 생성) → 카테고리 요약 조립."""
+    return assemble_category_summary(symbols, generate_symbol_summaries(category, symbols))
+
+
+def _generate_job(category: str, job: dict) -> dict | str:
+    """generate_ai_summaries 작업 1건 — "symbols"가 있으면 종목별 요약 조립, 없으면 카테고리 컨텍스트 1건 요약."""
+    if "symbols" in job:
+        return generate_category_summary(category, job["symbols"])
+    return generate_ai_summary(job["stock_name"], job["context"], category=category,
+                               article_urls=job.get("article_urls"), keep_terms=job.get("keep_terms", ()))
+
+
+SUMMARY_TIMEOUT_MESSAGE = "AI 요약 생성 시간이 초과되어 이번 업데이트에서 제외되었습니다."
+
+
+def generate_ai_summaries(jobs: dict[str, dict],
+                          deadline_seconds: float | None = SUMMARY_DEADLINE_SECONDS) -> dict[str, dict | str]:
+    """
+    여러 카테고리 요약을 병렬 생성합니다.
+
+    jobs: {category: {"stock_name": str, "context": str, "article_urls": list[str] | None,
+                      "symbols": {심볼: {...}} (선택 — 있으면 generate_category_summary로 종목별 요약 조립)}}
+    deadline_seconds: 전체 마감 시간. 초과 시 미완료 카테고리는 SUMMARY_TIMEOUT_MESSAGE로 채워
+                      완료된 요약만으로 반환 (미완료 스레드는 기다리지 않음, 결과는 요약 캐시에만 남음)
+    반환값: {category: 요약 dict | 문자열} — jobs와 같은 키 순서
+    """
+    if not jobs:
+        return {}
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="ai")
+    futures = {category: executor.submit(_generate_job, category, job) for category, job in jobs.items()}
+    _, pending = wait(futures.values(), timeout=deadline_seconds)
+    # 마감 후 남은 작업은 취소(미시작) 또는 방치(진행 중) — Step D 저장을 막지 않음
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results: dict[str, dict | str] = {}
+    for category, future in futures.items():
+        if future in pending:
+            logger.warning("⏰ [%s] AI 요약 마감(%ss) 초과 - 제외합니다.", category.upper(), deadline_seconds)
+            results[category] = SUMMARY_TIMEOUT_MESSAGE
+            continue
+        try:
+            results[category] = future.result()
+        except Exception as e:
+            logger.warning("⚠️ [%s] AI 요약 생성 실패: %s", category.upper(), e)
+            results[category] = _ALL_MODELS_FAILED_MESSAGE
+    logger.info("AI 요약 병렬 생성 완료: %.1fs (미완료 %d개)", time.monotonic() - started, len(pending))
+    return results
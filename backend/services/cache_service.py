@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+
+try:
+    from backend.config.cache import (
+        resolve_cache_dir, NEWS_CACHE_BACKEND, NEWS_CACHE_MAX_ENTRIES,
+        NEWS_CACHE_STALE_SECONDS, NEWS_CACHE_TTL_SECONDS,
+        SUMMARY_CACHE_BACKEND, SUMMARY_CACHE_TTL_SECONDS,
+    )
+    from backend.services import tracing
+except ModuleNotFoundError:
+    from config.cache import (
+        resolve_cache_dir, NEWS_CACHE_BACKEND, NEWS_CACHE_MAX_ENTRIES,
+        NEWS_CACHE_STALE_SECONDS, NEWS_CACHE_TTL_SECONDS,
+        SUMMARY_CACHE_BACKEND, SUMMARY_CACHE_TTL_SECONDS,
+    )
+    from services import tracing
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 형식 (두 백엔드 공통):
+#   {"value": JSON 문자열, "expires_at": float, "stale_until": float,
+#    "etag": str | None, "last_modified": str | None}
+# value를 JSON 문자열로 보관해 호출자가 반환값을 수정해도 캐시가 오염되지 않음.
+
+
+class MemoryBackend:
+    """프로세스 메모리 LRU 백엔드 — Lambda warm start 간 재사용."""
+
+    def __init__(self, max_entries: int = NEWS_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["stale_until"] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry)
+
+    def set(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteBackend:
+    """SQLite 파일 LRU 백엔드 — 로컬 실행 간 유지."""
+
+    def __init__(self, path: str, max_entries: int = NEWS_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "stale_until REAL NOT NULL, etag TEXT, last_modified TEXT, last_access REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, key: str) -> dict | None:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at, stale_until, etag, last_modified FROM entries "
+                "WHERE key = ? AND stale_until >= ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        value, expires_at, stale_until, etag, last_modified = row
+        return {"value": value, "expires_at": expires_at, "stale_until": stale_until,
+                "etag": etag, "last_modified": last_modified}
+
+    def set(self, key: str, entry: dict) -> None:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, expires_at, stale_until, etag, last_modified, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry["value"], entry["expires_at"], entry["stale_until"],
+                 entry.get("etag"), entry.get("last_modified"), now),
+            )
+            conn.execute("DELETE FROM entries WHERE stale_until < ?", (now,))
+            conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+                "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+
+def _normalize_query(query: str) -> str:
+    """대소문자·공백·유니코드 표기 차이를 제거한 캐시 키용 쿼리."""
+    return " ".join(unicodedata.normalize("NFKC", query or "").lower().split())
+
+
+class ResponseCache:
+    """
+    (provider, 정규화 쿼리, symbol) 키의 뉴스 응답 캐시.
+
+    - get(): TTL 내 신선한 값만 반환 (hit/miss 집계)
+    - lookup(): 신선한 값 + stale 항목 동시 반환 → ETag/Last-Modified 조건부 요청용
+    - revalidated(): 304 응답 시 기존 값의 TTL을 연장하고 값 반환 (파싱 생략)
+    """
+
+    def __init__(self, backend, ttls: dict[str, int] = NEWS_CACHE_TTL_SECONDS,
+                 stale_seconds: int = NEWS_CACHE_STALE_SECONDS):
+        self.backend = backend
+        self.ttls = ttls
+        self.stale_seconds = stale_seconds
+        self._stats: dict[str, dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(provider: str, query: str, symbol: str | None = None) -> str:
+        raw = json.dumps([provider, _normalize_query(query), symbol or ""], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _count(self, provider: str, field: str) -> None:
+        with self._stats_lock:
+            stat = self._stats.setdefault(provider, {"hits": 0, "misses": 0, "revalidated": 0})
+            stat[field] += 1
+        tracing.annotate("cache", {"hits": "hit", "misses": "miss"}.get(field, field))
+
+    def get_entry(self, provider: str, query: str, symbol: str | None = None) -> dict | None:
+        """신선하거나 stale인 항목 반환. entry["fresh"]로 TTL 내 여부 표시."""
+        try:
+            entry = self.backend.get(self.make_key(provider, query, symbol))
+        except sqlite3.Error as e:
+            logger.warning("뉴스 캐시 조회 실패 (%s): %s", provider, e)
+            return None
+        if entry is not None:
+            entry["fresh"] = entry["expires_at"] >= time.time()
+        return entry
+
+    def lookup(self, provider: str, query: str, symbol: str | None = None) -> tuple:
+        """
+        (신선한 값 또는 None, 항목 또는 None) 반환 — hit/miss 집계.
+        miss여도 stale 항목이 있으면 함께 반환되어 조건부 요청에 사용할 수 있음.
+        """
+        entry = self.get_entry(provider, query, symbol)
+        if entry is not None and entry["fresh"]:
+            self._count(provider, "hits")
+            return self.decode(entry), entry
+        self._count(provider, "misses")
+        return None, entry
+
+    def get(self, provider: str, query: str, symbol: str | None = None):
+        """TTL 내 값이면 반환(hit), 아니면 None(miss)."""
+        return self.lookup(provider, query, symbol)[0]
+
+    @staticmethod
+    def decode(entry: dict):
+        value = json.loads(entry["value"])
+        # (context, links) 튜플은 JSON 배열로 저장되므로 튜플로 복원
+        return tuple(value) if isinstance(value, list) else value
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        """stale 항목의 검증자로 If-None-Match / If-Modified-Since 헤더 생성."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, provider: str, query: str, value, symbol: str | None = None,
+            etag: str | None = None, last_modified: str | None = None) -> None:
+        now = time.time()
+        entry = {
+            "value": json.dumps(value, ensure_ascii=False),
+            "expires_at": now + self.ttls.get(provider, 0),
+            "stale_until": now + self.ttls.get(provider, 0) + self.stale_seconds,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        try:
+            self.backend.set(self.make_key(provider, query, symbol), entry)
+        except sqlite3.Error as e:
+            logger.warning("뉴스 캐시 저장 실패 (%s): %s", provider, e)
+
+    def revalidated(self, provider: str, query: str, entry: dict, symbol: str | None = None):
+        """304 Not Modified 처리 — 기존 값·검증자로 TTL 재설정 후 값 반환."""
+        value = self.decode(entry)
+        self.set(provider, query, value, symbol=symbol,
+                 etag=entry.get("etag"), last_modified=entry.get("last_modified"))
+        self._count(provider, "revalidated")
+        return value
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """프로바이더별 {hits, misses, revalidated} 집계 사본."""
+        with self._stats_lock:
+            return {name: dict(stat) for name, stat in self._stats.items()}
+
+
+_news_cache: ResponseCache | None = None
+_news_cache_lock = threading.Lock()
+
+
+def _build_backend(kind: str, filename: str):
+    """백엔드 종류 문자열로 캐시 백엔드 생성. sqlite 초기화 실패 시 memory로 대체."""
+    if kind == "sqlite":
+        path = os.path.join(resolve_cache_dir(), filename)
+        try:
+            return SQLiteBackend(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("SQLite 캐시 초기화 실패 — 메모리 캐시 사용: %s", e)
+    return MemoryBackend()
+
+
+def get_news_cache() -> ResponseCache:
+    """모듈 단위 뉴스 응답 캐시 싱글턴 (NEWS_CACHE_BACKEND 설정에 따라 백엔드 선택)."""
+    global _news_cache
+    with _news_cache_lock:
+        if _news_cache is None:
+            _news_cache = ResponseCache(_build_backend(NEWS_CACHE_BACKEND, "news_cache.sqlite3"))
+            logger.info("뉴스 응답 캐시 사용: %s", type(_news_cache.backend).__name__)
+        return _news_cache
+
+
+_summary_cache: ResponseCache | None = None
+
+
+def get_summary_cache() -> ResponseCache:
+    """AI 요약 메모이제이션 캐시 싱글턴. provider 키는 "summary_exact" / "summary_urls"."""
+    global _summary_cache
+    with _news_cache_lock:
+        if _summary_cache is None:
+            ttls = {"summary_exact": SUMMARY_CACHE_TTL_SECONDS, "summary_urls": SUMMARY_CACHE_TTL_SECONDS}
+            _summary_cache = ResponseCache(
+                _build_backend(SUMMARY_CACHE_BACKEND, "summary_cache.sqlite3"), ttls=ttls, stale_seconds=0,
+            )
+            logger.info("AI 요약 캐시 사용: %s", type(_summary_cache.backend).__name__)
+        return _summary_cache
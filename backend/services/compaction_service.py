@@ -0,0 +1,128 @@
+import re
+import time
+import logging
+import threading
+
+try:
+    from backend.services.dedup_service import NearDupIndex
+    from backend.services.token_counter import count_tokens, truncate_tokens
+except ModuleNotFoundError:
+    from services.dedup_service import NearDupIndex
+    from services.token_counter import count_tokens, truncate_tokens
+
+logger = logging.getLogger(__name__)
+
+_sentence_re = re.compile(r"(?<=[.!?。])\s+")
+_number_re = re.compile(r"\d")
+# 영문 고유명사·약어 — 문장 첫 단어가 아닌 대문자 시작 단어, 또는 2자 이상 대문자 약어 (Fed, CPI, TSMC ...)
+_entity_re = re.compile(r"(?<=\s)[A-Z][\w&.-]+|\b[A-Z]{2,}\b")
+
+# 실행 단위 집계 {label: {...}} — reset_compaction_stats()로 초기화
+_stats: dict[str, dict] = {}
+_stats_lock = threading.Lock()
+
+
+def _is_structural(line: str) -> bool:
+    """기사 제목·카테고리 헤더("[...]")·추세 지표("- ...") 줄 — 압축하지 않고 그대로 유지."""
+    return line.startswith("[") or line.startswith("- ")
+
+
+def _informative(sentence: str, keep_terms: list[str]) -> bool:
+    """숫자·영문 고유명사/약어·종목명(심볼) 중 하나라도 포함한 문장."""
+    if _number_re.search(sentence) or _entity_re.search(sentence):
+        return True
+    lowered = sentence.lower()
+    return any(term in lowered for term in keep_terms)
+
+
+def compact_context(text: str, budget: int, keep_terms=(), label: str = "context") -> str:
+    """
+    AI 요약 컨텍스트 압축. 구조 줄(제목·헤더·추세 지표)은 유지하고 본문 문장만 거릅니다.
+      1) 앞서 나온 문장과 유사한 문장 제거 (기사 간 중복 — 통신사 기사 재배포 등)
+      2) 숫자·고유명사·keep_terms가 없는 문장 제거 — 원문이 budget을 넘을 때만, 기사 첫 문장(리드)은 유지
+      3) budget 토큰 초과 시 기사 안 순번이 뒤쪽인 문장부터 제거 (모든 기사의 리드가 마지막까지 남음)
+    label: 집계 키 (get_compaction_stats)
+    """
+    if not text:
+        return text
+    started = time.perf_counter()
+    terms = [t.lower() for t in keep_terms if t]
+    seen = NearDupIndex()
+    stats = {"tokens_before": count_tokens(text), "sentences": 0,
+             "duplicate": 0, "uninformative": 0, "over_budget": 0}
+    # 예산 안에 들어가는 컨텍스트는 정보량 필터 생략 — 한글 본문처럼 휴리스틱이 놓치는 문장을 불필요하게 잃지 않도록
+    filter_uninformative = stats["tokens_before"] > budget
+
+    # lines: [구조 줄 문자열 | 본문 문장 목록]. body: (토큰 수, 기사 내 순번, 등장 순서, 줄 번호, 줄 안 문장 위치)
+    lines: list[str | list[str | None]] = []
+    body: list[tuple[int, int, int, int, int]] = []
+    position = 0        # 기사 안에서 유지된 문장 순번 (예산 초과 시 제거 순서)
+    lead = True         # 기사 첫 문장 여부
+    for raw_line in text.split("\n"):
+        line = raw_line.strip()
+        if not line:
+            continue
+        if _is_structural(line):
+            lines.append(line)
+            position, lead = 0, True
+            continue
+        sentences: list[str | None] = []
+        for sentence in _sentence_re.split(line):
+            stats["sentences"] += 1
+            if not seen.add(sentence, f"sentence:{stats['sentences']}"):
+                stats["duplicate"] += 1
+            elif filter_uninformative and not lead and not _informative(sentence, terms):
+                stats["uninformative"] += 1
+            else:
+                body.append((count_tokens(sentence), position, len(body), len(lines), len(sentences)))
+                sentences.append(sentence)
+                position, lead = position + 1, False
+                continue
+            sentences.append(None)
+            lead = False
+        lines.append(sentences)
+
+    total = sum(count_tokens(line) for line in lines if isinstance(line, str)) + sum(b[0] for b in body) + len(lines)
+    if total > budget:
+        for tokens, _, _, line_no, idx in sorted(body, key=lambda b: (-b[1], -b[2])):
+            lines[line_no][idx] = None
+            stats["over_budget"] += 1
+            total -= tokens
+            if total <= budget:
+                break
+
+    compacted = "\n".join(
+        line if isinstance(line, str) else " ".join(s for s in line if s)
+        for line in lines if isinstance(line, str) or any(line)
+    )
+    if count_tokens(compacted) > budget:
+        compacted = truncate_tokens(compacted, budget)   # 구조 줄만으로 예산 초과 — 뒤쪽 절단
+    stats["tokens_after"] = count_tokens(compacted)
+    stats["seconds"] = time.perf_counter() - started
+    _record(label, stats)
+    return compacted
+
+
+def _record(label: str, stats: dict) -> None:
+    with _stats_lock:
+        agg = _stats.setdefault(label, {"calls": 0, "tokens_before": 0, "tokens_after": 0, "sentences": 0,
+                                        "duplicate": 0, "uninformative": 0, "over_budget": 0, "seconds": 0.0})
+        agg["calls"] += 1
+        for key, value in stats.items():
+            agg[key] += value
+
+
+def get_compaction_stats() -> dict[str, dict]:
+    """{label: {calls, tokens_before, tokens_after, reduction, 제거 문장 수(사유별), seconds}}."""
+    with _stats_lock:
+        snapshot = {label: dict(agg) for label, agg in _stats.items()}
+    for agg in snapshot.values():
+        before = agg["tokens_before"]
+        agg["reduction"] = round(1 - agg["tokens_after"] / before, 3) if before else 0.0
+        agg["seconds"] = round(agg["seconds"], 3)
+    return snapshot
+
+
+def reset_compaction_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
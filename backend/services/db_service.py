@@ -1,9 +1,55 @@
 import os
+import gzip
+import json
+import hashlib
 import logging
-import requests
+
+try:
+    from backend.config.cache import (
+        FEED_WRITE_MODE, FEED_WRITE_GZIP, ARCHIVE_ENABLED, BULK_INSERT_BATCH_SIZE,
+    )
+    from backend.services.http_client import get_session
+    from backend.services.dedup_service import url_hash
+    from backend.services import tracing
+except ModuleNotFoundError:
+    from config.cache import (
+        FEED_WRITE_MODE, FEED_WRITE_GZIP, ARCHIVE_ENABLED, BULK_INSERT_BATCH_SIZE,
+    )
+    from services.http_client import get_session
+    from services.dedup_service import url_hash
+    from services import tracing
 
 logger = logging.getLogger(__name__)
 
+_gzip_supported = FEED_WRITE_GZIP   # 서버가 gzip 본문을 거부하면 세션 동안 비활성화
+_GZIP_MIN_BYTES = 1024              # 이보다 작은 본문은 압축 이득 없음 (헤더 오버헤드)
+
+
+def _section_digests(payload: dict) -> dict[str, str]:
+    """최상위 섹션별 정규화 JSON 해시 — 키 순서와 무관한 구조 비교."""
+    return {key: _digest(value) for key, value in payload.items()}
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def _gzip_rejected(resp) -> bool:
+    """서버가 gzip 본문 자체를 거부한 응답인지 — 415, 또는 content encoding 미지원을 알리는 400만 해당."""
+    if resp.status_code == 415:
+        return True
+    if resp.status_code != 400:
+        return False
+    text = (resp.text or "").lower()
+    return "encoding" in text and any(word in text for word in ("unsupported", "not supported", "gzip"))
+
+
+def diff_sections(previous: dict[str, str], current: dict[str, str]) -> list[str]:
+    """해시가 달라졌거나 새로 생긴 섹션 목록 (삭제된 섹션은 기존 컬럼 값 보존 정책상 제외)."""
+    return [key for key, digest in current.items() if previous.get(key) != digest]
+
 class DBService:
     def __init__(self):
         # Supabase REST API 설정
@@ -11,13 +57,51 @@ class DBService:
         self.supabase_key = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
 
     def update_market_indices(self, path: str, updates: dict) -> None:
-        # save_final_feed()가 Step D에서 전체 데이터를 UPSERT하므로 no-op 처리
+        # save_final_feed()가 Step D에서 바뀐 섹션(market_indices/key_indicators 포함)만 PATCH하므로 no-op 처리
         if not updates:
             logger.warning("update_market_indices skip (빈 updates): %s", path)
         else:
             logger.info("update_market_indices deferred to save_final_feed: %s", path)
 
-    def save_final_feed(self, data: dict) -> None:
+    def _send(self, method: str, url: str, payload, headers: dict) -> tuple:
+        """JSON 본문 전송 (FEED_WRITE_GZIP 시 gzip). 반환: (응답, 원본 바이트, 전송 바이트)."""
+        global _gzip_supported
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        if _gzip_supported and len(body) >= _GZIP_MIN_BYTES:
+            compressed = gzip.compress(body, compresslevel=6)
+            resp = get_session().request(method, url, data=compressed, timeout=10,
+                                         headers={**headers, "Content-Encoding": "gzip"})
+            if not _gzip_rejected(resp):
+                # 그 밖의 4xx/5xx는 원 응답 그대로 반환 — 호출부 raise_for_status가 보고
+                tracing.annotate("bytes_written", len(compressed))
+                return resp, len(body), len(compressed)
+            logger.warning("gzip 요청 본문 미지원(HTTP %s) — 비압축으로 재전송", resp.status_code)
+            _gzip_supported = False
+        resp = get_session().request(method, url, data=body, headers=headers, timeout=10)
+        tracing.annotate("bytes_written", len(body))
+        return resp, len(body), len(body)
+
+    def _stored_digests(self, url: str, headers: dict) -> dict[str, str] | None:
+        """feed 행(id=1)에 저장된 section_digests. 행·컬럼 값이 없거나 조회 실패 시 None (→ 전체 UPSERT)."""
+        try:
+            resp = get_session().get(url, headers=headers, params={"id": "eq.1", "select": "section_digests"},
+                                     timeout=10)
+            resp.raise_for_status()
+            rows = resp.json()
+        except Exception as e:
+            logger.warning("feed section_digests 조회 실패 — 전체 UPSERT로 폴백: %s", e)
+            return None
+        return (rows[0].get("section_digests") or None) if rows else None
+
+    def save_final_feed(self, data: dict) -> dict:
+        """
+        feed 행(id=1) 저장. FEED_WRITE_MODE="delta"면 행에 저장된 섹션 해시(section_digests 컬럼)와 비교해
+        바뀐 섹션(컬럼)만 PATCH. 해시는 DB 행 자체에 함께 기록되므로 다른 컨테이너·수동 수정과도 어긋나지 않습니다.
+        저장된 해시가 없거나 PATCH 대상 행이 없으면 전체 UPSERT로 폴백합니다.
+
+        Returns:
+            {"mode": "full" | "patch" | "skip", "sections": [...], "bytes_raw": int, "bytes_sent": int}
+        """
         if not self.supabase_url or not self.supabase_key:
             raise RuntimeError("SUPABASE_URL 또는 SUPABASE_SERVICE_ROLE_KEY 미설정")
         url = f"{self.supabase_url}/rest/v1/feed"
@@ -25,13 +109,37 @@ class DBService:
             "apikey": self.supabase_key,
             "Authorization": f"Bearer {self.supabase_key}",
             "Content-Type": "application/json",
-            "Prefer": "resolution=merge-duplicates",
         }
-        payload = {"id": 1, **data}
+        digests = _section_digests(data)
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            if FEED_WRITE_MODE == "delta":
+                previous = self._stored_digests(url, headers)
+                changed = diff_sections(previous, digests) if previous else None
+                if changed == []:
+                    logger.info("feed 변경 없음 — 저장 생략")
+                    return {"mode": "skip", "sections": [], "bytes_raw": 0, "bytes_sent": 0}
+                if changed:
+                    # select=id로 응답을 최소화하면서 갱신 행 존재 여부 확인
+                    resp, raw, sent = self._send(
+                        "PATCH", f"{url}?id=eq.1&select=id",
+                        {**{key: data[key] for key in changed}, "section_digests": digests},
+                        {**headers, "Prefer": "return=representation"},
+                    )
+                    resp.raise_for_status()
+                    if resp.json():
+                        stats = {"mode": "patch", "sections": changed, "bytes_raw": raw, "bytes_sent": sent}
+                        logger.info("feed patched to Supabase: %s", stats)
+                        return stats
+                    logger.warning("feed 행(id=1) 없음 — 전체 UPSERT로 폴백")
+
+            resp, raw, sent = self._send(
+                "POST", url, {"id": 1, **data, "section_digests": digests},
+                {**headers, "Prefer": "resolution=merge-duplicates"},
+            )
             resp.raise_for_status()
-            logger.info("feed saved to Supabase")
+            stats = {"mode": "full", "sections": list(data), "bytes_raw": raw, "bytes_sent": sent}
+            logger.info("feed saved to Supabase: %s", {k: v for k, v in stats.items() if k != "sections"})
+            return stats
         except Exception as e:
             logger.error("Save Final Feed Error: %s", e)
             raise
@@ -42,7 +150,8 @@ class DBService:
         Lambda service_role로 RLS 우회. unique 심볼 기준으로 반환.
 
         Returns:
-            {symbol: {"name": str, "sector": str}} 형태의 dict.
+            {symbol: {"name": str, "sector": str, "watchers": int}} 형태의 dict.
+            watchers는 해당 심볼을 등록한 행(유저) 수 — 스케줄러 우선순위 입력.
             Supabase 미설정 또는 오류 시 빈 dict 반환 (폴백 허용).
         """
         if not self.supabase_url or not self.supabase_key:
@@ -55,21 +164,185 @@ class DBService:
                 "Authorization": f"Bearer {self.supabase_key}",
             }
             params = {"select": "symbol,name,sector"}
-            resp = requests.get(url, headers=headers, params=params, timeout=10)
+            resp = get_session().get(url, headers=headers, params=params, timeout=10)
             resp.raise_for_status()
             rows = resp.json()
-            # unique symbol 기준 집계 (중복 심볼은 첫 번째 항목 사용)
+            # unique symbol 기준 집계 (중복 심볼은 첫 번째 항목의 이름·섹터 사용, 등록 수는 누적)
             result: dict = {}
             for row in rows:
                 symbol = row.get("symbol", "")
-                if symbol and symbol not in result:
+                if not symbol:
+                    continue
+                if symbol not in result:
                     result[symbol] = {
                         "name": row.get("name") or symbol,
                         "sector": row.get("sector") or "기타",
+                        "watchers": 0,
                     }
+                result[symbol]["watchers"] += 1
             logger.info("Supabase watchlist 조회 완료: %d개 unique 심볼", len(result))
             return result
         except Exception as e:
             logger.error("Supabase watchlist 조회 오류: %s", e)
             return {}
 
+    # ──────────────────────────────────────────
+    # 정규화 아카이브 (append-only 테이블, supabase_schema.sql 5번)
+    # ──────────────────────────────────────────
+
+    def bulk_insert(self, table: str, rows: list[dict], on_conflict: str,
+                    batch_size: int = BULK_INSERT_BATCH_SIZE, merge: bool = False) -> int:
+        """
+        다중 행 INSERT를 batch_size 단위로 전송 (충돌 행은 무시 — 기존 데이터 불변).
+        merge=True면 충돌 행을 새 값으로 갱신 (UPSERT).
+        배치 실패 시 경고 후 다음 배치 계속. 반환: 전송 성공한 행 수.
+        """
+        if not rows:
+            return 0
+        if not self.supabase_url or not self.supabase_key:
+            logger.warning("SUPABASE_URL/KEY 미설정 — %s 적재 생략", table)
+            return 0
+        url = f"{self.supabase_url}/rest/v1/{table}?on_conflict={on_conflict}"
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+            "Content-Type": "application/json",
+            "Prefer": f"resolution={'merge' if merge else 'ignore'}-duplicates,return=minimal",
+        }
+        sent_rows = 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            try:
+                resp, _, _ = self._send("POST", url, batch, headers)
+                resp.raise_for_status()
+                sent_rows += len(batch)
+            except Exception as e:
+                logger.warning("%s 배치 적재 실패 (%d~%d행): %s", table, start, start + len(batch) - 1, e)
+                continue
+        return sent_rows
+
+    def insert_articles(self, articles: list[dict], scorer: str = "vader+ko-lexicon.v1") -> dict[str, int]:
+        """
+        기사·감성 점수 적재. articles: [{"url", "title", "category", "symbol", "name", "date", "sentiment"}, ...]
+        같은 정규화 URL은 실행 내에서도 1행으로 합칩니다 (첫 항목 우선).
+        """
+        article_rows: dict[str, dict] = {}
+        sentiment_rows: list[dict] = []
+        for article in articles:
+            link = article.get("url")
+            if not link:
+                continue
+            key = format(url_hash(link), "016x")
+            if key in article_rows:
+                continue
+            article_rows[key] = {
+                "url_hash": key, "url": link, "title": article.get("title"),
+                "category": article.get("category"), "symbol": article.get("symbol"),
+                "source_name": article.get("name"), "published": article.get("date"),
+            }
+            if article.get("sentiment") is not None:
+                sentiment_rows.append({"url_hash": key, "scorer": scorer, "score": article["sentiment"]})
+        return {
+            "news_articles": self.bulk_insert("news_articles", list(article_rows.values()), "url_hash"),
+            # 감성은 기사 FK 참조 — 기사 적재 후 전송
+            "article_sentiment": self.bulk_insert("article_sentiment", sentiment_rows, "url_hash,scorer"),
+        }
+
+    def insert_price_bars(self, records: list[dict]) -> int:
+        """
+        OHLCV 일봉 적재 (get_stock_history / panel_to_records 레코드 형식).
+        (symbol, date) 충돌 시 갱신 — 장중 실행에서 적재된 당일 미완성 봉을 다음 실행의 값으로 덮어씀.
+        """
+        return self.bulk_insert("stock_history", records, "symbol,date", merge=True)
+
+    def insert_ai_summaries(self, summaries: dict[str, dict | str]) -> int:
+        """카테고리별 AI 요약 이력 적재. 구조화(dict) 요약만 저장하며 같은 내용은 해시로 중복 제거."""
+        rows = [
+            {"category": category, "content_hash": _digest(summary), "summary": summary}
+            for category, summary in summaries.items()
+            if isinstance(summary, dict)
+        ]
+        return self.bulk_insert("ai_summary_history", rows, "category,content_hash")
+
+    def archive_run(self, articles: list[dict], price_records: list[dict],
+                    summaries: dict[str, dict | str]) -> dict[str, int]:
+        """한 실행의 기사·감성·일봉·요약을 아카이브 테이블에 적재 (ARCHIVE_ENABLED=0이면 생략)."""
+        if not ARCHIVE_ENABLED:
+            return {}
+        stats = self.insert_articles(articles)
+        stats["stock_history"] = self.insert_price_bars(price_records)
+        stats["ai_summary_history"] = self.insert_ai_summaries(summaries)
+        logger.info("아카이브 적재 (행 수): %s", stats)
+        return stats
+
+    # ──────────────────────────────────────────
+    # 샤드 부분 결과 (engine="sharded", supabase_schema.sql 6번)
+    # 워커가 저장 → 코디네이터가 병합 후 삭제. 실패는 호출자(shard_service)가 샤드 단위로 처리
+    # ──────────────────────────────────────────
+
+    def put_shard_result(self, run_id: str, shard_id: int, payload: dict) -> None:
+        if not self.supabase_url or not self.supabase_key:
+            raise RuntimeError("SUPABASE_URL/KEY 미설정 — 샤드 결과 저장 불가")
+        url = f"{self.supabase_url}/rest/v1/sync_shard_results?on_conflict=run_id,shard_id"
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+            "Content-Type": "application/json",
+            "Prefer": "resolution=merge-duplicates,return=minimal",   # 워커 재시도 시 덮어쓰기
+        }
+        resp, _, _ = self._send("POST", url, {"run_id": run_id, "shard_id": shard_id, "payload": payload}, headers)
+        resp.raise_for_status()
+
+    def get_shard_results(self, run_id: str) -> dict[int, dict]:
+        """run_id의 샤드 결과 전체 → {shard_id: payload}."""
+        if not self.supabase_url or not self.supabase_key:
+            raise RuntimeError("SUPABASE_URL/KEY 미설정 — 샤드 결과 조회 불가")
+        url = f"{self.supabase_url}/rest/v1/sync_shard_results"
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+        }
+        params = {"select": "shard_id,payload", "run_id": f"eq.{run_id}"}
+        resp = get_session().get(url, headers=headers, params=params, timeout=10)
+        resp.raise_for_status()
+        return {row["shard_id"]: row["payload"] for row in resp.json()}
+
+    def delete_shard_results(self, run_id: str) -> None:
+        if not self.supabase_url or not self.supabase_key:
+            return
+        url = f"{self.supabase_url}/rest/v1/sync_shard_results"
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+        }
+        resp = get_session().request("DELETE", url, headers=headers, params={"run_id": f"eq.{run_id}"}, timeout=10)
+        resp.raise_for_status()
+
+    # ──────────────────────────────────────────
+    # 종목 뉴스 스케줄러 상태 (SCHEDULER_STATE_STORE=supabase, supabase_schema.sql 7번)
+    # 실패는 호출자(scheduler_service)가 경고 후 캐시 디렉터리 상태만으로 진행
+    # ──────────────────────────────────────────
+
+    def get_scheduler_state(self, symbols: list[str]) -> dict[str, dict]:
+        """symbols의 저장된 상태 → {symbol: {"refreshed_at": float, "result": [context, links]}}."""
+        if not symbols:
+            return {}
+        if not self.supabase_url or not self.supabase_key:
+            raise RuntimeError("SUPABASE_URL/KEY 미설정 — 스케줄러 상태 조회 불가")
+        url = f"{self.supabase_url}/rest/v1/news_scheduler_state"
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+        }
+        # 티커의 "."(005930.KS 등)이 in 목록 구분과 섞이지 않도록 값마다 큰따옴표
+        quoted = ",".join(f'"{symbol}"' for symbol in symbols)
+        params = {"select": "symbol,refreshed_at,result", "symbol": f"in.({quoted})"}
+        resp = get_session().get(url, headers=headers, params=params, timeout=10)
+        resp.raise_for_status()
+        return {row["symbol"]: {"refreshed_at": row["refreshed_at"], "result": row["result"]} for row in resp.json()}
+
+    def put_scheduler_state(self, states: dict[str, dict]) -> int:
+        """{symbol: {"refreshed_at", "result"}} UPSERT. 반환: 전송 성공한 행 수."""
+        rows = [{"symbol": symbol, "refreshed_at": state["refreshed_at"], "result": state["result"]}
+                for symbol, state in states.items()]
+        return self.bulk_insert("news_scheduler_state", rows, on_conflict="symbol", merge=True)
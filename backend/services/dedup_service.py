@@ -0,0 +1,294 @@
+import os
+import re
+import time
+import base64
+import hashlib
+import logging
+import threading
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import numpy as np
+
+try:
+    from backend.config.cache import resolve_cache_dir, DEDUP_INDEX_MAX_ENTRIES, DEDUP_INDEX_MAX_AGE_SECONDS
+except ModuleNotFoundError:
+    from config.cache import resolve_cache_dir, DEDUP_INDEX_MAX_ENTRIES, DEDUP_INDEX_MAX_AGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 1. URL 정규화
+# =============================================================================
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ocid", "cmpid", "ncid", "soc_src", "soc_trk", "ref", "ref_src", "src", "guccounter",
+    "guce_referrer", "guce_referrer_sig", "spm", "tsrc", "feature", "share",
+}
+_REDIRECT_PARAMS = ("url", "u", "q", "target")
+
+
+def _decode_google_news_id(article_id: str) -> str | None:
+    """구형 Google News RSS 기사 ID(base64 protobuf)에 내장된 원문 URL 추출. 신형 ID는 None."""
+    try:
+        raw = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    start = raw.find(b"http")
+    if start < 0:
+        return None
+    end = start
+    while end < len(raw) and 0x21 <= raw[end] < 0x7f:
+        end += 1
+    return raw[start:end].decode("ascii", "ignore") or None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL을 하나의 형태로 정규화합니다.
+    - 리다이렉트형 링크(google.com/url?q=…, news.google.com/rss/articles/<id>) → 원문 URL
+    - 스킴·호스트 소문자, www. 제거, fragment 제거, 끝 슬래시 제거
+    - utm_* 및 알려진 추적 파라미터 제거, 나머지 쿼리 정렬
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    query = parse_qsl(parts.query, keep_blank_values=False)
+
+    if host.endswith("google.com"):
+        for key, value in query:
+            if key in _REDIRECT_PARAMS and value.startswith("http"):
+                return canonicalize_url(value)
+        if host == "news.google.com" and "/articles/" in parts.path:
+            decoded = _decode_google_news_id(parts.path.rsplit("/", 1)[-1])
+            if decoded:
+                return canonicalize_url(decoded)
+            query = []  # 신형 ID는 해석 불가 — hl/gl 등 지역 파라미터만 제거해 동일 기사 통일
+
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in query
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+def url_hash(url: str) -> int:
+    """정규화 URL의 64비트 해시 (지문 인덱스 키)."""
+    return int.from_bytes(hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+_NO_URL = 0   # URL 없는 항목의 인덱스 키 — URL 일치 판정에서 제외 (MinHash로만 비교)
+
+
+def _index_key(url: str) -> int:
+    """NearDupIndex URL 키 — 정규화 URL이 비면 _NO_URL (빈 URL끼리 같은 기사로 판정하지 않도록)."""
+    return url_hash(url) if canonicalize_url(url) else _NO_URL
+
+
+# =============================================================================
+# 2. MinHash 서명 (문자 3-gram shingle — 한국어·영어 공통)
+# =============================================================================
+NUM_PERM = 64
+BANDS = 16                       # 16 밴드 × 4 행 → Jaccard 0.7에서 후보 검출 확률 ≈ 0.99
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.7       # 서명 일치율(≈ shingle Jaccard) 기준 — 기존 SequenceMatcher 0.85와 유사한 판정
+
+_rng = np.random.default_rng(20260322)
+_PERM_A = _rng.integers(1, 2**63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)   # 홀수 곱셈 계수
+_PERM_B = _rng.integers(0, 2**63, size=NUM_PERM, dtype=np.uint64)
+_norm_re = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _shingles(title: str, k: int = 3) -> set[str]:
+    text = _norm_re.sub("", unicodedata.normalize("NFKC", title or "").lower())
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def minhash_signature(title: str) -> np.ndarray | None:
+    """제목의 MinHash 서명 (uint32 × NUM_PERM). 빈 제목은 None."""
+    shingles = _shingles(title)
+    if not shingles:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles),
+        dtype=np.uint64, count=len(shingles),
+    )
+    # multiply-shift 해시족: (a·h + b) mod 2^64 의 상위 32비트 — uint64 오버플로가 곧 mod 2^64
+    with np.errstate(over="ignore"):
+        permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def _band_keys(signature: np.ndarray) -> list[int]:
+    return [hash((band, signature[band * ROWS:(band + 1) * ROWS].tobytes())) for band in range(BANDS)]
+
+
+# =============================================================================
+# 3. LSH 인덱스
+# =============================================================================
+class NearDupIndex:
+    """
+    정규화 URL 해시 + MinHash LSH 기반 중복 기사 인덱스.
+
+    add()/is_duplicate()는 밴드 버킷에 걸린 후보만 비교하므로 기사 수에 선형 비용.
+    path를 주면 load()/save()로 최근 지문을 파일에 유지 (지문 수·보관 기간 제한).
+    """
+
+    def __init__(self, path: str | None = None,
+                 max_entries: int = DEDUP_INDEX_MAX_ENTRIES,
+                 max_age_seconds: int = DEDUP_INDEX_MAX_AGE_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._url_hashes: list[int] = []
+        self._signatures: list[np.ndarray] = []
+        self._seen_at: list[float] = []
+        self._url_set: set[int] = set()
+        self._buckets: dict[int, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._url_hashes)
+
+    def _insert(self, uhash: int, signature: np.ndarray, seen_at: float) -> None:
+        idx = len(self._url_hashes)
+        self._url_hashes.append(uhash)
+        self._signatures.append(signature)
+        self._seen_at.append(seen_at)
+        if uhash != _NO_URL:
+            self._url_set.add(uhash)
+        for key in _band_keys(signature):
+            self._buckets.setdefault(key, []).append(idx)
+
+    def _match(self, uhash: int, signature: np.ndarray | None) -> bool:
+        if uhash != _NO_URL and uhash in self._url_set:
+            return True
+        if signature is None:
+            return False
+        candidates = {i for key in _band_keys(signature) for i in self._buckets.get(key, ())}
+        return any(
+            np.count_nonzero(self._signatures[i] == signature) / NUM_PERM >= SIMILARITY_THRESHOLD
+            for i in candidates
+        )
+
+    def is_duplicate(self, title: str, url: str) -> bool:
+        """이미 본 기사(같은 정규화 URL 또는 유사 제목)인지 확인만 합니다 (인덱스 변경 없음)."""
+        with self._lock:
+            return self._match(_index_key(url), minhash_signature(title))
+
+    def add(self, title: str, url: str) -> bool:
+        """중복이 아니면 인덱스에 추가하고 True, 중복이면 False."""
+        uhash, signature = _index_key(url), minhash_signature(title)
+        with self._lock:
+            if self._match(uhash, signature):
+                return False
+            if signature is None:
+                if uhash != _NO_URL:
+                    self._url_set.add(uhash)  # 제목 없는 기사는 URL로만 판정 (URL도 없으면 비교 대상 없음)
+            else:
+                self._insert(uhash, signature, time.time())
+            return True
+
+    def load(self) -> None:
+        """파일에서 보관 기간 내 지문을 불러옵니다 (파일 없음·손상 시 빈 인덱스)."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as data:
+                url_hashes, signatures, seen_at = data["url_hashes"], data["signatures"], data["seen_at"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("중복 제거 인덱스 로드 실패 — 새로 시작: %s", e)
+            return
+        cutoff = time.time() - self.max_age_seconds
+        keep = np.flatnonzero(seen_at >= cutoff)[-self.max_entries:]
+        with self._lock:
+            for i in keep:
+                self._insert(int(url_hashes[i]), signatures[i], float(seen_at[i]))
+        logger.info("중복 제거 인덱스 로드: %d건", len(keep))
+
+    def _reset(self) -> None:
+        self._url_hashes, self._signatures, self._seen_at = [], [], []
+        self._url_set, self._buckets = set(), {}
+
+    def save(self) -> None:
+        """
+        최근 max_entries건만 보관 기간 내에서 저장 (원자적 교체).
+        메모리 인덱스도 같은 범위로 다시 구성 — warm Lambda 싱글턴이 실행마다 커지지 않도록.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            cutoff = time.time() - self.max_age_seconds
+            keep = [i for i, t in enumerate(self._seen_at) if t >= cutoff][-self.max_entries:]
+            url_hashes = np.array([self._url_hashes[i] for i in keep], dtype=np.uint64)
+            signatures = np.array([self._signatures[i] for i in keep], dtype=np.uint32).reshape(-1, NUM_PERM)
+            seen_at = np.array([self._seen_at[i] for i in keep], dtype=np.float64)
+            self._reset()
+            for i in range(len(keep)):
+                self._insert(int(url_hashes[i]), signatures[i], float(seen_at[i]))
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp.npz"
+            np.savez(tmp_path, url_hashes=url_hashes, signatures=signatures, seen_at=seen_at)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("중복 제거 인덱스 저장 실패: %s", e)
+
+
+def deduplicate(links: list[dict], index: NearDupIndex | None = None) -> list[dict]:
+    """
+    links를 순서대로 훑어 정규화 URL 또는 유사 제목이 앞선 기사와 겹치면 제거합니다.
+    index를 주면 그 인덱스(예: 피드 전체·최근 실행 지문)에 누적됩니다.
+    """
+    index = index if index is not None else NearDupIndex()
+    return [link for link in links if index.add(link.get("title", ""), link.get("url", ""))]
+
+
+_recent_index: NearDupIndex | None = None
+_recent_lock = threading.Lock()
+
+
+def get_recent_index() -> NearDupIndex:
+    """최근 실행들의 기사 지문 인덱스 싱글턴 — 캐시 디렉터리 파일과 warm start 메모리에 유지."""
+    global _recent_index
+    with _recent_lock:
+        if _recent_index is None:
+            _recent_index = NearDupIndex(os.path.join(resolve_cache_dir(), "dedup_index.npz"))
+            _recent_index.load()
+        return _recent_index
+
+
+class FeedDeduper:
+    """
+    실행 단위 기사 중복 제거 — 작업 결과(links)를 병합 순서대로 걸러 피드·AI 컨텍스트·아카이브가 같은 기사 집합을 보도록.
+    먼저 병합된 작업(매크로 → 한국 거시 → 종목)의 기사가 남고, 뒤 작업의 같은·유사 기사는 제거됩니다.
+
+    recent(최근 실행 지문 인덱스)를 주면 이번 실행 기사 중 이전 실행에서 이미 본 기사 수를 집계하고 새 지문을 추가합니다
+    (저장은 호출자가 실행 끝에). 피드는 매 실행 전체 교체되므로 이전 실행 기사라도 제거하지 않습니다.
+    stats: {"kept": 유지 건수, "removed": 실행 내 중복 제거 건수, "seen_before": 이전 실행에서 본 건수}
+    """
+
+    def __init__(self, recent: NearDupIndex | None = None):
+        self.recent = recent
+        self._run_index = NearDupIndex()
+        self.stats = {"kept": 0, "removed": 0, "seen_before": 0}
+
+    def filter(self, links: list[dict]) -> list[dict]:
+        """앞서 통과한 기사와 겹치지 않는 links만 반환 (통과한 기사는 인덱스에 추가)."""
+        kept = []
+        for link in links:
+            title, url = link.get("title") or "", link.get("url") or ""
+            if not self._run_index.add(title, url):
+                self.stats["removed"] += 1
+                continue
+            if self.recent is not None and not self.recent.add(title, url):
+                self.stats["seen_before"] += 1
+            kept.append(link)
+        self.stats["kept"] += len(kept)
+        return kept
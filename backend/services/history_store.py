@@ -0,0 +1,182 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from datetime import date, timedelta
+
+try:
+    from backend.config.cache import (
+        resolve_cache_dir, HISTORY_CACHE_REFRESH_SECONDS, HISTORY_CACHE_TTL_SECONDS,
+        HISTORY_CACHE_MAX_SYMBOLS, HISTORY_CACHE_RETENTION_DAYS,
+    )
+except ModuleNotFoundError:
+    from config.cache import (
+        resolve_cache_dir, HISTORY_CACHE_REFRESH_SECONDS, HISTORY_CACHE_TTL_SECONDS,
+        HISTORY_CACHE_MAX_SYMBOLS, HISTORY_CACHE_RETENTION_DAYS,
+    )
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol  TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    open    REAL,
+    high    REAL,
+    low     REAL,
+    close   REAL,
+    volume  INTEGER,
+    PRIMARY KEY (symbol, date)
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    symbol       TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,     -- 전체 조회 시점의 기간 시작일 (이후 구간은 캐시가 보장)
+    fetched_at   REAL NOT NULL,
+    last_access  REAL NOT NULL
+);
+"""
+
+
+class HistoryStore:
+    """
+    종목별 일봉 OHLCV를 SQLite 파일에 보관하는 증분 캐시.
+
+    - plan(): 종목별로 캐시 그대로 사용(hit) / 마지막 캐시 일자 이후만 조회(partial) / 전체 조회(miss) 분류
+    - upsert(): 새로 받은 봉을 (symbol, date) 기준으로 덮어쓰기 (장중 미완성 봉 갱신)
+    - evict(): TTL·최대 종목 수·보존 기간 기준 정리
+    """
+
+    def __init__(self, path: str,
+                 refresh_seconds: int = HISTORY_CACHE_REFRESH_SECONDS,
+                 ttl_seconds: int = HISTORY_CACHE_TTL_SECONDS,
+                 max_symbols: int = HISTORY_CACHE_MAX_SYMBOLS,
+                 retention_days: int = HISTORY_CACHE_RETENTION_DAYS):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_symbols = max_symbols
+        self.retention_days = retention_days
+        self.stats = {"hits": 0, "partial": 0, "misses": 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def plan(self, symbols: list[str], window_start: str) -> tuple[list[str], dict[str, str], list[str]]:
+        """
+        종목별 수집 계획을 세웁니다.
+
+        Returns:
+            (fresh, tail, full)
+            fresh: 최근 refresh_seconds 내 갱신 → 네트워크 조회 불필요
+            tail:  {symbol: 마지막 캐시 일자} → 해당 일자부터 꼬리만 조회
+            full:  캐시 없음 또는 window_start 이전 구간 누락 → 전체 기간 조회
+        """
+        now = time.time()
+        fresh, tail, full = [], {}, []
+        with self._lock, self._connect() as conn:
+            for symbol in symbols:
+                row = conn.execute(
+                    "SELECT s.covered_from, s.fetched_at, MAX(b.date) FROM symbols s "
+                    "LEFT JOIN bars b ON b.symbol = s.symbol WHERE s.symbol = ?",
+                    (symbol,),
+                ).fetchone()
+                covered_from, fetched_at, last_date = row if row else (None, None, None)
+                if covered_from is None or last_date is None or covered_from > window_start:
+                    full.append(symbol)
+                elif now - fetched_at < self.refresh_seconds:
+                    fresh.append(symbol)
+                else:
+                    tail[symbol] = last_date
+            self.stats["hits"] += len(fresh)
+            self.stats["partial"] += len(tail)
+            self.stats["misses"] += len(full)
+        return fresh, tail, full
+
+    def upsert(self, records: list[dict], symbols: list[str], covered_from: str | None = None) -> None:
+        """
+        봉 레코드를 저장하고, symbols의 fetched_at을 현재 시각으로 갱신합니다.
+        covered_from: 전체 기간 조회였다면 그 기간 시작일 (꼬리 조회면 None → 기존 값 유지)
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars (symbol, date, open, high, low, close, volume) "
+                "VALUES (:symbol, :date, :open, :high, :low, :close, :volume)",
+                records,
+            )
+            conn.executemany(
+                "INSERT INTO symbols (symbol, covered_from, fetched_at, last_access) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(symbol) DO UPDATE SET fetched_at = excluded.fetched_at, "
+                "covered_from = COALESCE(?, covered_from)",
+                [(symbol, covered_from or "9999-12-31", now, now, covered_from) for symbol in symbols],
+            )
+
+    def load(self, symbols: list[str], window_start: str) -> list[tuple]:
+        """window_start 이후 봉을 (symbol, date, open, high, low, close, volume) 튜플로 반환."""
+        if not symbols:
+            return []
+        now = time.time()
+        placeholders = ",".join("?" * len(symbols))
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"UPDATE symbols SET last_access = ? WHERE symbol IN ({placeholders})",
+                (now, *symbols),
+            )
+            return conn.execute(
+                "SELECT symbol, date, open, high, low, close, volume FROM bars "
+                f"WHERE symbol IN ({placeholders}) AND date >= ? ORDER BY date",
+                (*symbols, window_start),
+            ).fetchall()
+
+    def evict(self) -> int:
+        """TTL 만료·최대 종목 수 초과 종목과 보존 기간 밖의 봉을 삭제하고, 삭제한 종목 수를 반환."""
+        cutoff_access = time.time() - self.ttl_seconds
+        cutoff_date = (date.today() - timedelta(days=self.retention_days)).isoformat()
+        with self._lock, self._connect() as conn:
+            stale = [r[0] for r in conn.execute(
+                "SELECT symbol FROM symbols WHERE last_access < ?", (cutoff_access,)
+            )]
+            overflow = [r[0] for r in conn.execute(
+                "SELECT symbol FROM symbols WHERE last_access >= ? "
+                "ORDER BY last_access DESC LIMIT -1 OFFSET ?",
+                (cutoff_access, self.max_symbols),
+            )]
+            evicted = stale + overflow
+            conn.executemany("DELETE FROM symbols WHERE symbol = ?", [(s,) for s in evicted])
+            conn.executemany("DELETE FROM bars WHERE symbol = ?", [(s,) for s in evicted])
+            conn.execute("DELETE FROM bars WHERE date < ?", (cutoff_date,))
+        if evicted:
+            logger.info("히스토리 캐시 정리: %d개 종목 삭제", len(evicted))
+        return len(evicted)
+
+    def get_stats(self) -> dict:
+        """hit/partial/miss 누적 카운터 사본."""
+        with self._lock:
+            return dict(self.stats)
+
+
+_store: HistoryStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore | None:
+    """
+    모듈 단위 HistoryStore 싱글턴 — Lambda warm start 시 /tmp 파일과 카운터를 재사용합니다.
+    캐시 디렉터리를 쓸 수 없으면 None (호출자는 캐시 없이 전체 조회).
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            path = os.path.join(resolve_cache_dir(), "history.sqlite3")
+            try:
+                _store = HistoryStore(path)
+                logger.info("히스토리 캐시 사용: %s", path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("히스토리 캐시 초기화 실패 — 캐시 없이 진행: %s", e)
+                return None
+        return _store
@@ -0,0 +1,117 @@
+import os
+import logging
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+try:
+    from backend.config.limits import HTTP_POOL_CONFIG, HTTP_RETRY_BACKOFF, HTTP_RETRY_STATUS, HTTP_DEFAULT_TIMEOUT
+    from backend.services import tracing
+except ModuleNotFoundError:
+    from config.limits import HTTP_POOL_CONFIG, HTTP_RETRY_BACKOFF, HTTP_RETRY_STATUS, HTTP_DEFAULT_TIMEOUT
+    from services import tracing
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 연결 수립·요청 수 — reused = requests - opened
+_stats: dict[str, dict[str, int]] = defaultdict(lambda: {"opened": 0, "requests": 0})
+_stats_lock = threading.Lock()
+
+
+def _count(host: str, field: str) -> None:
+    with _stats_lock:
+        _stats[host or "?"][field] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "opened")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "opened")
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    """
+    새 TCP/TLS 연결 수립 횟수를 집계하고, timeout 미지정 요청에 기본 timeout을 적용하는 어댑터.
+    응답 바이트(비스트리밍)·재시도 횟수는 현재 tracing span에 기록합니다.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, timeout=None, **kwargs):
+        _count(urlparse(request.url).hostname, "requests")
+        resp = super().send(request, timeout=timeout or HTTP_DEFAULT_TIMEOUT, **kwargs)
+        retries = getattr(resp.raw, "retries", None)
+        if retries is not None and retries.history:
+            tracing.annotate("retries", len(retries.history))
+        # 스트리밍 응답은 소비하는 쪽(news_service._stream_rss_items)에서 청크 단위로 기록
+        if not kwargs.get("stream"):
+            tracing.annotate("bytes", len(resp.content))
+        return resp
+
+
+def _make_adapter(pool: int, retries: int) -> HTTPAdapter:
+    retry = Retry(
+        total=retries,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUS,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 최종 응답은 호출부 raise_for_status()가 처리
+    )
+    return _PooledAdapter(pool_connections=1, pool_maxsize=pool, max_retries=retry)
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    모든 외부 HTTP 호출(news_service, DBService)이 공유하는 requests.Session 싱글턴.
+    모듈 레벨에 유지되어 warm Lambda 호출 간에도 keep-alive 연결을 재사용합니다.
+    호스트별 풀 크기·재시도는 HTTP_POOL_CONFIG를 따릅니다.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            default = HTTP_POOL_CONFIG["default"]
+            session.mount("https://", _make_adapter(default["pool"], default["retries"]))
+            session.mount("http://", _make_adapter(default["pool"], default["retries"]))
+            hosts = {h: c for h, c in HTTP_POOL_CONFIG.items() if h not in ("default", "supabase")}
+            supabase_host = urlparse(os.environ.get("SUPABASE_URL") or "").hostname
+            if supabase_host:
+                hosts[supabase_host] = HTTP_POOL_CONFIG["supabase"]
+            for host, conf in hosts.items():
+                session.mount(f"https://{host}", _make_adapter(conf["pool"], conf["retries"]))
+            _session = session
+        return _session
+
+
+def get_connection_stats() -> dict:
+    """호스트별 {opened, reused, requests} 집계."""
+    with _stats_lock:
+        return {
+            host: {"opened": s["opened"], "reused": max(s["requests"] - s["opened"], 0), "requests": s["requests"]}
+            for host, s in _stats.items()
+        }
+
+
+def reset_connection_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
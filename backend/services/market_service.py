@@ -1,32 +1,157 @@
+import re
+import sqlite3
 import logging
-import yfinance as yf
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+
+try:
+    from backend.config.cache import HISTORY_CACHE_ENABLED
+    from backend.services.history_store import get_history_store
+except ModuleNotFoundError:
+    from config.cache import HISTORY_CACHE_ENABLED
+    from services.history_store import get_history_store
 
 logger = logging.getLogger(__name__)
 
+
+def _yf():
+    """yfinance 지연 import — 하위 모듈(~0.2s) 로드를 첫 시세 조회 시점으로 미룸 (이후 sys.modules 재사용)."""
+    import yfinance
+    return yfinance
+
 def calc_change(price, prev_close):
     """가격 변동률 계산"""
     if prev_close is None or prev_close == 0:
         return 0.0
     return round(((price - prev_close) / prev_close) * 100, 2)
 
-def get_market_indices(indices_config):
-    """지수 및 지표 데이터 수집 (KOSPI, S&P500 등)"""
+def _field_frame(data, field: str, symbols: list[str]):
+    """yf.download 결과에서 field(Close/Volume 등) 열을 심볼 순서의 DataFrame으로 추출."""
+    if data is None or data.empty:
+        return None
+    if getattr(data.columns, "nlevels", 1) > 1:
+        if field not in data.columns.get_level_values(0):
+            return None
+        frame = data[field]
+    else:
+        # 단일 레벨 컬럼(구버전 yfinance 단일 티커) → 해당 심볼 1열로 취급
+        if field not in data.columns or len(symbols) != 1:
+            return None
+        frame = data[[field]].set_axis(symbols, axis=1)
+    return frame.reindex(columns=symbols)
+
+
+def _valid_order(values: np.ndarray) -> np.ndarray:
+    """열마다 NaN 행을 앞으로, 유효 행을 뒤로 보내는 정렬 인덱스 (유효 행 간 순서 유지).
+
+    np.take_along_axis(values, order, axis=0)[-k]는 각 열의 뒤에서 k번째 유효값이 됩니다.
+    거래일이 다른 시장(KR/US)을 한 프레임에 섞었을 때 생기는 NaN 구멍을 건너뛰기 위함.
+    """
+    return np.argsort(~np.isnan(values), axis=0, kind="stable")
+
+
+def get_market_snapshot(symbols: list[str], period: str = "5d") -> dict:
+    """
+    여러 티커의 현재가·전일 종가·거래량을 yf.download 1회로 일괄 수집합니다.
+
+    심볼 수와 무관하게 네트워크 왕복이 일정하도록 fast_info 개별 조회를 대체합니다.
+
+    Returns:
+        컬럼형 dict — 같은 위치가 같은 심볼을 가리킴 (누락 값은 None):
+        {"symbol": [str], "price": [float|None], "prev_close": [float|None],
+         "volume": [int|None], "index": {symbol: 위치}}
+    """
+    symbols = list(dict.fromkeys(symbols))  # 순서 유지 중복 제거
+    snapshot = {"symbol": symbols, "price": [None] * len(symbols),
+                "prev_close": [None] * len(symbols), "volume": [None] * len(symbols),
+                "index": {sym: i for i, sym in enumerate(symbols)}}
+    if not symbols:
+        return snapshot
+    try:
+        data = _yf().download(
+            symbols, period=period, interval="1d", group_by="column",
+            auto_adjust=False, progress=False, threads=True,
+        )
+        close = _field_frame(data, "Close", symbols)
+        if close is None:
+            logger.warning("일괄 시세 수집 결과 없음 (%d개 심볼)", len(symbols))
+            return snapshot
+        close_arr = close.to_numpy(dtype=float)
+        volume = _field_frame(data, "Volume", symbols)
+        volume_arr = volume.to_numpy(dtype=float) if volume is not None else np.full_like(close_arr, np.nan)
+
+        # 종가 유효 행 기준으로 정렬해 마지막/직전 거래일 값을 벡터 연산으로 추출
+        order = _valid_order(close_arr)
+        closes = np.take_along_axis(close_arr, order, axis=0)
+        volumes = np.take_along_axis(volume_arr, order, axis=0)
+        last = closes[-1]
+        prev = closes[-2] if len(closes) >= 2 else np.full(len(symbols), np.nan)
+        last_vol = volumes[-1]
+
+        snapshot["price"] = [None if np.isnan(v) else float(v) for v in last]
+        snapshot["prev_close"] = [None if np.isnan(v) else float(v) for v in prev]
+        snapshot["volume"] = [None if np.isnan(v) else int(v) for v in last_vol]
+        logger.info("일괄 시세 수집 완료: %d/%d개 심볼",
+                    sum(p is not None for p in snapshot["price"]), len(symbols))
+    except Exception as e:
+        logger.warning("일괄 시세 수집 실패 (%d개 심볼): %s", len(symbols), e)
+    return snapshot
+
+
+def _snapshot_quote(snapshot: dict | None, symbol: str) -> tuple:
+    """스냅샷에서 (price, prev_close, volume) 조회. 없으면 (None, None, None)."""
+    if not snapshot or symbol not in snapshot["index"]:
+        return None, None, None
+    i = snapshot["index"][symbol]
+    return snapshot["price"][i], snapshot["prev_close"][i], snapshot["volume"][i]
+
+
+def snapshot_metrics(snapshot: dict | None, symbols: list[str]) -> dict[str, dict]:
+    """스냅샷에 있는 심볼의 {symbol: {"change_percent", "volume"}} (개별 조회 폴백 없음 — 누락 심볼은 제외)."""
+    metrics = {}
+    for symbol in symbols:
+        price, prev_close, volume = _snapshot_quote(snapshot, symbol)
+        if price is not None:
+            metrics[symbol] = {"change_percent": calc_change(price, prev_close), "volume": volume}
+    return metrics
+
+
+def _fetch_quote_single(ticker: str) -> tuple:
+    """일괄 수집에서 누락된 티커 전용 개별 조회 (fast_info → history 폴백)."""
+    t = _yf().Ticker(ticker)
+    # [P2 Fix] [] 직접 접근 → .get()으로 KeyError 방어
+    price = t.fast_info.get('last_price')
+    prev = t.fast_info.get('previous_close')
+    volume = t.fast_info.get('last_volume')
+    # 장외 시간 fast_info None → history 폴백
+    if price is None:
+        hist = t.history(period="5d")
+        if hist.empty:
+            return None, None, volume
+        price = float(hist['Close'].iloc[-1])
+        prev = float(hist['Close'].iloc[-2]) if len(hist) >= 2 else None
+        volume = int(hist['Volume'].iloc[-1]) if volume is None else volume
+        logger.info("fast_info 폴백 (history) 사용: %s = %.2f", ticker, price)
+    return price, prev, volume
+
+
+def get_market_indices(indices_config, snapshot: dict | None = None):
+    """지수 및 지표 데이터 수집 (KOSPI, S&P500 등)
+
+    snapshot: get_market_snapshot() 결과. 없으면 indices_config 티커만 일괄 수집.
+    """
+    if snapshot is None:
+        snapshot = get_market_snapshot(list(indices_config.values()))
     updates = {}
     for name, ticker in indices_config.items():
         try:
-            t = yf.Ticker(ticker)
-            # [P2 Fix] [] 직접 접근 → .get()으로 KeyError 방어
-            price = t.fast_info.get('last_price')
-            prev = t.fast_info.get('previous_close')
-            # fast_info 누락 시 history 폴백 (get_stock_history()와 동일 패턴)
+            price, prev, _ = _snapshot_quote(snapshot, ticker)
             if price is None:
-                hist = t.history(period="5d")
-                if hist.empty:
-                    logger.warning("fast_info 누락 + history 없음 (%s): skip", name)
-                    continue
-                price = float(hist['Close'].iloc[-1])
-                prev = float(hist['Close'].iloc[-2]) if len(hist) >= 2 else None
-                logger.info("fast_info 폴백 (history) 사용: %s = %.2f", name, price)
+                price, prev, _ = _fetch_quote_single(ticker)
+            if price is None:
+                logger.warning("일괄 수집 누락 + history 없음 (%s): skip", name)
+                continue
             updates[name] = {
                 "price": round(price, 2),
                 "change_percent": calc_change(price, prev)
@@ -36,29 +161,20 @@ def get_market_indices(indices_config):
             continue
     return updates
 
-def get_top_volume_stocks(ticker_list, top_n=10):
-    """거래량 상위 종목 수집"""
+def get_top_volume_stocks(ticker_list, top_n=10, snapshot: dict | None = None):
+    """거래량 상위 종목 수집
+
+    snapshot: get_market_snapshot() 결과. 없으면 ticker_list만 일괄 수집.
+    """
     try:
-        tickers = yf.Tickers(" ".join(ticker_list))
+        if snapshot is None:
+            snapshot = get_market_snapshot(ticker_list)
         ranking = []
         for symbol in ticker_list:
             try:
-                t = tickers.tickers[symbol]
-                # [P2 Fix] [] 직접 접근 → .get()으로 KeyError 방어
-                price = t.fast_info.get('last_price')
-                volume = t.fast_info.get('last_volume')
-                prev_close = t.fast_info.get('previous_close')
-
-                # 장외 시간 fast_info None → history 폴백 (get_market_indices()와 동일 패턴)
-                if price is None:
-                    hist = t.history(period="5d")
-                    if hist.empty:
-                        logger.warning("fast_info 누락 + history 없음 (%s): skip", symbol)
-                        continue
-                    price = float(hist['Close'].iloc[-1])
-                    prev_close = float(hist['Close'].iloc[-2]) if len(hist) >= 2 else None
-                    volume = int(hist['Volume'].iloc[-1]) if volume is None else volume
-                    logger.info("fast_info 폴백 (history) 사용: %s = %.2f", symbol, price)
+                price, prev_close, volume = _snapshot_quote(snapshot, symbol)
+                if price is None or volume is None:
+                    price, prev_close, volume = _fetch_quote_single(symbol)
 
                 if price is not None and volume is not None:
                     ranking.append({
@@ -67,6 +183,8 @@ def get_top_volume_stocks(ticker_list, top_n=10):
                         "volume": volume,
                         "change_percent": calc_change(price, prev_close)
                     })
+                else:
+                    logger.warning("일괄 수집 누락 + history 없음 (%s): skip", symbol)
             except Exception as e:
                 logger.warning("Skipping ticker %s: %s", symbol, e)
                 continue
@@ -75,9 +193,174 @@ def get_top_volume_stocks(ticker_list, top_n=10):
         logger.error("Stock Data Error: %s", e)
         return []
 
+_OHLCV_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def _download_panel(symbols: list[str], **kwargs) -> pd.DataFrame | None:
+    """yf.download 1회로 OHLCV 패널 수집. kwargs는 period 또는 start를 그대로 전달."""
+    try:
+        data = _yf().download(
+            symbols, interval="1d", group_by="column",
+            auto_adjust=False, progress=False, threads=True, **kwargs,
+        )
+        frames = {}
+        for field in _OHLCV_FIELDS:
+            frame = _field_frame(data, field, symbols)
+            if frame is not None:
+                frames[field] = frame
+        if "Close" not in frames:
+            logger.warning("히스토리 일괄 수집 결과 없음 (%d개 심볼)", len(symbols))
+            return None
+        panel = pd.concat(frames, axis=1)
+        logger.info("히스토리 일괄 수집 완료: %d개 심볼, %d거래일", len(symbols), len(panel))
+        return panel
+    except Exception as e:
+        logger.warning("히스토리 일괄 수집 실패 (%d개 심볼): %s", len(symbols), e)
+        return None
+
+
+def _store_panel(store, panel: pd.DataFrame | None, symbols: list[str],
+                 covered_from: str | None = None) -> None:
+    """수집한 패널을 캐시에 저장. 데이터가 없는 종목은 fetched_at을 갱신하지 않아 다음 실행에 재시도."""
+    records, stored = [], []
+    for symbol in symbols:
+        symbol_records = panel_to_records(panel, symbol)
+        if symbol_records:
+            records.extend(symbol_records)
+            stored.append(symbol)
+    if stored:
+        store.upsert(records, stored, covered_from=covered_from)
+
+
+def _panel_from_rows(rows: list[tuple], symbols: list[str]) -> pd.DataFrame | None:
+    """캐시 행 (symbol, date, o, h, l, c, v)을 get_history_panel() 형식 패널로 변환."""
+    if not rows:
+        return None
+    frame = pd.DataFrame(rows, columns=["symbol", "date", *_OHLCV_FIELDS])
+    frame["date"] = pd.to_datetime(frame["date"])
+    panel = frame.pivot(index="date", columns="symbol", values=list(_OHLCV_FIELDS))
+    columns = pd.MultiIndex.from_product([_OHLCV_FIELDS, symbols])
+    return panel.reindex(columns=columns).astype(float).sort_index()
+
+
+_period_re = re.compile(r"^(\d+)d$")
+
+
+def get_history_panel(symbols: list[str], period: str = "60d",
+                      use_cache: bool = HISTORY_CACHE_ENABLED) -> pd.DataFrame | None:
+    """여러 종목의 OHLCV 히스토리를 패널(DataFrame)로 반환합니다.
+
+    로컬 캐시(history_store)가 있으면 종목별로 마지막 캐시 일자 이후의 꼬리만
+    yf.download 1회로 받아 덧붙이고, 캐시가 없는 종목만 전체 기간을 1회로 수집합니다.
+
+    Returns:
+        columns=MultiIndex(field, symbol), index=거래일 DataFrame.
+        field는 Open/High/Low/Close/Volume, symbol 순서는 입력 순서 (중복 제거).
+        수집 실패 시 None.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return None
+    match = _period_re.match(period)
+    store = get_history_store() if use_cache and match else None
+    if store is None:
+        return _download_panel(symbols, period=period)
+
+    window_start = (date.today() - timedelta(days=int(match.group(1)))).isoformat()
+    try:
+        fresh, tail, full = store.plan(symbols, window_start)
+        if full:
+            _store_panel(store, _download_panel(full, period=period), full, covered_from=window_start)
+        if tail:
+            # 마지막 캐시 일자부터 다시 받아 장중 미완성 봉까지 덮어쓰기
+            _store_panel(store, _download_panel(list(tail), start=min(tail.values())), list(tail))
+        panel = _panel_from_rows(store.load(symbols, window_start), symbols)
+        store.evict()
+        logger.info("히스토리 캐시: hit %d / partial %d / miss %d (누적 %s)",
+                    len(fresh), len(tail), len(full), store.get_stats())
+        return panel
+    except sqlite3.Error as e:
+        logger.warning("히스토리 캐시 오류 — 전체 조회로 전환: %s", e)
+        return _download_panel(symbols, period=period)
+
+
+def compute_trend_stats(panel: pd.DataFrame | None, min_obs: int = 10) -> pd.DataFrame:
+    """패널의 종가로 전 종목 추세 지표를 한 번에 계산합니다 (벡터 연산).
+
+    Returns:
+        index=symbol, columns=[latest, ret_5d, ret_30d, high_60d, low_60d, n_obs] DataFrame.
+        유효 종가가 min_obs 미만인 종목은 제외.
+    """
+    columns = ["latest", "ret_5d", "ret_30d", "high_60d", "low_60d", "n_obs"]
+    if panel is None or "Close" not in panel.columns.get_level_values(0):
+        return pd.DataFrame(columns=columns)
+    close = panel["Close"]
+    values = close.to_numpy(dtype=float)
+    n_rows = values.shape[0]
+    if n_rows == 0:
+        return pd.DataFrame(columns=columns)
+
+    valid = ~np.isnan(values)
+    n_obs = valid.sum(axis=0)
+    closes = np.take_along_axis(values, _valid_order(values), axis=0)
+    first = closes[np.clip(n_rows - n_obs, 0, n_rows - 1), np.arange(values.shape[1])]
+
+    # 뒤에서 k번째 유효 종가, 유효값이 k개 미만이면 첫 유효 종가 (기존 리스트 인덱싱과 동일 규칙)
+    def _nth_from_end(k: int) -> np.ndarray:
+        if n_rows < k:
+            return first
+        return np.where(n_obs >= k, closes[-k], first)
+
+    latest = closes[-1]
+    prev_5 = _nth_from_end(5)
+    prev_30 = _nth_from_end(30)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ret_5d = (latest - prev_5) / prev_5 * 100
+        ret_30d = (latest - prev_30) / prev_30 * 100
+    high = np.where(valid, values, -np.inf).max(axis=0)
+    low = np.where(valid, values, np.inf).min(axis=0)
+
+    stats = pd.DataFrame(
+        {"latest": latest, "ret_5d": ret_5d, "ret_30d": ret_30d,
+         "high_60d": high, "low_60d": low, "n_obs": n_obs},
+        index=close.columns,
+    )
+    return stats[stats["n_obs"] >= min_obs]
+
+
+def _round_or_none(value, ndigits: int = 4):
+    return None if value is None or np.isnan(value) else round(float(value), ndigits)
+
+
+def panel_to_records(panel: pd.DataFrame | None, symbol: str) -> list[dict]:
+    """패널에서 한 종목의 OHLCV를 dict 레코드 리스트로 변환 (필요한 소비자만 호출)."""
+    if panel is None or symbol not in panel["Close"].columns:
+        return []
+    frame = panel.xs(symbol, axis=1, level=1).dropna(subset=["Close"])
+    dates = frame.index.strftime("%Y-%m-%d")
+    columns = {field: frame[field].to_numpy(dtype=float) if field in frame else np.full(len(frame), np.nan)
+               for field in _OHLCV_FIELDS}
+    return [
+        {
+            "symbol": symbol,
+            "date": date,
+            "open": _round_or_none(o),
+            "high": _round_or_none(h),
+            "low": _round_or_none(l),
+            "close": _round_or_none(c),
+            "volume": None if np.isnan(v) else int(v),
+        }
+        for date, o, h, l, c, v in zip(
+            dates, columns["Open"], columns["High"], columns["Low"], columns["Close"], columns["Volume"]
+        )
+    ]
+
+
 def get_stock_history(symbol: str, period: str = "60d") -> list[dict]:
     """종목의 OHLCV 히스토리 수집 (Supabase stock_history 저장용).
 
+    여러 종목이 필요하면 get_history_panel() + panel_to_records()로 일괄 수집하세요.
+
     Args:
         symbol: 티커 (예: NVDA, 005930.KS)
         period: yfinance 기간 (기본 60일)
@@ -87,21 +370,10 @@ def get_stock_history(symbol: str, period: str = "60d") -> list[dict]:
           "high": float, "low": float, "close": float, "volume": int}, ...]
     """
     try:
-        hist = yf.Ticker(symbol).history(period=period)
-        if hist.empty:
+        records = panel_to_records(get_history_panel([symbol], period=period), symbol)
+        if not records:
             logger.warning("히스토리 없음: %s", symbol)
             return []
-        records = []
-        for date, row in hist.iterrows():
-            records.append({
-                "symbol": symbol,
-                "date": date.strftime("%Y-%m-%d"),
-                "open": round(float(row["Open"]), 4) if row["Open"] is not None else None,
-                "high": round(float(row["High"]), 4) if row["High"] is not None else None,
-                "low": round(float(row["Low"]), 4) if row["Low"] is not None else None,
-                "close": round(float(row["Close"]), 4) if row["Close"] is not None else None,
-                "volume": int(row["Volume"]) if row["Volume"] is not None else None,
-            })
         logger.info("히스토리 수집 완료: %s (%d건)", symbol, len(records))
         return records
     except Exception as e:
@@ -1,14 +1,40 @@
 import os
 import re
 import logging
-import requests
+import threading
+import time
+import functools
 import xml.etree.ElementTree as ET
 from urllib.parse import quote_plus, quote
-from difflib import SequenceMatcher
-from rank_bm25 import BM25Okapi
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from tavily import TavilyClient
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from backend.config.limits import (
+        PROVIDER_CONCURRENCY, NEWS_FETCH_WORKERS,
+        RSS_FRESH_HOURS, RSS_MAX_FRESH_ITEMS, RSS_MAX_ITEMS, RSS_CHUNK_BYTES,
+        NEWS_FALLBACK_STRATEGY, NEWS_RACE_STAGGER_SECONDS, NEWS_RACE_WORKERS,
+    )
+    from backend.services import rate_limiter, tracing
+    from backend.services.http_client import get_session
+    from backend.services.cache_service import get_news_cache
+    from backend.services.dedup_service import deduplicate
+    from backend.services.rerank_service import rerank
+    from backend.services.sentiment_service import score_titles
+except ModuleNotFoundError:
+    from config.limits import (
+        PROVIDER_CONCURRENCY, NEWS_FETCH_WORKERS,
+        RSS_FRESH_HOURS, RSS_MAX_FRESH_ITEMS, RSS_MAX_ITEMS, RSS_CHUNK_BYTES,
+        NEWS_FALLBACK_STRATEGY, NEWS_RACE_STAGGER_SECONDS, NEWS_RACE_WORKERS,
+    )
+    from services import rate_limiter, tracing
+    from services.http_client import get_session
+    from services.cache_service import get_news_cache
+    from services.dedup_service import deduplicate
+    from services.rerank_service import rerank
+    from services.sentiment_service import score_titles
 
 # .env 파일 로드
 load_dotenv()
@@ -16,58 +42,62 @@ load_dotenv()
 logger = logging.getLogger(__name__)  # [P6 Fix] logging 모듈 통일
 
 # 모듈 레벨 초기화 — Lambda warm start 시 재사용
-tavily_key = os.getenv("TAVILY_API_KEY")
-tavily = TavilyClient(api_key=tavily_key) if tavily_key else None
-_vader = SentimentIntensityAnalyzer()
+_tavily_client = None
+_tavily_lock = threading.Lock()
+
+
+def _get_tavily():
+    """Tavily 클라이언트 — 첫 사용 시 생성(패키지 지연 import), warm start 재사용. 키 미설정 시 None."""
+    global _tavily_client
+    with _tavily_lock:
+        if _tavily_client is None:
+            tavily_key = os.getenv("TAVILY_API_KEY")
+            if not tavily_key:
+                return None
+            from tavily import TavilyClient
+            _tavily_client = TavilyClient(api_key=tavily_key)
+        return _tavily_client
+
+
+# 프로바이더별 동시 호출 제한 — 스레드 풀 병렬 수집 시 API 한도 보호
+_provider_semaphores = {
+    name: threading.BoundedSemaphore(limit) for name, limit in PROVIDER_CONCURRENCY.items()
+}
+
+
+def _provider_slot(provider: str):
+    """프로바이더 세마포어를 획득한 상태에서만 함수를 실행하는 데코레이터 (호출 1건 = tracing span 1개)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            query = args[0] if args else kwargs.get("query")
+            with tracing.span(provider, kind="provider", query=query, bytes=0, retries=0) as sp:
+                with _provider_semaphores[provider]:
+                    result = func(*args, **kwargs)
+                sp["links"] = len(result[1]) if result else 0
+                return result
+        return wrapper
+    return decorator
 
 
 def _bm25_rerank(query: str, results: list[dict], top_n: int = 3) -> list[dict]:
-    """BM25로 뉴스 관련성 재랭킹, top_n개 반환."""
-    if len(results) <= top_n:
-        return results
-    corpus = [(r['title'] + ' ' + r['content']).lower().split() for r in results]
-    scores = BM25Okapi(corpus).get_scores(query.lower().split())
-    ranked = sorted(zip(results, scores), key=lambda x: x[1], reverse=True)
-    return [r for r, _ in ranked[:top_n]]
+    """BM25로 뉴스 관련성 재랭킹, top_n개 반환 (누적 인덱스 IDF 기준, rerank_service 위임)."""
+    return rerank(query, results, top_n)
 
 
 def _add_sentiment(links: list[dict]) -> list[dict]:
-    """VADER로 제목 기반 감성 점수(-1.0~+1.0)를 메타데이터로 추가."""
-    for link in links:
-        scores = _vader.polarity_scores(link.get('title', ''))
-        link['sentiment'] = round(scores['compound'], 3)
+    """제목 기반 감성 점수(-1.0~+1.0)를 메타데이터로 추가 (영문 VADER / 한글 사전, 배치·메모이즈)."""
+    for link, score in zip(links, score_titles([link.get('title', '') for link in links])):
+        link['sentiment'] = score
     return links
 
 
 def _deduplicate_links(links: list[dict]) -> list[dict]:
-    """URL 해시 및 제목 유사도 기준으로 중복 뉴스를 제거합니다."""
-    seen_urls: set[str] = set()
-    seen_titles: list[str] = []
-    result: list[dict] = []
-
-    for link in links:
-        url = link.get("url", "")
-        title = link.get("title", "")
-
-        # URL 중복 제거
-        if url in seen_urls:
-            continue
-
-        # 제목 유사도 중복 제거 (0.85 이상이면 동일 기사로 판단)
-        is_duplicate = any(
-            SequenceMatcher(None, title, t).ratio() >= 0.85
-            for t in seen_titles
-        )
-        if is_duplicate:
-            continue
-
-        seen_urls.add(url)
-        seen_titles.append(title)
-        result.append(link)
-
-    return result
+    """정규화 URL 및 제목 MinHash 유사도 기준으로 중복 뉴스를 제거합니다 (dedup_service 위임)."""
+    return deduplicate(links)
 
 
+@_provider_slot("tavily")
 def get_tavily_news(query: str) -> tuple[str, list[dict]]:  # [P7 Fix] 타입 힌트 추가
     """
     Tavily를 이용해 뉴스 본문(Context)과 링크를 가져옵니다.
@@ -76,13 +106,21 @@ def get_tavily_news(query: str) -> tuple[str, list[dict]]:  # [P7 Fix] 타입 
     Tavily(max=5, days=1) → score≥0.5 필터 → BM25 재랭킹(top-3)
     → context/links 생성 → VADER 감성 추가 → dedup → 반환
     """
+    tavily = _get_tavily()
     if not tavily:
         logger.error("TAVILY_API_KEY가 없습니다.")  # [P6 Fix] print → logger.error
         return "", []
 
+    cached = get_news_cache().get("tavily", query)
+    if cached is not None:
+        logger.info("Tavily 캐시 hit: %s", query)
+        return cached
+
     logger.info("Tavily 검색 시작: %s", query)  # [P6 Fix] print → logger.info
 
     try:
+        if not _acquire("tavily"):
+            return "", []
         # topic="news" + days=1로 최신 24시간 뉴스만 수집
         try:
             response = tavily.search(
@@ -126,9 +164,11 @@ def get_tavily_news(query: str) -> tuple[str, list[dict]]:  # [P7 Fix] 타입 
         # VADER 감성 점수 메타데이터 추가 (하드 필터로 사용하지 않음)
         links = _add_sentiment(links)
 
-        # 중복 제거 (URL + 제목 유사도 기준)
+        # 중복 제거 (정규화 URL + 제목 유사도 기준)
         links = _deduplicate_links(links)
 
+        if links:
+            get_news_cache().set("tavily", query, (context, links))
         return context, links
 
     except Exception as e:
@@ -139,6 +179,69 @@ def get_tavily_news(query: str) -> tuple[str, list[dict]]:  # [P7 Fix] 타입 
 _html_tag_re = re.compile(r'<[^>]+>')
 
 
+def _response_validators(resp) -> dict:
+    """RSS 응답의 ETag/Last-Modified를 캐시 저장용 kwargs로 추출."""
+    return {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+
+
+def _is_fresh(pub_date: str, cutoff: datetime) -> bool:
+    """RFC 822 pubDate가 cutoff 이후인지 확인. 파싱 불가 시 신선한 것으로 간주 (기존처럼 후보 유지)."""
+    try:
+        published = parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError, IndexError):
+        return True
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published >= cutoff
+
+
+def _stream_rss_items(resp, clean=None) -> list[dict] | None:
+    """
+    RSS 응답(stream=True)을 청크 단위로 점진 파싱해 <item>을 추출합니다.
+    - XMLPullParser로 바이트가 도착하는 대로 파싱, 추출한 <item>은 즉시 clear·제거 (전체 트리 미보관)
+    - 신선한 기사(RSS_FRESH_HOURS 이내)가 RSS_MAX_FRESH_ITEMS개 모이거나 RSS_MAX_ITEMS개를 읽으면 조기 종료
+    - 신선한 기사가 있으면 그것만, 없으면 읽은 기사 전체 반환
+    channel 요소가 없으면 None 반환.
+    """
+    clean = clean or (lambda text: text)
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=RSS_FRESH_HOURS)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    channel = None
+    fresh, stale = [], []
+
+    for chunk in resp.iter_content(chunk_size=RSS_CHUNK_BYTES):
+        parser.feed(chunk)
+        tracing.annotate("bytes", len(chunk))
+        for event, elem in parser.read_events():
+            if event == "start":
+                if elem.tag == "channel":
+                    channel = elem
+                continue
+            if elem.tag != "item":
+                continue
+            # RSS 2.0 <link>는 텍스트 노드로 URL을 가짐
+            link_el = elem.find("link")
+            pub_date = elem.findtext("pubDate") or ""
+            item = {
+                "title": clean(elem.findtext("title") or ""),
+                "content": clean(elem.findtext("description") or ""),
+                "url": (link_el.text or "").strip() if link_el is not None else "",
+                "published_date": pub_date,
+            }
+            (fresh if _is_fresh(pub_date, cutoff) else stale).append(item)
+            elem.clear()
+            if channel is not None:
+                channel.remove(elem)
+            if len(fresh) >= RSS_MAX_FRESH_ITEMS or len(fresh) + len(stale) >= RSS_MAX_ITEMS:
+                return fresh or stale
+    parser.close()
+
+    if channel is None:
+        return None
+    return fresh or stale
+
+
+@_provider_slot("naver")
 def get_naver_news(query: str, display: int = 5) -> tuple[str, list[dict]]:
     """
     Naver News API를 이용해 한국어 뉴스 본문(Context)과 링크를 가져옵니다.
@@ -153,10 +256,17 @@ def get_naver_news(query: str, display: int = 5) -> tuple[str, list[dict]]:
         logger.warning("NAVER_CLIENT_ID/SECRET 미설정 — 네이버 뉴스 스킵")
         return "", []
 
+    cached = get_news_cache().get("naver", query)
+    if cached is not None:
+        logger.info("Naver 캐시 hit: %s", query)
+        return cached
+
     logger.info("Naver 뉴스 검색 시작: %s", query)
 
     try:
-        resp = requests.get(
+        if not _acquire("naver"):
+            return "", []
+        resp = get_session().get(
             "https://openapi.naver.com/v1/search/news.json",
             headers={
                 "X-Naver-Client-Id": client_id,
@@ -195,6 +305,8 @@ def get_naver_news(query: str, display: int = 5) -> tuple[str, list[dict]]:
         links = _add_sentiment(links)
         links = _deduplicate_links(links)
 
+        if links:
+            get_news_cache().set("naver", query, (context, links))
         return context, links
 
     except Exception as e:
@@ -202,12 +314,13 @@ def get_naver_news(query: str, display: int = 5) -> tuple[str, list[dict]]:
         return "", []
 
 
+@_provider_slot("yahoo_rss")
 def get_yahoo_rss_news(query: str, symbol=None):
     """
     Yahoo Finance RSS 피드에서 뉴스 본문(Context)과 링크를 가져옵니다.
 
     파이프라인:
-    Yahoo RSS(symbol or ^GSPC) → XML 파싱 → BM25 재랭킹(top-3)
+    Yahoo RSS(symbol or ^GSPC) → 스트리밍 XML 파싱(신선 기사 조기 종료) → BM25 재랭킹(top-3)
     → context/links 생성 → VADER 감성 추가 → dedup → 반환
 
     실패 시 logger.warning 후 ("", []) 반환.
@@ -218,37 +331,36 @@ def get_yahoo_rss_news(query: str, symbol=None):
         f"?s={ticker}&region=US&lang=en-US"
     )
 
+    # 신선한 캐시는 즉시 반환, 만료된 캐시는 ETag/Last-Modified로 조건부 요청
+    cache = get_news_cache()
+    cached, entry = cache.lookup("yahoo_rss", query, ticker)
+    if cached is not None:
+        logger.info("Yahoo RSS 캐시 hit: %s (symbol=%s)", query, ticker)
+        return cached
+
     logger.info("Yahoo RSS 검색 시작: %s (symbol=%s)", query, ticker)
 
     try:
-        resp = requests.get(
-            url, timeout=10,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
-        resp.raise_for_status()
-
-        root = ET.fromstring(resp.content)
-        channel = root.find("channel")
-        if channel is None:
+        if not _acquire("yahoo_rss"):
+            return "", []
+        with get_session().get(
+            url, timeout=10, stream=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                **cache.conditional_headers(entry),
+            }
+        ) as resp:
+            if resp.status_code == 304 and entry is not None:
+                logger.info("Yahoo RSS 변경 없음(304) — 캐시 재사용: %s", ticker)
+                return cache.revalidated("yahoo_rss", query, entry, symbol=ticker)
+            resp.raise_for_status()
+            validators = _response_validators(resp)
+            results = _stream_rss_items(resp)
+
+        if results is None:
             logger.warning("Yahoo RSS: channel 요소 없음 (symbol=%s)", ticker)
             return "", []
 
-        results = []
-        for item in channel.findall("item"):
-            title = item.findtext("title") or ""
-            # RSS 2.0의 <link> 태그는 ET.findtext로 읽히지 않아 .tail로 읽어야 함
-            link_el = item.find("link")
-            item_url = (link_el.text or "").strip() if link_el is not None else ""
-            description = item.findtext("description") or ""
-            pub_date = item.findtext("pubDate") or ""
-
-            results.append({
-                "title": title,
-                "content": description,
-                "url": item_url,
-                "published_date": pub_date,
-            })
-
         if not results:
             logger.warning("Yahoo RSS: 결과 없음 (symbol=%s)", ticker)
             return "", []
@@ -268,6 +380,8 @@ def get_yahoo_rss_news(query: str, symbol=None):
         links = _add_sentiment(links)
         links = _deduplicate_links(links)
 
+        if links:
+            cache.set("yahoo_rss", query, (context, links), symbol=ticker, **validators)
         return context, links
 
     except Exception as e:
@@ -275,12 +389,13 @@ def get_yahoo_rss_news(query: str, symbol=None):
         return "", []
 
 
+@_provider_slot("google_rss")
 def get_google_rss_news(query: str):
     """
     Google News RSS에서 한국어 뉴스 본문(Context)과 링크를 가져옵니다.
 
     파이프라인:
-    Google RSS(hl=ko&gl=KR) → XML 파싱 → HTML 태그 제거 → BM25 재랭킹(top-3)
+    Google RSS(hl=ko&gl=KR) → 스트리밍 XML 파싱(신선 기사 조기 종료) → HTML 태그 제거 → BM25 재랭킹(top-3)
     → context/links 생성 → VADER 감성 추가 → dedup → 반환
 
     실패 시 ("", []) 반환.
@@ -290,33 +405,30 @@ def get_google_rss_news(query: str):
         f"?q={quote_plus(query)}&hl=ko&gl=KR&ceid=KR:ko"
     )
 
+    # 신선한 캐시는 즉시 반환, 만료된 캐시는 ETag/Last-Modified로 조건부 요청
+    cache = get_news_cache()
+    cached, entry = cache.lookup("google_rss", query)
+    if cached is not None:
+        logger.info("Google RSS 캐시 hit: %s", query)
+        return cached
+
     logger.info("Google RSS 검색 시작: %s", query)
 
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-
-        root = ET.fromstring(resp.content)
-        channel = root.find("channel")
-        if channel is None:
-            logger.warning("Google RSS: channel 요소 없음 (query=%s)", query)
+        if not _acquire("google_rss"):
             return "", []
-
-        results = []
-        for item in channel.findall("item"):
-            title = _html_tag_re.sub("", item.findtext("title") or "")
+        with get_session().get(url, timeout=10, stream=True, headers=cache.conditional_headers(entry)) as resp:
+            if resp.status_code == 304 and entry is not None:
+                logger.info("Google RSS 변경 없음(304) — 캐시 재사용: %s", query)
+                return cache.revalidated("google_rss", query, entry)
+            resp.raise_for_status()
+            validators = _response_validators(resp)
             # Google RSS <link>는 리다이렉트 URL이지만 그대로 저장
-            link_el = item.find("link")
-            item_url = (link_el.text or "").strip() if link_el is not None else ""
-            description = _html_tag_re.sub("", item.findtext("description") or "")
-            pub_date = item.findtext("pubDate") or ""
+            results = _stream_rss_items(resp, clean=lambda text: _html_tag_re.sub("", text))
 
-            results.append({
-                "title": title,
-                "content": description,
-                "url": item_url,
-                "published_date": pub_date,
-            })
+        if results is None:
+            logger.warning("Google RSS: channel 요소 없음 (query=%s)", query)
+            return "", []
 
         if not results:
             logger.warning("Google RSS: 결과 없음 (query=%s)", query)
@@ -337,6 +449,8 @@ def get_google_rss_news(query: str):
         links = _add_sentiment(links)
         links = _deduplicate_links(links)
 
+        if links:
+            cache.set("google_rss", query, (context, links), **validators)
         return context, links
 
     except Exception as e:
@@ -344,6 +458,7 @@ def get_google_rss_news(query: str):
         return "", []
 
 
+@_provider_slot("gdelt")
 def get_gdelt_news(query: str):
     """
     GDELT v2 Doc API에서 뉴스 본문(Context)과 링크를 가져옵니다.
@@ -359,12 +474,17 @@ def get_gdelt_news(query: str):
         f'?query={quote(query)}&maxrecords=10&format=json&mode=artlist'
     )
 
+    cached = get_news_cache().get("gdelt", query)
+    if cached is not None:
+        logger.info("GDELT 캐시 hit: %s", query)
+        return cached
+
     logger.info("GDELT 검색 시작: %s", query)
 
     try:
-        import time as _time
-        _time.sleep(6)  # GDELT: 5초에 1회 제한 정책 준수
-        resp = requests.get(url, timeout=15)
+        if not _acquire("gdelt"):  # GDELT: 5초에 1회 제한 정책 준수 (직전 호출 이후 부족분만 대기)
+            return "", []
+        resp = get_session().get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -408,6 +528,8 @@ def get_gdelt_news(query: str):
         links = _add_sentiment(links)
         links = _deduplicate_links(links)
 
+        if links:
+            get_news_cache().set("gdelt", query, (context, links))
         return context, links
 
     except Exception as e:
@@ -415,31 +537,165 @@ def get_gdelt_news(query: str):
         return "", []
 
 
-def get_foreign_news(query: str, symbol=None):
+# 레이스 모드 전용 풀 — fetch_news_batch 워커 안에서 제출하므로 같은 풀을 쓰면 교착 위험
+_race_executor = ThreadPoolExecutor(max_workers=NEWS_RACE_WORKERS, thread_name_prefix="news-race")
+# 동시에 진행 중인 레이스 수 상한 (= 뉴스 수집 fan-out 폭). 슬롯은 체인의 모든 프로바이더가 끝나야 반환되므로
+# 무시된 요청이 풀 스레드를 붙잡고 있어도 새 레이스의 1순위 호출이 풀 대기열에 밀리지 않습니다.
+_race_slots = threading.BoundedSemaphore(NEWS_FETCH_WORKERS)
+# 레이스 워커 스레드가 실행 중인 체인의 "승자 결정" 이벤트 — _acquire()가 확인
+_race_state = threading.local()
+
+
+def _acquire(provider: str) -> bool:
+    """
+    프로바이더 rate limit 토큰 획득. 레이스 체인에서 이미 승자가 정해졌으면 대기·요청 없이 False
+    (버킷 대기 후에도 다시 확인 — 대기 중 승자가 나온 패자는 HTTP 요청을 보내지 않음).
+    """
+    done = getattr(_race_state, "done", None)
+    if done is not None and done.is_set():
+        return False
+    rate_limiter.acquire(provider)
+    return done is None or not done.is_set()
+
+
+def _run_chain(query: str, providers: list[tuple[str, callable]], strategy: str) -> tuple[str, list[dict]]:
+    """
+    프로바이더 체인 실행. providers는 우선순위 순서의 (이름, 무인자 호출) 목록.
+
+    sequential: 앞 프로바이더의 links가 비었을 때만 다음 호출.
+    race: i순위는 i × NEWS_RACE_STAGGER_SECONDS 후 (또는 바로 앞 순위가 빈 결과로 끝나는 즉시) 시작.
+          우선순위 순으로 결과를 확인해 처음으로 비어있지 않은 결과를 채택하고,
+          아직 시작 전인 하위 프로바이더는 취소, rate limit 대기 중이면 요청 없이 종료(_acquire),
+          이미 보낸 요청은 결과를 무시합니다. 동시 레이스 수는 NEWS_FETCH_WORKERS개로 제한.
+    프로바이더별 소요 시간·결과는 한 줄로 로그에 남깁니다.
+    """
+    timings: dict[str, str] = {}
+    chosen = None
+
+    if strategy != "race":
+        try:
+            for name, call in providers:
+                start = time.perf_counter()
+                context, links = call()
+                timings[name] = f"{time.perf_counter() - start:.2f}s({'ok' if links else 'empty'})"
+                if links:
+                    chosen = name
+                    return context, links
+            return "", []
+        finally:
+            logger.info("뉴스 체인 [%s] %s → %s", query, " ".join(f"{n}={t}" for n, t in timings.items()), chosen or "없음")
+
+    done = threading.Event()
+    go = [threading.Event() for _ in providers]
+    go[0].set()
+    started: set[str] = set()
+
+    def run(i: int, name: str, call):
+        if not go[i].wait(i * NEWS_RACE_STAGGER_SECONDS) and i:
+            go[i].set()  # 시차 만료 — 앞 순위 결과를 기다리지 않고 시작
+        if done.is_set():
+            return None
+        started.add(name)
+        start = time.perf_counter()
+        _race_state.done = done
+        try:
+            result = call()
+        except Exception as e:
+            logger.warning("뉴스 레이스 프로바이더 실패 (%s): %s", query, e)
+            result = ("", [])
+        finally:
+            _race_state.done = None   # 풀 스레드 재사용 — 다음 체인에 남지 않도록
+        return result, time.perf_counter() - start
+
+    remaining = [len(providers)]
+    remaining_lock = threading.Lock()
+
+    def release_slot(_future) -> None:
+        with remaining_lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            _race_slots.release()
+
+    _race_slots.acquire()
+    futures = [_race_executor.submit(run, i, name, call) for i, (name, call) in enumerate(providers)]
+    for future in futures:
+        future.add_done_callback(release_slot)
+    try:
+        for i, ((name, _), future) in enumerate(zip(providers, futures)):
+            outcome = future.result()
+            if outcome is None:
+                timings[name] = "skipped"
+                continue
+            (context, links), elapsed = outcome
+            timings[name] = f"{elapsed:.2f}s({'ok' if links else 'empty'})"
+            if links:
+                chosen = name
+                return context, links
+            if i + 1 < len(go):
+                go[i + 1].set()
+        return "", []
+    finally:
+        done.set()
+        for event in go:
+            event.set()
+        for name, _ in providers:
+            if name not in timings:
+                timings[name] = "ignored" if name in started else "cancelled"
+        logger.info("뉴스 레이스 [%s] %s → %s", query, " ".join(f"{n}={t}" for n, t in timings.items()), chosen or "없음")
+
+
+def get_foreign_news(query: str, symbol=None, strategy: str = NEWS_FALLBACK_STRATEGY):
     """
     해외 뉴스 Fallback 체인: Tavily → Yahoo RSS → GDELT
 
     각 소스에서 links가 비어 있으면 다음 소스로 넘어갑니다.
+    strategy="race"면 시차를 둔 동시 호출로 우선순위 최상위의 비어있지 않은 결과를 반환합니다.
     """
-    context, links = get_tavily_news(query)
-    if links:
-        return context, links
-    context, links = get_yahoo_rss_news(query, symbol)
-    if links:
-        return context, links
-    return get_gdelt_news(query)
+    return _run_chain(query, [
+        ("tavily", lambda: get_tavily_news(query)),
+        ("yahoo_rss", lambda: get_yahoo_rss_news(query, symbol)),
+        ("gdelt", lambda: get_gdelt_news(query)),
+    ], strategy)
 
 
-def get_korean_news(query: str):
+def get_korean_news(query: str, strategy: str = NEWS_FALLBACK_STRATEGY):
     """
     한국어 뉴스 Fallback 체인: Naver → Google RSS → GDELT
 
     각 소스에서 links가 비어 있으면 다음 소스로 넘어갑니다.
+    strategy="race"면 시차를 둔 동시 호출로 우선순위 최상위의 비어있지 않은 결과를 반환합니다.
     """
-    context, links = get_naver_news(query)
-    if links:
-        return context, links
-    context, links = get_google_rss_news(query)
-    if links:
-        return context, links
-    return get_gdelt_news(query)
+    return _run_chain(query, [
+        ("naver", lambda: get_naver_news(query)),
+        ("google_rss", lambda: get_google_rss_news(query)),
+        ("gdelt", lambda: get_gdelt_news(query)),
+    ], strategy)
+
+
+def _fetch_news_job(job: dict) -> tuple[str, list[dict]]:
+    """fetch_news_batch 작업 1건 실행. 실패 시 ("", []) 반환 (전체 중단 방지)."""
+    query = job["query"]
+    try:
+        if job["lang"] == "korean":
+            return get_korean_news(query)
+        return get_foreign_news(query, symbol=job.get("symbol"))
+    except Exception as e:
+        logger.warning("뉴스 수집 실패 (%s): %s", query, e)
+        return "", []
+
+
+def fetch_news_batch(jobs: list[dict], max_workers: int = NEWS_FETCH_WORKERS) -> list[tuple[str, list[dict]]]:
+    """
+    여러 뉴스 쿼리를 스레드 풀에서 병렬 수집합니다.
+
+    jobs: [{"lang": "foreign" | "korean", "query": str, "symbol": str | None}, ...]
+    반환값은 jobs와 같은 순서의 (context, links) 리스트 — 완료 순서와 무관하게 결정적.
+    프로바이더별 동시 호출 수는 PROVIDER_CONCURRENCY 세마포어로 제한됩니다.
+    """
+    if not jobs:
+        return []
+    workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news") as executor:
+        futures = [executor.submit(_fetch_news_job, job) for job in jobs]
+        return [f.result() for f in futures]
@@ -0,0 +1,130 @@
+import time
+import logging
+import threading
+
+try:
+    from backend.config.limits import PROVIDER_RATE_LIMITS
+except ModuleNotFoundError:
+    from config.limits import PROVIDER_RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷.
+
+    acquire()는 토큰을 선점(잔량이 음수가 될 수 있음)한 뒤 락 밖에서 부족분만큼 대기합니다.
+    동시 호출자는 도착 순서대로 rate 간격에 맞춰 배치되어, 필요한 시간 이상 대기하지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0 or burst <= 0:
+            raise ValueError(f"rate/burst는 양수여야 합니다: rate={rate}, burst={burst}")
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 선점하고 호출자가 대기해야 할 시간(초)을 반환합니다 (대기는 하지 않음)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def available(self) -> float:
+        """현재 잔여 토큰 수 (소비하지 않음, 선점 대기열이 있으면 음수)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 획득할 때까지 대기하고, 실제 대기 시간(초)을 반환합니다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_buckets: dict[str, TokenBucket] = {
+    name: TokenBucket(cfg["rate"], cfg["burst"]) for name, cfg in PROVIDER_RATE_LIMITS.items()
+}
+# 설정 기준값 — set_scale()은 항상 이 값에서 다시 계산 (warm 호출마다 배율이 누적되지 않음)
+_limits: dict[str, tuple[float, float]] = {
+    name: (cfg["rate"], cfg["burst"]) for name, cfg in PROVIDER_RATE_LIMITS.items()
+}
+_scale = 1.0
+_stats_lock = threading.Lock()
+_wait_stats: dict[str, dict] = {}
+
+
+def _scaled_bucket(rate: float, burst: float) -> TokenBucket:
+    return TokenBucket(rate * _scale, max(1.0, burst * _scale))
+
+
+def configure(provider: str, rate: float, burst: float) -> None:
+    """프로바이더 버킷을 새 rate/burst로 교체합니다 (런타임 조정·테스트용). 현재 배율이 적용됩니다."""
+    _limits[provider] = (rate, burst)
+    _buckets[provider] = _scaled_bucket(rate, burst)
+
+
+def set_scale(factor: float) -> None:
+    """
+    전 프로바이더 rate/burst에 배율 적용 (burst는 최소 1).
+    샤드 워커처럼 여러 프로세스가 같은 API 키를 나눠 쓸 때 1/워커 수로 설정하면 합산 호출률이 설정값 이내로 유지됩니다.
+    """
+    global _scale
+    if factor <= 0:
+        raise ValueError(f"factor는 양수여야 합니다: {factor}")
+    _scale = float(factor)
+    for provider, (rate, burst) in list(_limits.items()):
+        _buckets[provider] = _scaled_bucket(rate, burst)
+
+
+def acquire(provider: str) -> float:
+    """
+    프로바이더 버킷에서 호출 1회분 토큰을 획득합니다.
+    - 미등록 프로바이더는 제한 없이 즉시 통과 (0.0 반환)
+    - 반환값: 이 호출자가 대기한 시간(초) — get_wait_stats()에도 누적
+    """
+    bucket = _buckets.get(provider)
+    if bucket is None:
+        return 0.0
+    waited = bucket.acquire()
+    with _stats_lock:
+        stat = _wait_stats.setdefault(provider, {"calls": 0, "waited_calls": 0, "total_wait": 0.0, "max_wait": 0.0})
+        stat["calls"] += 1
+        if waited > 0:
+            stat["waited_calls"] += 1
+            stat["total_wait"] += waited
+            stat["max_wait"] = max(stat["max_wait"], waited)
+    if waited > 0:
+        logger.info("Rate limit 대기 (%s): %.2fs", provider, waited)
+    return waited
+
+
+def available(provider: str) -> float:
+    """프로바이더 버킷의 잔여 토큰 수 — 선택적 추가 호출(헤지 등)을 대기 없이 보낼 수 있는지 판단용. 미등록은 무한대."""
+    bucket = _buckets.get(provider)
+    return float("inf") if bucket is None else bucket.available()
+
+
+def get_wait_stats() -> dict[str, dict]:
+    """프로바이더별 {calls, waited_calls, total_wait, max_wait} 집계 사본을 반환합니다."""
+    with _stats_lock:
+        return {
+            name: {**stat, "total_wait": round(stat["total_wait"], 3), "max_wait": round(stat["max_wait"], 3)}
+            for name, stat in _wait_stats.items()
+        }
+
+
+def reset_wait_stats() -> None:
+    """실행 단위 집계 초기화 (Lambda warm start 시 run 시작마다 호출)."""
+    with _stats_lock:
+        _wait_stats.clear()
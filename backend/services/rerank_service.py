@@ -0,0 +1,182 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from functools import lru_cache
+import numpy as np
+
+try:
+    from backend.config.cache import resolve_cache_dir, BM25_INDEX_MAX_DOCS, BM25_TOKEN_CACHE_SIZE
+except ModuleNotFoundError:
+    from config.cache import resolve_cache_dir, BM25_INDEX_MAX_DOCS, BM25_TOKEN_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# BM25 파라미터 (rank_bm25.BM25Okapi 기본값과 동일)
+K1 = 1.5
+B = 0.75
+
+_word_re = re.compile(r"\w+", re.UNICODE)
+_hangul_re = re.compile(r"[가-힣]")
+
+
+@lru_cache(maxsize=BM25_TOKEN_CACHE_SIZE)
+def tokenize(text: str) -> tuple[str, ...]:
+    """
+    BM25용 토큰화 (LRU 캐시 — 같은 제목·본문은 재토큰화하지 않음).
+    - NFKC 정규화 + 소문자 + 단어 분리
+    - 한글 포함 단어: 문자 2-gram으로 분해 ("삼성전자는" → 삼성/성전/전자/자는)
+      → 조사·어미가 붙어도 어간 bigram이 겹쳐 매칭됨 (형태소 분석기 없이 Lambda 용량 유지)
+    - 그 외(영문·숫자): 단어 그대로
+    """
+    tokens: list[str] = []
+    for word in _word_re.findall(unicodedata.normalize("NFKC", text or "").lower()):
+        if _hangul_re.search(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tuple(tokens)
+
+
+def _doc_id(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class BM25Index:
+    """
+    최근 기사들의 문서 빈도(df)·평균 길이를 누적하는 증분 BM25 인덱스.
+
+    - add(): 처음 보는 문서만 df에 반영, max_docs 초과 시 가장 오래된 문서부터 제외 (메모리 상한)
+    - score_batch(): 여러 쿼리 × 후보 문서 점수를 NumPy 행렬 연산으로 계산
+      IDF는 호출마다 새로 만든 소규모 코퍼스가 아니라 누적 인덱스 기준 → 흔한 단어의 가중치가 안정적
+    """
+
+    def __init__(self, path: str | None = None, max_docs: int = BM25_INDEX_MAX_DOCS):
+        self.path = path
+        self.max_docs = max_docs
+        self._docs: OrderedDict[str, tuple[int, tuple[str, ...]]] = OrderedDict()  # id → (길이, 고유 토큰)
+        self._df: Counter = Counter()
+        self._total_len = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _add_tokens(self, doc_id: str, length: int, terms: tuple[str, ...]) -> None:
+        self._docs[doc_id] = (length, terms)
+        self._df.update(terms)
+        self._total_len += length
+        while len(self._docs) > self.max_docs:
+            _, (old_len, old_terms) = self._docs.popitem(last=False)
+            self._df.subtract(old_terms)
+            self._total_len -= old_len
+            for term in old_terms:
+                if self._df[term] <= 0:
+                    del self._df[term]
+
+    def add(self, texts: list[str]) -> None:
+        """문서들을 인덱스에 반영 (이미 있는 문서는 최근 사용으로만 갱신)."""
+        with self._lock:
+            for text in texts:
+                doc_id = _doc_id(text)
+                if doc_id in self._docs:
+                    self._docs.move_to_end(doc_id)
+                    continue
+                tokens = tokenize(text)
+                self._add_tokens(doc_id, len(tokens), tuple(sorted(set(tokens))))
+
+    def score_batch(self, queries: list[str], texts: list[str]) -> np.ndarray:
+        """(len(queries), len(texts)) BM25 점수 행렬."""
+        doc_tokens = [tokenize(t) for t in texts]
+        query_tokens = [tokenize(q) for q in queries]
+        vocab = {term: i for i, term in enumerate(dict.fromkeys(t for q in query_tokens for t in q))}
+        if not vocab or not texts:
+            return np.zeros((len(queries), len(texts)))
+
+        # 문서 × 어휘 단어 빈도 행렬
+        tf = np.zeros((len(texts), len(vocab)))
+        for row, tokens in enumerate(doc_tokens):
+            for term, count in Counter(t for t in tokens if t in vocab).items():
+                tf[row, vocab[term]] = count
+        doc_len = np.array([len(tokens) for tokens in doc_tokens], dtype=float)
+
+        with self._lock:
+            n_docs = max(len(self._docs), 1)
+            avgdl = self._total_len / len(self._docs) if self._docs else max(doc_len.mean(), 1.0)
+            df = np.array([self._df.get(term, 0) for term in vocab], dtype=float)
+        # Lucene식 비음수 IDF — 소규모 코퍼스에서 BM25Okapi의 음수 IDF 문제 회피
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        norm = K1 * (1 - B + B * doc_len / avgdl)
+        term_scores = idf * tf * (K1 + 1) / (tf + norm[:, None])   # (문서, 어휘)
+
+        # 쿼리 × 어휘 출현 횟수 행렬 → 행렬곱으로 전 쿼리 점수 일괄 계산
+        q_matrix = np.zeros((len(queries), len(vocab)))
+        for row, tokens in enumerate(query_tokens):
+            for term, count in Counter(tokens).items():
+                q_matrix[row, vocab[term]] = count
+        return q_matrix @ term_scores.T
+
+    def save(self) -> None:
+        """최근 문서 통계를 JSON으로 저장 (원자적 교체)."""
+        if not self.path:
+            return
+        with self._lock:
+            payload = [[doc_id, length, list(terms)] for doc_id, (length, terms) in self._docs.items()]
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("BM25 인덱스 저장 실패: %s", e)
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("BM25 인덱스 로드 실패 — 새로 시작: %s", e)
+            return
+        with self._lock:
+            for doc_id, length, terms in payload[-self.max_docs:]:
+                self._add_tokens(doc_id, length, tuple(terms))
+        logger.info("BM25 인덱스 로드: %d건", len(self._docs))
+
+
+_index: BM25Index | None = None
+_index_lock = threading.Lock()
+
+
+def get_bm25_index() -> BM25Index:
+    """최근 실행 기사 기반 BM25 인덱스 싱글턴 — warm start 메모리 + 캐시 디렉터리 파일에 유지."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = BM25Index(os.path.join(resolve_cache_dir(), "bm25_index.json"))
+            _index.load()
+        return _index
+
+
+def rerank(query: str, results: list[dict], top_n: int = 3) -> list[dict]:
+    """
+    results(title/content 보유)를 누적 인덱스 기준 BM25 점수로 재정렬해 top_n개 반환.
+    결과는 개수와 무관하게 인덱스에 반영되어 이후 IDF 통계에 기여합니다.
+    동점은 원래 순서 유지 (프로바이더 관련도 순서 보존).
+    """
+    if not results:
+        return results
+    index = get_bm25_index()
+    texts = [f"{r.get('title', '')} {r.get('content', '')}" for r in results]
+    index.add(texts)
+    if len(results) <= top_n:
+        return results
+    scores = index.score_batch([query], texts)[0]
+    order = sorted(range(len(results)), key=lambda i: -scores[i])
+    return [results[i] for i in order[:top_n]]
@@ -0,0 +1,251 @@
+import os
+import json
+import math
+import time
+import logging
+import threading
+
+try:
+    from backend.config.cache import resolve_cache_dir
+    from backend.config.limits import NEWS_FETCH_WORKERS
+    from backend.config.scheduler import (
+        SCHEDULER_MAX_JOBS, SCHEDULER_TIME_BUDGET_SECONDS, SCHEDULER_WEIGHTS,
+        SCHEDULER_MOVE_UNIT, SCHEDULER_MOVE_CAP, SCHEDULER_TARGET_INTERVAL_SECONDS,
+        SCHEDULER_MAX_STALENESS_SECONDS, SCHEDULER_DEFAULT_JOB_SECONDS, SCHEDULER_COST_EWMA_ALPHA,
+        SCHEDULER_STATE_MAX_SYMBOLS, SCHEDULER_STATE_STORE,
+    )
+    from backend.services.db_service import DBService
+except ModuleNotFoundError:
+    from config.cache import resolve_cache_dir
+    from config.limits import NEWS_FETCH_WORKERS
+    from config.scheduler import (
+        SCHEDULER_MAX_JOBS, SCHEDULER_TIME_BUDGET_SECONDS, SCHEDULER_WEIGHTS,
+        SCHEDULER_MOVE_UNIT, SCHEDULER_MOVE_CAP, SCHEDULER_TARGET_INTERVAL_SECONDS,
+        SCHEDULER_MAX_STALENESS_SECONDS, SCHEDULER_DEFAULT_JOB_SECONDS, SCHEDULER_COST_EWMA_ALPHA,
+        SCHEDULER_STATE_MAX_SYMBOLS, SCHEDULER_STATE_STORE,
+    )
+    from services.db_service import DBService
+
+logger = logging.getLogger(__name__)
+
+
+def priority(watchers: int, change_percent: float | None, volume_rank: float,
+             age_seconds: float, portfolio: bool) -> float:
+    """종목 뉴스 갱신 우선순위 점수 (가중치·정규화 기준은 config/scheduler.py)."""
+    move = min(abs(change_percent or 0.0), SCHEDULER_MOVE_CAP) / SCHEDULER_MOVE_UNIT
+    return (
+        SCHEDULER_WEIGHTS["watchers"] * math.log1p(max(watchers, 0))
+        + SCHEDULER_WEIGHTS["move"] * move
+        + SCHEDULER_WEIGHTS["volume"] * volume_rank
+        + SCHEDULER_WEIGHTS["staleness"] * age_seconds / SCHEDULER_TARGET_INTERVAL_SECONDS
+        + (SCHEDULER_WEIGHTS["portfolio"] if portfolio else 0.0)
+    )
+
+
+def _volume_ranks(volumes: list[int | None]) -> list[float]:
+    """거래량 백분위 (0~1). 미국·한국 종목의 거래량 단위 차이와 무관하게 비교하기 위해 순위 사용."""
+    known = sorted(v for v in volumes if v)
+    if len(known) < 2:
+        return [0.0] * len(volumes)
+    ranks = {v: i / (len(known) - 1) for i, v in enumerate(known)}
+    return [ranks[v] if v else 0.0 for v in volumes]
+
+
+class SchedulePlan:
+    """
+    한 실행의 스케줄 결과. fetch_jobs만 새로 수집하고, assemble()로 전체 작업 순서의 결과를 조립합니다.
+    선택되지 않은 작업은 직전 수집 결과(없으면 빈 결과)로 채워 병합 단계는 기존과 동일하게 동작합니다.
+    """
+
+    def __init__(self, scheduler: "NewsScheduler | None", jobs: list[dict], selected: list[int]):
+        self.scheduler = scheduler
+        self.jobs = jobs
+        self.selected = selected
+        self.fetch_jobs = [jobs[i] for i in selected]
+
+    @classmethod
+    def all(cls, jobs: list[dict]) -> "SchedulePlan":
+        """스케줄러 비활성화 — 전체 작업 수집 (상태 기록 없음)."""
+        return cls(None, jobs, list(range(len(jobs))))
+
+    def assemble(self, fetched: list[tuple[str, list[dict]]], seconds: float) -> list[tuple[str, list[dict]]]:
+        if self.scheduler is None:
+            return fetched
+        self.scheduler.record(self.fetch_jobs, fetched, seconds)
+        results = [self.scheduler.cached(job["feed_symbol"]) or ("", []) for job in self.jobs]
+        for index, result in zip(self.selected, fetched):
+            results[index] = result
+        return results
+
+
+class NewsScheduler:
+    """
+    종목별 마지막 뉴스 갱신 시각·결과와 작업당 소요 시간(EWMA)을 보관하는 우선순위 스케줄러.
+    상태는 캐시 디렉터리 JSON 파일에 저장 — warm Lambda는 메모리, 다음 실행은 파일에서 이어받습니다.
+    store(DBService)를 주면 종목별 상태를 DB에도 기록하고, 메모리에 없는 종목은 plan() 때 DB에서 채웁니다
+    (cold start로 파일이 사라져도 갱신 이력 유지). 어디에도 기록이 없는 종목은 기한 초과로 취급합니다.
+    """
+
+    def __init__(self, path: str | None = None, store: DBService | None = None):
+        self.path = path
+        self.store = store
+        self._symbols: dict[str, dict] = {}        # symbol → {"refreshed_at": float, "result": [context, links]}
+        self._job_seconds = SCHEDULER_DEFAULT_JOB_SECONDS
+        self._lock = threading.Lock()
+        self._last_plan: dict = {}
+        self._looked_up: set[str] = set()          # 이미 DB에서 조회한 종목 (행 없음 포함 — 재조회 방지)
+        self._dirty: set[str] = set()              # DB에 아직 기록하지 않은 갱신 종목
+
+    def plan(self, jobs: list[dict], metrics: dict[str, dict], watchers: dict[str, int],
+             portfolio: set[str], now: float | None = None) -> SchedulePlan:
+        """
+        jobs(종목 뉴스 작업, "feed_symbol" 필수)를 우선순위 순으로 정렬해 예산 내 작업만 선택합니다.
+        metrics: {symbol: {"change_percent", "volume"}} (스냅샷에 없는 종목은 중립 점수)
+        """
+        now = time.time() if now is None else now
+        symbols = [job["feed_symbol"] for job in jobs]
+        self._load_from_store(symbols)
+        volume_ranks = _volume_ranks([metrics.get(s, {}).get("volume") for s in symbols])
+        with self._lock:
+            ages = [now - self._symbols[s]["refreshed_at"] if s in self._symbols else None for s in symbols]
+            job_seconds = self._job_seconds
+
+        ranked = []
+        for i, symbol in enumerate(symbols):
+            age = SCHEDULER_MAX_STALENESS_SECONDS if ages[i] is None else ages[i]
+            score = priority(watchers.get(symbol, 0), metrics.get(symbol, {}).get("change_percent"),
+                             volume_ranks[i], age, symbol in portfolio)
+            overdue = age >= SCHEDULER_MAX_STALENESS_SECONDS
+            ranked.append((overdue, score, i))
+        # 기한 초과 종목 먼저, 같은 그룹 안에서는 점수 순 (동점은 작업 순서 유지)
+        ranked.sort(key=lambda r: (not r[0], -r[1], r[2]))
+
+        # 예상 수집 시간 = 작업 수 × 작업당 소요 시간 / 병렬도
+        max_jobs = max(1, min(SCHEDULER_MAX_JOBS, int(SCHEDULER_TIME_BUDGET_SECONDS * NEWS_FETCH_WORKERS / job_seconds)))
+        picked = ranked[:max_jobs]
+        selected = sorted(i for _, _, i in picked)   # 수집·병합은 원래 작업 순서대로
+        self._last_plan = {
+            "candidates": len(jobs), "selected": len(selected),
+            "overdue": sum(1 for overdue, _, _ in ranked if overdue),
+            "overdue_skipped": sum(1 for overdue, _, _ in ranked[len(picked):] if overdue),
+            "job_seconds": round(job_seconds, 2), "max_jobs": max_jobs,
+        }
+        logger.info("스케줄: %s, 선택 %s", self._last_plan, [symbols[i] for _, _, i in picked[:10]])
+        return SchedulePlan(self, jobs, selected)
+
+    def record(self, jobs: list[dict], results: list[tuple[str, list[dict]]], seconds: float,
+               now: float | None = None) -> None:
+        """
+        수집한 작업의 결과·갱신 시각 기록 + 작업당 소요 시간 EWMA 갱신.
+        빈 결과도 갱신 시각은 기록 (뉴스 없는 종목이 매 실행 기한 초과로 예산을 차지하지 않도록), 직전 결과는 유지.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for job, (context, links) in zip(jobs, results):
+                previous = self._symbols.get(job["feed_symbol"])
+                result = [context, links] if context else (previous["result"] if previous else ["", []])
+                self._symbols[job["feed_symbol"]] = {"refreshed_at": now, "result": result}
+                self._dirty.add(job["feed_symbol"])
+            if jobs and seconds > 0:
+                observed = seconds * min(len(jobs), NEWS_FETCH_WORKERS) / len(jobs)
+                self._job_seconds += SCHEDULER_COST_EWMA_ALPHA * (observed - self._job_seconds)
+            self._evict()
+
+    def cached(self, symbol: str) -> tuple[str, list[dict]] | None:
+        with self._lock:
+            entry = self._symbols.get(symbol)
+        return tuple(entry["result"]) if entry else None
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self._last_plan, "tracked": len(self._symbols)}
+
+    def _evict(self) -> None:
+        overflow = len(self._symbols) - SCHEDULER_STATE_MAX_SYMBOLS
+        if overflow > 0:
+            for symbol in sorted(self._symbols, key=lambda s: self._symbols[s]["refreshed_at"])[:overflow]:
+                del self._symbols[symbol]
+
+    def _load_from_store(self, symbols: list[str]) -> None:
+        """메모리에 없는 종목 상태를 DB에서 채움. 조회 실패 시 해당 종목은 기록 없음(기한 초과)으로 진행."""
+        if self.store is None:
+            return
+        with self._lock:
+            missing = [s for s in dict.fromkeys(symbols) if s not in self._symbols and s not in self._looked_up]
+        if not missing:
+            return
+        try:
+            stored = self.store.get_scheduler_state(missing)
+        except Exception as e:
+            logger.warning("스케줄러 상태 DB 조회 실패 — 기록 없는 종목은 기한 초과로 취급: %s", e)
+            return
+        with self._lock:
+            self._looked_up.update(missing)
+            for symbol, entry in stored.items():
+                current = self._symbols.get(symbol)
+                if current is None or current["refreshed_at"] < entry["refreshed_at"]:
+                    self._symbols[symbol] = entry
+            self._evict()
+        logger.info("스케줄러 상태 DB 조회: %d종목 중 %d건", len(missing), len(stored))
+
+    def save(self) -> None:
+        """상태를 JSON으로 저장 (원자적 교체) + 이번 실행에 갱신된 종목을 DB에 UPSERT."""
+        self._save_to_store()
+        if not self.path:
+            return
+        with self._lock:
+            payload = {"job_seconds": self._job_seconds, "symbols": self._symbols}
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning("스케줄러 상태 저장 실패: %s", e)
+
+    def _save_to_store(self) -> None:
+        if self.store is None:
+            return
+        with self._lock:
+            dirty = {s: dict(self._symbols[s]) for s in self._dirty if s in self._symbols}
+            self._dirty.clear()
+        if not dirty:
+            return
+        try:
+            saved = self.store.put_scheduler_state(dirty)
+        except Exception as e:
+            saved = 0
+            logger.warning("스케줄러 상태 DB 저장 실패: %s", e)
+        if saved < len(dirty):
+            with self._lock:
+                self._dirty.update(dirty)   # 다음 실행(warm)에서 재시도
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("스케줄러 상태 로드 실패 — 새로 시작: %s", e)
+            return
+        with self._lock:
+            self._job_seconds = float(payload.get("job_seconds", SCHEDULER_DEFAULT_JOB_SECONDS))
+            self._symbols = payload.get("symbols", {})
+        logger.info("스케줄러 상태 로드: %d종목", len(self._symbols))
+
+
+_scheduler: NewsScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> NewsScheduler:
+    """스케줄러 싱글턴 — warm start 메모리 + 캐시 디렉터리 파일 (+ SCHEDULER_STATE_STORE=supabase면 DB)에 유지."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            store = DBService() if SCHEDULER_STATE_STORE == "supabase" else None
+            _scheduler = NewsScheduler(os.path.join(resolve_cache_dir(), "scheduler_state.json"), store)
+            _scheduler.load()
+        return _scheduler
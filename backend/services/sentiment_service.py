@@ -0,0 +1,124 @@
+import re
+import math
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+try:
+    from backend.config.cache import SENTIMENT_CACHE_MAX_ENTRIES
+    from backend.config.sentiment import KO_SENTIMENT_LEXICON, KO_NEGATION_SUFFIXES
+except ModuleNotFoundError:
+    from config.cache import SENTIMENT_CACHE_MAX_ENTRIES
+    from config.sentiment import KO_SENTIMENT_LEXICON, KO_NEGATION_SUFFIXES
+
+logger = logging.getLogger(__name__)
+
+_hangul_re = re.compile(r"[가-힣]")
+
+# VADER 분석기 — 첫 영문 제목 채점 시 생성(사전 로드), Lambda warm start 시 재사용
+_vader = None
+_vader_lock = threading.Lock()
+
+
+class KoreanLexiconScorer:
+    """
+    사전 기반 한국어 제목 감성 점수기.
+    매칭된 어휘 점수를 합산한 뒤 VADER compound와 같은 방식(x / sqrt(x² + 15))으로 -1.0~+1.0 정규화합니다.
+    """
+
+    def __init__(self, lexicon: dict[str, float] = KO_SENTIMENT_LEXICON,
+                 negations: tuple[str, ...] = KO_NEGATION_SUFFIXES, window: int = 6):
+        # 긴 어휘 우선 매칭 — "흑자전환"이 "전환" 류 짧은 어휘에 가려지지 않도록
+        self._terms = sorted(lexicon.items(), key=lambda kv: -len(kv[0]))
+        self._negations = negations
+        self._window = window
+
+    def __call__(self, title: str) -> float:
+        total = 0.0
+        consumed = [False] * len(title)
+        for term, weight in self._terms:
+            start = title.find(term)
+            while start != -1:
+                end = start + len(term)
+                if not any(consumed[start:end]):
+                    consumed[start:end] = [True] * len(term)
+                    tail = title[end:end + self._window]
+                    total += -weight if any(n in tail for n in self._negations) else weight
+                start = title.find(term, end)
+        return total / math.sqrt(total * total + 15) if total else 0.0
+
+
+def _get_vader():
+    global _vader
+    with _vader_lock:
+        if _vader is None:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            _vader = SentimentIntensityAnalyzer()
+        return _vader
+
+
+def _vader_score(title: str) -> float:
+    return _get_vader().polarity_scores(title)["compound"]
+
+
+# 제목 언어별 점수기 — set_korean_scorer()로 교체 가능 (예: 형태소 기반 모델)
+_korean_scorer: Callable[[str], float] = KoreanLexiconScorer()
+
+_cache: OrderedDict[str, float] = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def set_korean_scorer(scorer: Callable[[str], float]) -> None:
+    """한글 제목 점수기 교체 (title → -1.0~+1.0). 기존 메모이즈 결과는 비웁니다."""
+    global _korean_scorer
+    with _cache_lock:
+        _korean_scorer = scorer
+        _cache.clear()
+
+
+def score_title(title: str) -> float:
+    """단일 제목 감성 점수 (메모이즈 없음). 한글 포함 시 사전 점수기, 아니면 VADER."""
+    if _hangul_re.search(title):
+        return _korean_scorer(title)
+    return _vader_score(title)
+
+
+def _title_key(title: str) -> str:
+    return hashlib.blake2b(title.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def score_titles(titles: list[str]) -> list[float]:
+    """
+    제목 목록의 감성 점수(-1.0~+1.0, 소수 3자리)를 입력 순서대로 반환.
+    - 제목 해시 기준 LRU 메모이즈 (SENTIMENT_CACHE_MAX_ENTRIES) — 매 실행·폴백 프로바이더마다 반복되는 헤드라인 재계산 방지
+    - 배치 내 중복 제목은 한 번만 계산
+    """
+    keys = [_title_key(t or "") for t in titles]
+    scores: dict[str, float] = {}
+    with _cache_lock:
+        for key in keys:
+            if key in _cache:
+                _cache.move_to_end(key)
+                scores[key] = _cache[key]
+                _stats["hits"] += 1
+
+    pending = {key: t or "" for key, t in zip(keys, titles) if key not in scores}
+    computed = {key: round(score_title(t), 3) for key, t in pending.items()}
+
+    if computed:
+        with _cache_lock:
+            _stats["misses"] += len(computed)
+            for key, value in computed.items():
+                _cache[key] = value
+            while len(_cache) > SENTIMENT_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+        scores.update(computed)
+    return [scores[key] for key in keys]
+
+
+def get_sentiment_stats() -> dict:
+    with _cache_lock:
+        return {**_stats, "size": len(_cache)}
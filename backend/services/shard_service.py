@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import bisect
+import hashlib
+import logging
+import shutil
+import threading
+import multiprocessing
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from backend.config.cache import resolve_cache_dir
+    from backend.config.limits import SHARD_VNODES, SHARD_RESULT_STORE, SHARD_WORKER_TIMEOUT_SECONDS
+    from backend.services.db_service import DBService
+except ModuleNotFoundError:
+    from config.cache import resolve_cache_dir
+    from config.limits import SHARD_VNODES, SHARD_RESULT_STORE, SHARD_WORKER_TIMEOUT_SECONDS
+    from services.db_service import DBService
+
+logger = logging.getLogger(__name__)
+
+# 로컬 워커 프로세스 풀 — 실행 간 재사용 (warm Lambda 컨테이너처럼 import·캐시 로드 비용을 첫 실행에만 지불)
+_pool: ProcessPoolExecutor | None = None
+_pool_key: tuple | None = None
+_pool_lock = threading.Lock()
+
+
+# =============================================================================
+# 1. Consistent-hash 링 — 심볼 → 샤드
+# =============================================================================
+def _hash64(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    샤드마다 vnodes개 가상 노드를 링에 배치하고, 키는 시계 방향으로 가장 가까운 노드의 샤드에 배정합니다.
+    샤드 수를 N → N+1로 바꾸면 약 1/(N+1)의 심볼만 이동 — 나머지 심볼의 샤드 배정(로그·타이밍 비교 기준)은 유지됩니다.
+    """
+
+    def __init__(self, shard_count: int, vnodes: int = SHARD_VNODES):
+        if shard_count < 1:
+            raise ValueError(f"shard_count는 1 이상이어야 합니다: {shard_count}")
+        self.shard_count = shard_count
+        points = sorted(
+            (_hash64(f"shard-{shard}#{replica}"), shard)
+            for shard in range(shard_count) for replica in range(vnodes)
+        )
+        self._keys = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_of(self, key: str) -> int:
+        idx = bisect.bisect(self._keys, _hash64(key)) % len(self._keys)
+        return self._shards[idx]
+
+
+def plan_shards(run_id: str, stock_jobs: list[dict], trend_symbols: list[str],
+                shard_count: int, store: dict) -> list[dict]:
+    """
+    종목 뉴스 작업·추세 심볼을 심볼 기준으로 샤드에 나눈 워커 작업 목록.
+    뉴스 작업은 전체 목록 내 인덱스("index")를 보존 — 병합 단계에서 단일 실행과 같은 순서로 재조립합니다.
+    """
+    ring = HashRing(shard_count)
+    tasks: dict[int, dict] = {}
+
+    def task_for(shard_id: int) -> dict:
+        return tasks.setdefault(shard_id, {
+            "run_id": run_id, "shard_id": shard_id, "shard_count": shard_count,
+            "store": store, "jobs": [], "symbols": [],
+        })
+
+    for index, job in enumerate(stock_jobs):
+        task_for(ring.shard_of(job["feed_symbol"]))["jobs"].append({**job, "index": index})
+    for symbol in dict.fromkeys(trend_symbols):
+        task_for(ring.shard_of(symbol))["symbols"].append(symbol)
+    for task in tasks.values():
+        # 동시 호출 참여자 수 — 워커 + 같은 구간에 매크로 뉴스를 수집하는 코디네이터 (rate limit 배율 계산용)
+        task["workers"] = len(tasks) + 1
+    return [tasks[shard_id] for shard_id in sorted(tasks)]
+
+
+# =============================================================================
+# 2. 부분 결과 저장소 — 워커 저장 / 코디네이터 병합 후 삭제
+# =============================================================================
+def store_config(run_id: str, kind: str = SHARD_RESULT_STORE) -> dict:
+    """워커 작업에 실어 보낼 저장소 설정 (워커는 환경 변수와 무관하게 코디네이터와 같은 위치를 사용)."""
+    if kind == "supabase":
+        return {"kind": "supabase"}
+    return {"kind": "local", "dir": os.path.join(resolve_cache_dir(), "shards", run_id)}
+
+
+def put_result(store: dict, run_id: str, shard_id: int, payload: dict) -> None:
+    if store["kind"] == "supabase":
+        DBService().put_shard_result(run_id, shard_id, payload)
+        return
+    os.makedirs(store["dir"], exist_ok=True)
+    path = os.path.join(store["dir"], f"shard-{shard_id}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)  # 원자적 교체 — 병합 단계가 쓰는 중인 파일을 읽지 않음
+
+
+def load_results(store: dict, run_id: str) -> dict[int, dict]:
+    """저장된 샤드 결과 전체 → {shard_id: payload}. 읽기 실패한 샤드는 경고 후 제외."""
+    if store["kind"] == "supabase":
+        try:
+            return DBService().get_shard_results(run_id)
+        except Exception as e:
+            logger.warning("샤드 결과 조회 실패 (%s): %s", run_id, e)
+            return {}
+    results: dict[int, dict] = {}
+    if not os.path.isdir(store["dir"]):
+        return results
+    for name in sorted(os.listdir(store["dir"])):
+        if not (name.startswith("shard-") and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(store["dir"], name), encoding="utf-8") as f:
+                results[int(name[len("shard-"):-len(".json")])] = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("샤드 결과 읽기 실패 (%s): %s", name, e)
+            continue
+    return results
+
+
+def clear_results(store: dict, run_id: str) -> None:
+    try:
+        if store["kind"] == "supabase":
+            DBService().delete_shard_results(run_id)
+        else:
+            shutil.rmtree(store["dir"], ignore_errors=True)
+    except Exception as e:
+        logger.warning("샤드 결과 정리 실패 (%s): %s", run_id, e)
+
+
+# =============================================================================
+# 3. 워커 분배 — 로컬 프로세스 풀 / Lambda 동기 호출
+# =============================================================================
+def _invoke_lambda(task: dict) -> dict:
+    """같은 Lambda 함수를 워커 모드로 동기 호출 (boto3는 Lambda 런타임 내장 — 이 경로에서만 import)."""
+    import boto3
+    from botocore.config import Config
+
+    client = boto3.client("lambda", config=Config(
+        read_timeout=SHARD_WORKER_TIMEOUT_SECONDS, retries={"max_attempts": 0},
+    ))
+    resp = client.invoke(
+        FunctionName=os.environ["AWS_LAMBDA_FUNCTION_NAME"],
+        InvocationType="RequestResponse",
+        Payload=json.dumps({"engine": "shard_worker", "task": task}).encode("utf-8"),
+    )
+    body = json.loads(resp["Payload"].read() or b"{}")
+    if resp.get("FunctionError"):
+        raise RuntimeError(f"워커 Lambda 오류: {body.get('errorMessage', body)}")
+    return body.get("body", body)
+
+
+def _process_pool(workers: int, initializer, initargs: tuple) -> ProcessPoolExecutor:
+    global _pool, _pool_key
+    key = (workers, initializer, initargs)
+    with _pool_lock:
+        if _pool is None or _pool_key != key:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # spawn: 워커마다 새 인터프리터 — 별도 Lambda 호출처럼 모듈 상태를 공유하지 않고,
+            # 코디네이터 스레드(매크로 뉴스 수집)가 잡은 락을 fork로 복제하는 문제도 없음
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=initializer, initargs=initargs,
+            )
+            _pool_key = key
+        return _pool
+
+
+def _discard_process_pool() -> None:
+    """시간 초과·프로세스 비정상 종료 후 풀 폐기 — 남은 워커를 기다리지 않고 다음 실행은 새 풀로 시작."""
+    global _pool, _pool_key
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _pool_key = None, None
+
+
+def dispatch_shards(worker, tasks: list[dict], mode: str,
+                    initializer=None, initargs: tuple = ()) -> dict[int, dict]:
+    """
+    샤드 작업을 동시에 실행하고 샤드별 {ok, seconds, result | error}를 반환합니다.
+    한 샤드 실패는 다른 샤드에 영향 없음 — 코디네이터는 저장된 결과만으로 병합합니다.
+
+    worker      : task → 요약 dict (process 모드는 pickle 가능한 모듈 최상위 함수)
+    initializer : process 모드에서 워커 프로세스 시작 시 1회 호출 (벤치마크 스텁 설치 등)
+    """
+    if not tasks:
+        return {}
+    if mode == "lambda" and any(task["store"]["kind"] == "local" for task in tasks):
+        # Lambda 워커의 /tmp 결과는 코디네이터가 읽을 수 없음 — 빈 샤드로 조용히 병합되지 않도록 분배 전 거부
+        raise ValueError("SHARD_DISPATCH=lambda에는 SHARD_RESULT_STORE=supabase가 필요합니다 (local 저장소 사용 불가)")
+    statuses: dict[int, dict] = {}
+    if mode == "process":
+        executor = _process_pool(len(tasks), initializer, initargs)
+        submit = lambda task: executor.submit(worker, task)
+    elif mode == "lambda":
+        executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="shard-invoke")
+        submit = lambda task: executor.submit(_invoke_lambda, task)
+    else:
+        raise ValueError(f"알 수 없는 SHARD_DISPATCH: {mode}")
+
+    started = time.perf_counter()
+    deadline = started + SHARD_WORKER_TIMEOUT_SECONDS
+    healthy = True
+    try:
+        futures = {task["shard_id"]: submit(task) for task in tasks}
+        for shard_id, future in futures.items():
+            try:
+                result = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+                statuses[shard_id] = {"ok": True, "result": result}
+            except Exception as e:
+                logger.warning("샤드 %d 실패: %s", shard_id, e)
+                statuses[shard_id] = {"ok": False, "error": str(e) or type(e).__name__}
+                healthy = healthy and not isinstance(e, (TimeoutError, BrokenExecutor))
+            # 분배 시작 기준 완료 시각 — 가장 늦은 샤드가 Step B 병렬 구간의 길이
+            statuses[shard_id]["seconds"] = round(time.perf_counter() - started, 3)
+    finally:
+        # 시간 초과 샤드를 기다리지 않음 — 늦게 끝난 결과는 병합 후 clear_results()로 정리
+        if mode == "lambda":
+            executor.shutdown(wait=False, cancel_futures=True)
+        elif not healthy:
+            _discard_process_pool()
+    return statuses
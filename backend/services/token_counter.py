@@ -0,0 +1,70 @@
+import os
+import hashlib
+import logging
+import threading
+
+try:
+    from backend.config.models import (
+        TOKENIZER_ENCODING, TOKENIZER_BPE_URL, TOKENIZER_CACHE_DIR, TOKENIZER_FALLBACK_BYTES_PER_TOKEN,
+    )
+except ModuleNotFoundError:
+    from config.models import (
+        TOKENIZER_ENCODING, TOKENIZER_BPE_URL, TOKENIZER_CACHE_DIR, TOKENIZER_FALLBACK_BYTES_PER_TOKEN,
+    )
+
+logger = logging.getLogger(__name__)
+
+# tiktoken 인코더 — 첫 토큰 계산 시 로드 (import·BPE 파일 로드를 cold start 초기화에서 제외)
+# BPE 파일은 배포 패키지에 포함된 TOKENIZER_CACHE_DIR에서만 읽습니다 (런타임 다운로드 없음).
+# 파일이 없거나 로드에 실패하면 UTF-8 바이트 길이 추정으로 계산 — 경고는 프로세스당 1회.
+_encoder = None
+_encoder_failed = False
+_encoder_lock = threading.Lock()
+
+
+def _bpe_path() -> str:
+    # tiktoken 캐시 파일명 규칙: sha1(BPE URL)
+    return os.path.join(TOKENIZER_CACHE_DIR, hashlib.sha1(TOKENIZER_BPE_URL.encode()).hexdigest())
+
+
+def _get_encoder():
+    global _encoder, _encoder_failed
+    with _encoder_lock:
+        if _encoder is None and not _encoder_failed:
+            try:
+                if not os.path.exists(_bpe_path()):
+                    raise FileNotFoundError(f"BPE 파일 없음: {_bpe_path()}")
+                os.environ.setdefault("TIKTOKEN_CACHE_DIR", TOKENIZER_CACHE_DIR)
+                import tiktoken
+                _encoder = tiktoken.get_encoding(TOKENIZER_ENCODING)
+            except Exception as e:
+                _encoder_failed = True
+                logger.warning(
+                    "tiktoken 인코더(%s) 미사용 — 바이트 추정(%d바이트/토큰)으로 계산: %s. "
+                    "한글은 실제와 거의 같고 영문은 약 1.3배 크게 계산되어 배치·컨텍스트 예산이 그만큼 덜 채워집니다",
+                    TOKENIZER_ENCODING, TOKENIZER_FALLBACK_BYTES_PER_TOKEN, e,
+                )
+        return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """text의 토큰 수 (tiktoken 미사용 시 추정치)."""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is None:
+        return -(-len(text.encode("utf-8")) // TOKENIZER_FALLBACK_BYTES_PER_TOKEN)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """text를 앞에서부터 budget 토큰 이내로 자름 (예산 이내면 그대로)."""
+    if budget <= 0:
+        return ""
+    encoder = _get_encoder()
+    if encoder is None:
+        limit = budget * TOKENIZER_FALLBACK_BYTES_PER_TOKEN
+        encoded = text.encode("utf-8")
+        return text if len(encoded) <= limit else encoded[:limit].decode("utf-8", errors="ignore")
+    tokens = encoder.encode(text, disallowed_special=())
+    return text if len(tokens) <= budget else encoder.decode(tokens[:budget])
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import logging
+import threading
+import cProfile
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    from backend.config.cache import resolve_cache_dir
+except ModuleNotFoundError:
+    from config.cache import resolve_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# SYNC_PROFILE=1 이면 실행 전체를 cProfile로 감싸 캐시 디렉터리에 .pstats 덤프
+PROFILE_ENABLED = os.getenv("SYNC_PROFILE") == "1"
+
+_spans: list[dict] = []
+_spans_lock = threading.Lock()
+_local = threading.local()   # 스레드별 진행 중 span 스택 — annotate()가 가장 안쪽 span에 기록
+_run_started = time.monotonic()
+_run_started_at = datetime.now()
+
+
+def start_run() -> None:
+    """실행 단위 초기화 (warm Lambda 재사용 시 이전 실행 span 제거)."""
+    global _run_started, _run_started_at
+    with _spans_lock:
+        _spans.clear()
+    _run_started = time.monotonic()
+    _run_started_at = datetime.now()
+
+
+def _stack() -> list[dict]:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def span(name: str, kind: str = "step", **attrs):
+    """
+    구간 측정. kind: "step"(엔진 단계) | "provider"(뉴스 프로바이더 호출) | "model"(AI 모델 시도)
+    yield된 dict에 속성을 추가할 수 있으며, 같은 스레드의 하위 호출은 annotate()로 기록합니다.
+    """
+    record = {"name": name, "kind": kind, **attrs}
+    stack = _stack()
+    stack.append(record)
+    started = time.monotonic()
+    try:
+        yield record
+    except Exception as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        record["start"] = round(started - _run_started, 3)
+        record["duration"] = round(time.monotonic() - started, 3)
+        # asyncio 태스크가 같은 스레드에서 교차 실행될 수 있으므로 pop()이 아닌 identity 제거
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i] is record:
+                del stack[i]
+                break
+        with _spans_lock:
+            _spans.append(record)
+
+
+def annotate(key: str, value) -> None:
+    """현재 스레드의 가장 안쪽 span에 속성 기록. 숫자는 누적 (bytes, retries 등). span 밖이면 무시."""
+    stack = _stack()
+    if not stack:
+        return
+    record = stack[-1]
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and isinstance(record.get(key), (int, float)):
+        record[key] += value
+    else:
+        record[key] = value
+
+
+def _aggregate(spans: list[dict]) -> dict:
+    groups: dict[str, dict] = {}
+    for s in spans:
+        g = groups.setdefault(s["name"], {"calls": 0, "total_s": 0.0, "max_s": 0.0, "errors": 0,
+                                          "bytes": 0, "retries": 0, "cache": {}})
+        g["calls"] += 1
+        g["total_s"] = round(g["total_s"] + s["duration"], 3)
+        g["max_s"] = max(g["max_s"], s["duration"])
+        g["errors"] += 1 if s.get("error") else 0
+        g["bytes"] += s.get("bytes", 0)
+        g["retries"] += s.get("retries", 0)
+        if "cache" in s:
+            g["cache"][s["cache"]] = g["cache"].get(s["cache"], 0) + 1
+        if "outcome" in s:
+            g.setdefault("outcomes", {})
+            g["outcomes"][s["outcome"]] = g["outcomes"].get(s["outcome"], 0) + 1
+    return groups
+
+
+def build_report() -> dict:
+    """실행 전체 타이밍 리포트 (span 원본 포함)."""
+    with _spans_lock:
+        spans = sorted(_spans, key=lambda s: s["start"])
+    return {
+        "started_at": _run_started_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_seconds": round(time.monotonic() - _run_started, 3),
+        "steps": {s["name"]: s["duration"] for s in spans if s["kind"] == "step"},
+        "providers": _aggregate([s for s in spans if s["kind"] == "provider"]),
+        "models": _aggregate([s for s in spans if s["kind"] == "model"]),
+        "spans": spans,
+    }
+
+
+def summarize(report: dict) -> dict:
+    """피드와 함께 저장할 요약 (span 원본 제외) — 실행 간 회귀 추적용."""
+    return {key: report[key] for key in ("started_at", "total_seconds", "steps", "providers", "models")}
+
+
+def write_report(report: dict) -> str | None:
+    """JSON 리포트를 캐시 디렉터리 traces/에 저장 (최신본 last_run.json 갱신)."""
+    trace_dir = os.path.join(resolve_cache_dir(), "traces")
+    try:
+        os.makedirs(trace_dir, exist_ok=True)
+        path = os.path.join(trace_dir, "last_run.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1, default=str)
+        return path
+    except OSError as e:
+        logger.warning("타이밍 리포트 저장 실패: %s", e)
+        return None
+
+
+@contextmanager
+def maybe_profile(enabled: bool = PROFILE_ENABLED):
+    """enabled면 cProfile로 블록 전체를 측정해 traces/profile-<시각>.pstats로 덤프."""
+    if not enabled:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        trace_dir = os.path.join(resolve_cache_dir(), "traces")
+        try:
+            os.makedirs(trace_dir, exist_ok=True)
+            path = os.path.join(trace_dir, f"profile-{datetime.now():%Y%m%d-%H%M%S}.pstats")
+            profiler.dump_stats(path)
+            logger.info("cProfile 덤프 저장: %s (python -m pstats로 확인)", path)
+        except OSError as e:
+            logger.warning("cProfile 덤프 저장 실패: %s", e)
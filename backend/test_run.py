@@ -70,7 +70,40 @@ def test_news_and_ai():
     else:
         print("[FAIL] 뉴스 수집 실패. API 키나 네트워크를 확인하세요.")
 
+def test_sentiment_throughput(n_titles: int = 300, rounds: int = 5):
+    """감성 점수 처리량 비교: 기존 제목별 VADER 호출 vs 배치·메모이즈 경로 (오프라인)"""
+    import time
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    from services.sentiment_service import score_titles
+
+    base = [
+        "NVIDIA shares surge after record data center revenue",
+        "Tesla stock falls as deliveries miss estimates",
+        "삼성전자, HBM 공급 확대 기대감에 신고가",
+        "코스닥 외국인 순매도에 하락 마감",
+    ]
+    # 실제 실행처럼 제목 일부가 매 실행·폴백마다 반복되도록 구성
+    titles = [f"{base[i % len(base)]} ({i % (n_titles // 3)})" for i in range(n_titles)]
+
+    vader = SentimentIntensityAnalyzer()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        [vader.polarity_scores(t)["compound"] for t in titles]
+    per_title = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        score_titles(titles)
+    batched = time.perf_counter() - start
+
+    total = n_titles * rounds
+    print(f"[BENCH] 제목별 VADER: {total / per_title:,.0f} titles/s")
+    print(f"[BENCH] 배치+메모이즈: {total / batched:,.0f} titles/s ({per_title / batched:.1f}x)")
+    print(f"  한글 예시: {titles[2]} → {score_titles([titles[2]])[0]:+.3f}")
+
 if __name__ == "__main__":
+    test_sentiment_throughput()
+    print()
     test_market()
     print()
     test_news_and_ai()
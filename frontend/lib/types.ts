@@ -46,6 +46,8 @@ export interface AISummaryStructured {
   key_event?: string;
   expected_impact?: string;
   reference_indicators?: string[];
+  // 포트폴리오·관심종목: 카테고리 요약을 조립한 종목별 요약 (심볼 → 요약)
+  symbols?: Record<string, AISummaryStructured & { name: string }>;
 }
 
 export interface FeedData {